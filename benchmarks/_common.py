@@ -0,0 +1,32 @@
+"""Shared helpers for the benchmark scripts.
+
+Each benchmark is a standalone script, run from the repository root eg::
+
+    python benchmarks/bench_resource_init.py
+
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, SRC.as_posix())
+
+
+def best_of(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Best time (in seconds) for a single call of func."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, results: dict[str, float], baseline: str | None = None):
+    """Print a table of timings with the speed up relative to a baseline."""
+    baseline = baseline or next(iter(results))
+    base_time = results[baseline]
+
+    print(title)
+    print("-" * len(title))
+    for name, value in results.items():
+        print(f"  {name:<36} {value * 1e6:10.3f} us  {base_time / value:6.2f}x")
+    print()
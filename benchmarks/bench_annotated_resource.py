@@ -0,0 +1,73 @@
+"""Define many annotated resources that reuse the same annotation shapes."""
+
+import datetime
+import itertools
+import timeit
+
+from _common import report
+
+import odin
+from odin.annotated_resource import type_resolution
+
+_counter = itertools.count()
+
+ANNOTATIONS = {
+    "name": str,
+    "tags": list[str],
+    "counts": dict[str, int],
+    "created": datetime.datetime | None,
+    "ratio": float | None,
+    "ids": list[int | None],
+    "flags": dict[str, list[bool]],
+    "enabled": bool,
+}
+
+
+def define_resources(count: int):
+    namespace = f"bench.annotated{next(_counter)}"
+    for idx in range(count):
+        odin.AnnotatedResourceType(
+            f"Resource{idx}",
+            (odin.AnnotatedResource,),
+            {
+                "__module__": __name__,
+                "__annotations__": ANNOTATIONS,
+                "Meta": type("Meta", (), {"namespace": namespace}),
+            },
+        )
+
+
+def process_annotations(count: int):
+    for _ in range(count):
+        for tp in ANNOTATIONS.values():
+            type_resolution.process_attribute(tp)
+
+
+def uncached(func):
+    def wrapper(*args):
+        type_resolution.field_factory.cache_clear()
+        original = type_resolution.field_factory
+        type_resolution.field_factory = original.__wrapped__
+        try:
+            return func(*args)
+        finally:
+            type_resolution.field_factory = original
+
+    return wrapper
+
+
+def main():
+    count = 1000
+    for title, func in (
+        (f"Resolve {len(ANNOTATIONS)} annotations x {count}", process_annotations),
+        (f"Define {count} annotated resources", define_resources),
+    ):
+        results = {}
+        for label, target in (("uncached", uncached(func)), ("cached", func)):
+            time = min(timeit.repeat(lambda t=target: t(count), number=1, repeat=3))
+            results[f"{label} (per resource)"] = time / count
+        report(title, results)
+
+
+if __name__ == "__main__":
+    main()
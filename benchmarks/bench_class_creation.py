@@ -0,0 +1,65 @@
+"""Create many resource classes, each level of a deep hierarchy adds fields.
+
+Field names are unique to each class so generated code is not shared.
+"""
+
+import itertools
+import timeit
+
+from _common import report
+
+import odin
+
+_counter = itertools.count()
+
+
+def create_classes(
+    count: int, depth: int, fields_per_level: int = 5, instantiate: bool = False
+):
+    """Create count classes in chains of depth resources."""
+    namespace = f"bench.class_creation{next(_counter)}"
+    field_types = (
+        odin.StringField,
+        odin.IntegerField,
+        odin.DateTimeField,
+        odin.BooleanField,
+        odin.FloatField,
+    )
+    created = 0
+    while created < count:
+        base = odin.Resource
+        for _level in range(depth):
+            attrs = {
+                f"field_{created}_{idx}": field_types[idx % len(field_types)](null=True)
+                for idx in range(fields_per_level)
+            }
+            attrs["__module__"] = __name__
+            attrs["Meta"] = type(
+                "Meta", (), {"namespace": namespace, "name": f"Resource{created}"}
+            )
+            base = type(base)(f"Resource{created}", (base,), attrs)
+            if instantiate:
+                base()
+            created += 1
+
+
+def main():
+    count = 1500
+    for depth in (1, 5, 10):
+        results = {}
+        for label, instantiate in (("create", False), ("create and instantiate", True)):
+            time = min(
+                timeit.repeat(
+                    lambda d=depth, i=instantiate: create_classes(
+                        count, d, instantiate=i
+                    ),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            results[f"{label} (per class)"] = time / count
+        report(f"Create {count} resources (inheritance depth {depth})", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare ResourceBase.clone against copy.deepcopy for a resource tree."""
+
+import copy
+import datetime
+
+from _common import best_of, report
+
+import odin
+
+
+class Author(odin.Resource):
+    class Meta:
+        namespace = "bench.clone"
+
+    name = odin.StringField()
+    born = odin.DateField(null=True)
+
+
+class Publisher(odin.Resource):
+    class Meta:
+        namespace = "bench.clone"
+
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.clone"
+
+    title = odin.StringField()
+    isbn = odin.StringField()
+    num_pages = odin.IntegerField()
+    published = odin.DateTimeField()
+    tags = odin.TypedListField(odin.StringField())
+    authors = odin.ListOf(Author)
+    publisher = odin.DictAs(Publisher)
+
+
+class Library(odin.Resource):
+    class Meta:
+        namespace = "bench.clone"
+
+    name = odin.StringField()
+    books = odin.ListOf(Book)
+
+
+def build_library(book_count: int) -> Library:
+    return Library(
+        name="Public Library",
+        books=[
+            Book(
+                title=f"Book {idx}",
+                isbn=f"0-333-{idx:05}-8",
+                num_pages=idx,
+                published=datetime.datetime(1987, 1, 1),
+                tags=["sci-fi", "culture"],
+                authors=[Author(name="Iain M. Banks", born=datetime.date(1954, 2, 16))],
+                publisher=Publisher(name="Macmillan"),
+            )
+            for idx in range(book_count)
+        ],
+    )
+
+
+def main():
+    for book_count in (10, 100):
+        library = build_library(book_count)
+        report(
+            f"Clone library of {book_count} books",
+            {
+                "copy.deepcopy": best_of(
+                    lambda library=library: copy.deepcopy(library), 200
+                ),
+                "clone": best_of(library.clone, 200),
+                "clone (shallow)": best_of(
+                    lambda library=library: library.clone(deep=False), 200
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
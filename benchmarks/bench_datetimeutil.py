@@ -0,0 +1,164 @@
+"""Compare the fromisoformat based date time parsing with the regular expression path."""
+
+import datetime
+import time
+from email.utils import parsedate_tz
+
+from _common import best_of, report
+
+from odin import datetimeutil
+from odin.datetimeutil import (
+    HTTP_DAY_OF_WEEK,
+    HTTP_MONTH,
+    ISO8601_DATETIME_STRING_RE,
+    FixedTimezone,
+    utc,
+)
+
+
+def regex_timezone(groups, default_timezone):
+    """The previous ``FixedTimezone.from_groups`` (a new timezone per value)."""
+    tz = groups["timezone"]
+    if tz is None:
+        return default_timezone
+    if tz in ("Z", "GMT", "UTC"):
+        return utc
+    sign = groups["tz_sign"]
+    hours = int(groups["tz_hour"])
+    minutes = int(groups["tz_minute"] or 0)
+    name = f"{sign}{hours:02d}:{minutes:02d}"
+    if sign == "-":
+        hours = -hours
+        minutes = -minutes
+    return FixedTimezone(datetime.timedelta(hours=hours, minutes=minutes), name)
+
+
+def regex_parse_iso_datetime_string(value, default_timezone=utc):
+    """The regular expression implementation of ``parse_iso_datetime_string``."""
+    matches = ISO8601_DATETIME_STRING_RE.match(value)
+    if not matches:
+        raise ValueError("Expected ISO 8601 formatted datetime string.")
+    groups = matches.groupdict()
+    return datetime.datetime(
+        int(groups["year"]),
+        int(groups["month"]),
+        int(groups["day"]),
+        int(groups["hour"]),
+        int(groups["minute"]),
+        int(groups["second"]),
+        int(groups["microseconds"] or 0),
+        regex_timezone(groups, default_timezone),
+    )
+
+
+def mktime_to_http_datetime_string(dt):
+    """The ``time.mktime`` implementation of ``to_http_datetime_string``."""
+    dt = datetimeutil.get_tz_aware_dt(dt).astimezone(utc)
+    now = time.localtime(time.mktime(dt.timetuple()))
+    return (
+        f"{HTTP_DAY_OF_WEEK[now[6]]}, {now[2]:02d} {HTTP_MONTH[now[1] - 1]} {now[0]:04d} "
+        f"{now[3]:02d}:{now[4]:02d}:{now[5]:02d} GMT"
+    )
+
+
+def email_parse_http_datetime_string(value):
+    """The ``email.utils`` implementation of ``parse_http_datetime_string``."""
+    elements = parsedate_tz(value)
+    return datetime.datetime(
+        *elements[:6], tzinfo=FixedTimezone.from_seconds(elements[-1])
+    )
+
+
+def parse_all(parse, values):
+    return [parse(value) for value in values]
+
+
+def sample_values(count):
+    zones = ["Z", "+10:00", "-09:30", "+0530", ""]
+    values = []
+    for i in range(count):
+        dt = datetime.datetime(2000, 1, 1) + datetime.timedelta(
+            seconds=i * 7_919_993 % 10**9, microseconds=i * 104_729 % 10**6
+        )
+        values.append(f"{dt.isoformat(timespec='microseconds')}{zones[i % len(zones)]}")
+    return values
+
+
+def check_identical(expected, actual):
+    if expected != actual:
+        msg = "Outputs differ"
+        raise RuntimeError(msg)
+
+
+def main():
+    count = 1_000
+    values = sample_values(count)
+
+    expected = parse_all(regex_parse_iso_datetime_string, values)
+    actual = parse_all(datetimeutil.parse_iso_datetime_string, values)
+    check_identical(
+        [(v, str(v.tzinfo)) for v in expected], [(v, str(v.tzinfo)) for v in actual]
+    )
+
+    repeated = values[:10] * (count // 10)
+    results = {
+        "regex": best_of(
+            lambda: parse_all(regex_parse_iso_datetime_string, values), 20
+        ),
+        "fromisoformat": best_of(
+            lambda: parse_all(datetimeutil.parse_iso_datetime_string, values), 20
+        ),
+        "regex (repeated)": best_of(
+            lambda: parse_all(regex_parse_iso_datetime_string, repeated), 20
+        ),
+        "fromisoformat (repeated)": best_of(
+            lambda: parse_all(datetimeutil.parse_iso_datetime_string, repeated), 20
+        ),
+    }
+    datetimeutil.set_datetime_cache_size(1024)
+    results["fromisoformat + LRU (repeated)"] = best_of(
+        lambda: parse_all(datetimeutil.parse_iso_datetime_string, repeated), 20
+    )
+    datetimeutil.set_datetime_cache_size(0)
+    report(f"parse_iso_datetime_string ({count} values)", results)
+
+    datetimes = [
+        datetime.datetime(2020, 1, 1, tzinfo=utc) + datetime.timedelta(seconds=i // 10)
+        for i in range(count)
+    ]
+    expected = parse_all(mktime_to_http_datetime_string, datetimes)
+    actual = parse_all(datetimeutil.to_http_datetime_string, datetimes)
+    check_identical(expected, actual)
+    report(
+        f"to_http_datetime_string ({count} values)",
+        {
+            "mktime": best_of(
+                lambda: parse_all(mktime_to_http_datetime_string, datetimes), 20
+            ),
+            "cached formatter": best_of(
+                lambda: parse_all(datetimeutil.to_http_datetime_string, datetimes), 20
+            ),
+        },
+    )
+
+    http_values = actual
+    check_identical(
+        parse_all(email_parse_http_datetime_string, http_values),
+        parse_all(datetimeutil.parse_http_datetime_string, http_values),
+    )
+    report(
+        f"parse_http_datetime_string ({count} values)",
+        {
+            "email.utils": best_of(
+                lambda: parse_all(email_parse_http_datetime_string, http_values), 20
+            ),
+            "IMF-fixdate": best_of(
+                lambda: parse_all(datetimeutil.parse_http_datetime_string, http_values),
+                20,
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
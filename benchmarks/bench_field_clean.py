@@ -0,0 +1,68 @@
+"""Compare Field.clean with the compiled validation chain against the generic stages."""
+
+from _common import best_of, report
+
+import odin
+from odin import exceptions, registration
+from odin.fields import NotProvided
+
+
+def generic_clean(field, value):
+    """The generic (pre compiled chain) implementation of ``Field.clean``."""
+    if value is NotProvided:
+        value = field.get_default() if field.use_default_if_not_provided else None
+    value = field.to_python(value)
+
+    # Field.validate
+    if (
+        field.choice_values
+        and (value not in field.empty_values)
+        and (value not in field.choice_values)
+    ):
+        msg = field.error_messages["invalid_choice"] % value
+        raise exceptions.ValidationError(msg)
+    if not field.null and value is None:
+        raise exceptions.ValidationError(field.error_messages["null"])
+
+    # Field.run_validators
+    if value in field.empty_values:
+        return value
+    errors = []
+    for v in field.validators:
+        try:
+            v(value)
+        except registration.get_validation_error_list() as e:
+            handler = registration.get_validation_error_handler(e)
+            handler(e, field, errors)
+    if errors:
+        raise exceptions.ValidationError(errors)
+    return value
+
+
+CASES = {
+    "IntegerField(min/max)": (odin.IntegerField(min_value=0, max_value=100), 42),
+    "IntegerField(null=True)": (odin.IntegerField(null=True), 42),
+    "IntegerField(choices)": (
+        odin.IntegerField(choices=[(i, str(i)) for i in range(20)]),
+        19,
+    ),
+    "FloatField(null=True, None)": (odin.FloatField(null=True), None),
+    "DictField": (odin.DictField(), {"a": 1}),
+}
+
+
+def main():
+    for title, (field, value) in CASES.items():
+        report(
+            title,
+            {
+                "generic": best_of(
+                    lambda f=field, v=value: generic_clean(f, v), 100_000
+                ),
+                "Field.clean": best_of(lambda f=field, v=value: f.clean(v), 100_000),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
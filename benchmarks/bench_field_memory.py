@@ -0,0 +1,61 @@
+"""Memory used by (and time to create) field instances.
+
+Fields that override error messages own a copy of the message table, other
+fields share the table of the field type.
+"""
+
+import gc
+import tracemalloc
+
+from _common import best_of, report
+
+import odin
+
+FIELD_TYPES = {
+    "StringField": odin.StringField,
+    "IntegerField(min_value)": lambda **kw: odin.IntegerField(min_value=0, **kw),
+    "DateTimeField": odin.DateTimeField,
+    "TypedListField": lambda **kw: odin.TypedListField(odin.StringField(), **kw),
+}
+OVERRIDES = {"null": "A value is required."}
+
+
+def bytes_per_field(factory, count: int = 20_000, **kwargs) -> float:
+    """Average number of bytes allocated per field instance."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory(**kwargs) for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Exclude the list used to hold the instances
+    return (end - start - instances.__sizeof__()) / count
+
+
+def main():
+    title = "Bytes per field"
+    print(title)
+    print("-" * len(title))
+    for name, factory in FIELD_TYPES.items():
+        print(f"  {name:<36} {bytes_per_field(factory):10.1f}")
+        label = f"{name} (overrides)"
+        print(
+            f"  {label:<36} {bytes_per_field(factory, error_messages=OVERRIDES):10.1f}"
+        )
+    print()
+
+    for name, factory in FIELD_TYPES.items():
+        report(
+            f"Create {name}",
+            {
+                "shared messages": best_of(factory, 10_000),
+                "override messages": best_of(
+                    lambda f=factory: f(error_messages=OVERRIDES), 10_000
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
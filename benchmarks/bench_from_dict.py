@@ -0,0 +1,98 @@
+"""Compare the compiled dict loader with the generic field loop it replaced."""
+
+import datetime
+
+from _common import best_of, report
+
+import odin
+from odin.exceptions import ValidationError
+from odin.fields import NotProvided
+from odin.resources import create_resource_from_dict
+from odin.utils import getmeta
+
+
+class Author(odin.Resource):
+    class Meta:
+        namespace = "bench.from_dict"
+
+    name = odin.StringField()
+    country = odin.StringField(null=True)
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.from_dict"
+
+    title = odin.StringField()
+    isbn = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    genre = odin.StringField(null=True)
+    published = odin.DateTimeField(null=True)
+    tags = odin.TypedListField(odin.StringField())
+    authors = odin.ListOf(Author)
+
+
+def generic_from_dict(d, resource_type, full_clean):
+    """The generic (pre compiled) implementation."""
+    d = d.copy()
+    attrs = []
+    errors = {}
+    for f in getmeta(resource_type).init_fields:
+        value = d.pop(f.name, NotProvided)
+        if value is NotProvided:
+            value = f.get_default() if f.use_default_if_not_provided else None
+        else:
+            try:
+                value = f.to_python(value)
+            except ValidationError as ve:
+                errors[f.name] = ve.error_messages
+        attrs.append(value)
+    if errors and full_clean:
+        raise ValidationError(errors)
+    new_resource = resource_type(*attrs)
+    if d:
+        new_resource.extra_attrs(d)
+    if full_clean:
+        new_resource.full_clean()
+    return new_resource
+
+
+DATA = {
+    "title": "Consider Phlebas",
+    "isbn": "0-333-45430-8",
+    "num_pages": 471,
+    "rrp": 19.99,
+    "fiction": True,
+    "genre": "sci-fi",
+    "published": datetime.datetime(1987, 4, 23, tzinfo=datetime.timezone.utc),
+    "tags": ["culture", "space opera"],
+    "authors": [],
+}
+
+
+def main():
+    loader = getmeta(Book).compiled_from_dict
+
+    for full_clean in (False, True):
+        report(
+            f"Create resource from dict (full_clean={full_clean})",
+            {
+                "generic loop": best_of(
+                    lambda fc=full_clean: generic_from_dict(DATA, Book, fc), 50_000
+                ),
+                "compiled loader": best_of(
+                    lambda fc=full_clean: loader(Book, DATA.copy(), fc, False),
+                    50_000,
+                ),
+                "create_resource_from_dict": best_of(
+                    lambda fc=full_clean: create_resource_from_dict(DATA, Book, fc),
+                    50_000,
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Defensive copy and revalidation of mutable vs frozen resources."""
+
+import copy
+
+from _common import best_of, report
+
+import odin
+
+
+class Author(odin.Resource):
+    class Meta:
+        namespace = "bench.frozen.mutable"
+
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.frozen.mutable"
+
+    isbn = odin.StringField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField(min_value=1)
+    authors = odin.ListOf(Author)
+
+
+class FrozenAuthor(odin.Resource):
+    class Meta:
+        namespace = "bench.frozen.frozen"
+        frozen = True
+
+    name = odin.StringField()
+
+
+class FrozenBook(odin.Resource):
+    class Meta:
+        namespace = "bench.frozen.frozen"
+        frozen = True
+        key_field_name = "isbn"
+
+    isbn = odin.StringField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField(min_value=1)
+    authors = odin.ListOf(FrozenAuthor)
+
+
+def copy_and_validate(resource):
+    resource = copy.deepcopy(resource)
+    resource.full_clean()
+    return resource
+
+
+def main():
+    book = Book("0-333-45430-8", "Consider Phlebas", 471, [Author("Iain M. Banks")])
+    frozen_book = FrozenBook(
+        "0-333-45430-8", "Consider Phlebas", 471, [FrozenAuthor("Iain M. Banks")]
+    )
+    book.full_clean()
+    frozen_book.full_clean()
+
+    report(
+        "Defensive copy and full clean",
+        {
+            "mutable": best_of(lambda: copy_and_validate(book), 10_000),
+            "frozen": best_of(lambda: copy_and_validate(frozen_book), 10_000),
+        },
+    )
+    report(
+        "Hash",
+        {
+            "frozen (cached)": best_of(lambda: hash(frozen_book), 100_000),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare cleaning with the validation plan against the generic field loop."""
+
+from _common import best_of, report
+
+import odin
+from odin.exceptions import ValidationError
+from odin.fields import NotProvided
+from odin.utils import getmeta
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.full_clean"
+
+    title = odin.StringField()
+    isbn = odin.StringField(max_length=20)
+    num_pages = odin.IntegerField(min_value=1)
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    genre = odin.StringField(null=True)
+    edition = odin.IntegerField(null=True)
+    summary = odin.StringField(null=True)
+    tags = odin.TypedListField(odin.StringField())
+
+    def clean_title(self, value):
+        return value.strip()
+
+
+def generic_clean_fields(self, exclude=None, ignore_not_provided=False):
+    """The generic (pre validation plan) implementation."""
+    errors = {}
+    meta = getmeta(self)
+    for f in meta.fields:
+        if exclude and f.name in exclude:
+            continue
+        raw_value = f.value_from_object(self)
+        if (f.null and raw_value is None) or (
+            ignore_not_provided and raw_value is NotProvided
+        ):
+            continue
+        try:
+            raw_value = f.clean(raw_value)
+        except ValidationError as e:
+            errors[f.name] = e.messages
+        clean_method = getattr(self, f"clean_{f.attname}", None)
+        if callable(clean_method):
+            try:
+                raw_value = clean_method(raw_value)
+            except ValidationError as e:
+                errors.setdefault(f.name, []).extend(e.messages)
+        if f not in meta.readonly_fields:
+            setattr(self, f.attname, raw_value)
+    if errors:
+        raise ValidationError(errors)
+
+
+def main():
+    book = Book(
+        "Consider Phlebas",
+        "0-333-45430-8",
+        471,
+        19.99,
+        True,
+        "sci-fi",
+        None,
+        "Space opera",
+        ["culture"],
+    )
+
+    report(
+        "Clean fields",
+        {
+            "generic loop": best_of(lambda: generic_clean_fields(book), 50_000),
+            "validation plan": best_of(book.clean_fields, 50_000),
+        },
+    )
+    report(
+        "Full clean",
+        {
+            "validation plan": best_of(book.full_clean, 50_000),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Import time of the odin package and each codec (parsed from ``-X importtime``).
+
+Each statement is run in a fresh interpreter; the cumulative time of the top level
+odin imports is reported (best of several runs).
+"""
+
+import os
+import subprocess
+import sys
+
+from _common import SRC, report
+
+CODECS = (
+    "csv_codec",
+    "dict_codec",
+    "json_codec",
+    "msgpack_codec",
+    "toml_codec",
+    "xml_codec",
+    "yaml_codec",
+)
+
+
+def import_time(statement: str, repeat: int = 5) -> float | None:
+    """Best import time (in seconds) of statement; None if it cannot be imported."""
+    env = {**os.environ, "PYTHONPATH": SRC.as_posix()}
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        if result.returncode:
+            return None
+
+        # Lines are "import time: self [us] | cumulative | imported package" with
+        # nested imports indented below the package name.
+        value = 0
+        for line in result.stderr.splitlines()[1:]:
+            _, cumulative, name = line.split("|")
+            if name.startswith(" odin"):
+                value += int(cumulative)
+        best = value if best is None else min(best, value)
+    return best / 1e6
+
+
+def main():
+    results = {
+        "import odin (all public names)": import_time("from odin import *"),
+        "import odin": import_time("import odin"),
+    }
+    for codec in CODECS:
+        module = f"odin.codecs.{codec}"
+        value = import_time(f"import {module}")
+        if value is None:
+            print(f"Skipping {module} (dependencies not installed)")
+        else:
+            results[f"import {module}"] = value
+    print()
+    report("Import time", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Peak memory (and time) of loading a large JSON array with load vs iterload.
+
+Each loader is run in a fresh interpreter over the same file; the increase in the
+peak resident set size (``ru_maxrss``) over the interpreter after importing odin is
+reported.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from _common import SRC
+
+COUNT = 50_000
+
+SCRIPT = """
+import resource, sys, time
+import odin
+from odin.codecs import json_codec
+
+class Book(odin.Resource):
+    title = odin.StringField()
+    isbn = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    authors = odin.TypedListField(odin.StringField())
+
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+count = 0
+with open(sys.argv[1]) as f:
+    if sys.argv[2] == "load":
+        books = json_codec.load(f, Book)
+    else:
+        books = json_codec.iterload(f, Book)
+    for book in books:
+        count += 1
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(count, peak - base, elapsed)
+"""
+
+
+def write_document(path: str, count: int):
+    books = [
+        {
+            "title": f"Book {idx}",
+            "isbn": f"0-{idx:09d}",
+            "num_pages": 100 + idx % 500,
+            "rrp": 19.5,
+            "authors": ["Iain M. Banks", "Neil Gaiman"],
+        }
+        for idx in range(count)
+    ]
+    with open(path, "w") as f:
+        json.dump(books, f)
+
+
+def run(path: str, mode: str) -> tuple[int, int, float]:
+    env = {**os.environ, "PYTHONPATH": SRC.as_posix()}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SCRIPT, path, mode],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    count, peak, elapsed = result.stdout.split()
+    return int(count), int(peak), float(elapsed)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "books.json")
+        write_document(path, COUNT)
+
+        title = f"Load {COUNT:,} books ({os.path.getsize(path) / 2**20:.1f} MiB)"
+        print(title)
+        print("-" * len(title))
+        for mode in ("load", "iterload"):
+            count, peak, elapsed = run(path, mode)
+            if count != COUNT:
+                msg = f"{mode} loaded {count} of {COUNT} books"
+                raise RuntimeError(msg)
+            # ru_maxrss is reported in KiB on Linux
+            print(f"  {mode:<36} {peak / 1024:8.1f} MiB  {elapsed:8.3f} s")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare loading and dumping a library document with each installed JSON backend."""
+
+import datetime
+import json
+import uuid
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import json_codec
+
+
+class Author(odin.Resource):
+    name = odin.StringField()
+
+
+class Publisher(odin.Resource):
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    id = odin.UUIDField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    published = odin.DateTimeField()
+    authors = odin.ListOf(Author)
+    publisher = odin.DictAs(Publisher)
+    tags = odin.TypedListField(odin.StringField())
+
+
+class Library(odin.Resource):
+    name = odin.StringField()
+    books = odin.ListOf(Book)
+
+
+LIBRARY = Library(
+    name="Public Library",
+    books=[
+        Book(
+            id=uuid.UUID(int=idx),
+            title=f"Book {idx}",
+            num_pages=100 + idx,
+            rrp=19.5,
+            fiction=idx % 2 == 0,
+            published=datetime.datetime(1987, 1, 1, tzinfo=datetime.timezone.utc),
+            authors=[Author(name="Iain M. Banks")],
+            publisher=Publisher(name="Macmillan"),
+            tags=["sci-fi", "culture"],
+        )
+        for idx in range(1_000)
+    ],
+)
+DATA = json_codec.dumps(LIBRARY)
+
+
+def check_identical():
+    expected = json.loads(DATA)
+    for backend in json_codec.available_backends():
+        if json.loads(json_codec.dumps(LIBRARY, backend=backend)) != expected:
+            msg = f"Output of the {backend} backend differs"
+            raise RuntimeError(msg)
+        loaded = json_codec.loads(DATA, backend=backend)
+        if json_codec.dumps(loaded) != DATA:
+            msg = f"Document loaded by the {backend} backend differs"
+            raise RuntimeError(msg)
+
+
+def main():
+    check_identical()
+    backends = json_codec.available_backends()
+    report(
+        "Decode a library of 1,000 books (without building resources)",
+        {
+            f"{b} backend": best_of(
+                lambda b=b: json_codec.get_backend(b).loads(DATA), 20
+            )
+            for b in backends
+        },
+    )
+    report(
+        "Load a library of 1,000 books",
+        {
+            f"loads(backend={b!r})": best_of(
+                lambda b=b: json_codec.loads(DATA, backend=b), 10
+            )
+            for b in backends
+        },
+    )
+    report(
+        "Dump a library of 1,000 books",
+        {
+            f"dumps(backend={b!r})": best_of(
+                lambda b=b: json_codec.dumps(LIBRARY, backend=b), 10
+            )
+            for b in backends
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare loading a typed ($) JSON document in two passes and a single pass."""
+
+import datetime
+import uuid
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import json_codec
+
+
+class Author(odin.Resource):
+    name = odin.StringField()
+
+
+class Publisher(odin.Resource):
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    id = odin.UUIDField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    published = odin.DateTimeField()
+    authors = odin.ListOf(Author)
+    publisher = odin.DictAs(Publisher)
+    tags = odin.TypedListField(odin.StringField())
+
+
+class Library(odin.Resource):
+    name = odin.StringField()
+    books = odin.ListOf(Book)
+
+
+DATA = json_codec.dumps(
+    Library(
+        name="Public Library",
+        books=[
+            Book(
+                id=uuid.UUID(int=idx),
+                title=f"Book {idx}",
+                num_pages=100 + idx,
+                rrp=19.5,
+                fiction=idx % 2 == 0,
+                published=datetime.datetime(1987, 1, 1, tzinfo=datetime.timezone.utc),
+                authors=[Author(name="Iain M. Banks")],
+                publisher=Publisher(name="Macmillan"),
+                tags=["sci-fi", "culture"],
+            )
+            for idx in range(1_000)
+        ],
+    )
+)
+
+
+def check_identical():
+    for full_clean in (True, False):
+        two_pass = json_codec.loads(DATA, full_clean=full_clean)
+        single_pass = json_codec.loads(DATA, full_clean=full_clean, single_pass=True)
+        if json_codec.dumps(two_pass) != json_codec.dumps(single_pass):
+            msg = "Single pass load differs from the two pass load"
+            raise RuntimeError(msg)
+
+
+def main():
+    check_identical()
+    for full_clean in (True, False):
+        report(
+            f"Load a library of 1,000 books (full_clean={full_clean})",
+            {
+                "loads": best_of(
+                    lambda c=full_clean: json_codec.loads(DATA, full_clean=c), 10
+                ),
+                "loads(single_pass=True)": best_of(
+                    lambda c=full_clean: json_codec.loads(
+                        DATA, full_clean=c, single_pass=True
+                    ),
+                    10,
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
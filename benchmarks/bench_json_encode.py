@@ -0,0 +1,85 @@
+"""Compare encoding resources with OdinEncoder (via to_dict) and the DirectEncoder."""
+
+import datetime
+import json
+import uuid
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import json_codec
+
+
+class Author(odin.Resource):
+    name = odin.StringField()
+
+
+class Publisher(odin.Resource):
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    id = odin.UUIDField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    published = odin.DateTimeField()
+    authors = odin.ListOf(Author)
+    publisher = odin.DictAs(Publisher)
+    tags = odin.TypedListField(odin.StringField())
+
+
+class Library(odin.Resource):
+    name = odin.StringField()
+    books = odin.ListOf(Book)
+    book_count = odin.CalculatedField(lambda o: len(o.books))
+
+
+LIBRARY = Library(
+    name="Public Library",
+    books=[
+        Book(
+            id=uuid.UUID(int=idx),
+            title=f"Book {idx}",
+            num_pages=100 + idx,
+            rrp=19.5,
+            fiction=idx % 2 == 0,
+            published=datetime.datetime(1987, 1, 1, tzinfo=datetime.timezone.utc),
+            authors=[Author(name="Iain M. Banks")],
+            publisher=Publisher(name="Macmillan"),
+            tags=["sci-fi", "culture"],
+        )
+        for idx in range(1_000)
+    ],
+)
+
+
+def odin_encoder():
+    return json.dumps(LIBRARY, cls=json_codec.OdinEncoder)
+
+
+def direct_encoder():
+    return json_codec.dumps(LIBRARY)
+
+
+def check_identical():
+    if odin_encoder() != direct_encoder():
+        msg = "DirectEncoder output differs from OdinEncoder"
+        raise RuntimeError(msg)
+
+
+def main():
+    check_identical()
+    size = len(direct_encoder()) / 2**20
+    report(
+        f"Encode a library of 1,000 books ({size:.2f} MiB)",
+        {
+            "OdinEncoder": best_of(odin_encoder, 10),
+            "DirectEncoder": best_of(direct_encoder, 10),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
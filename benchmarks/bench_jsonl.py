@@ -0,0 +1,80 @@
+"""Compare reading/writing JSON Lines by hand (json_codec per line) with jsonl_codec."""
+
+import io
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import json_codec, jsonl_codec
+
+
+class Book(odin.Resource):
+    title = odin.StringField()
+    isbn = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    authors = odin.TypedListField(odin.StringField())
+
+
+BOOKS = [
+    Book(
+        title=f"Book {idx}",
+        isbn=f"0-{idx:09d}",
+        num_pages=100 + idx % 500,
+        rrp=19.5,
+        authors=["Iain M. Banks", "Neil Gaiman"],
+    )
+    for idx in range(5_000)
+]
+DATA = "".join(f"{json_codec.dumps(book)}\n" for book in BOOKS)
+
+
+def read_by_hand():
+    return [json_codec.loads(line, Book) for line in io.StringIO(DATA) if line.strip()]
+
+
+def read_codec():
+    return list(jsonl_codec.reader(io.StringIO(DATA), Book))
+
+
+def write_by_hand():
+    f = io.StringIO()
+    for book in BOOKS:
+        f.write(json_codec.dumps(book))
+        f.write("\n")
+    return f.getvalue()
+
+
+def write_codec():
+    return jsonl_codec.dumps(BOOKS)
+
+
+def check_identical():
+    if write_by_hand() != write_codec():
+        msg = "jsonl_codec output differs from json_codec"
+        raise RuntimeError(msg)
+    if len(read_by_hand()) != len(read_codec()):
+        msg = "jsonl_codec read a different number of resources"
+        raise RuntimeError(msg)
+
+
+def main():
+    check_identical()
+    report(
+        "Read 5,000 lines",
+        {
+            "json_codec.loads per line": best_of(read_by_hand, 5),
+            "jsonl_codec.reader": best_of(read_codec, 5),
+        },
+    )
+    report(
+        "Write 5,000 lines",
+        {
+            "json_codec.dumps per line": best_of(write_by_hand, 5),
+            "jsonl_codec.dump": best_of(write_codec, 5),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Eager vs lazy loading of a wide resource where only a few fields are read."""
+
+import datetime
+import json
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import json_codec
+
+FIELD_COUNT = 60
+
+
+class Wide(odin.Resource):
+    class Meta:
+        namespace = "bench.lazy"
+
+
+for idx in range(FIELD_COUNT):
+    field = (odin.StringField, odin.IntegerField, odin.DateTimeField)[idx % 3]
+    field(null=True).contribute_to_class(Wide, f"field_{idx}")
+
+
+def build_document() -> str:
+    values = {}
+    for idx in range(FIELD_COUNT):
+        values[f"field_{idx}"] = (
+            f"value {idx}",
+            idx,
+            datetime.datetime(2024, 1, 2, 3, 4, idx % 60).isoformat(),
+        )[idx % 3]
+    return json.dumps({"$": "bench.lazy.Wide", **values})
+
+
+def read_fields(resource):
+    return resource.field_0, resource.field_1, resource.field_2, resource.field_3
+
+
+def main():
+    document = build_document()
+
+    report(
+        f"Load {FIELD_COUNT} field resource and read 4 fields",
+        {
+            "eager": best_of(
+                lambda: read_fields(json_codec.loads(document, full_clean=False)),
+                5_000,
+            ),
+            "lazy": best_of(
+                lambda: read_fields(json_codec.loads(document, lazy=True)), 5_000
+            ),
+        },
+    )
+    report(
+        f"Load {FIELD_COUNT} field resource and full clean",
+        {
+            "eager": best_of(lambda: json_codec.loads(document), 5_000),
+            "lazy": best_of(
+                lambda: json_codec.loads(document, lazy=True).full_clean(), 5_000
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare collecting every validation error against the fail fast/bounded modes."""
+
+from _common import best_of, report
+
+import odin
+from odin.exceptions import ValidationError
+from odin.resources import build_object_graph
+
+
+class Line(odin.Resource):
+    sku = odin.StringField(max_length=8)
+    quantity = odin.IntegerField(min_value=1)
+    tags = odin.TypedListField(odin.IntegerField())
+
+
+class Order(odin.Resource):
+    ref = odin.StringField(max_length=8)
+    lines = odin.ListOf(Line)
+
+
+def make_order(count: int, invalid: bool) -> dict:
+    quantity = 0 if invalid else 1
+    tag = "x" if invalid else 1
+    return {
+        "ref": "order",
+        "lines": [
+            {"sku": f"sku-{idx}", "quantity": quantity, "tags": [tag, tag]}
+            for idx in range(count)
+        ],
+    }
+
+
+def load(data, max_errors=None):
+    try:
+        return build_object_graph(data, Order, max_errors=max_errors)
+    except ValidationError:
+        return None
+
+
+def main():
+    for invalid in (True, False):
+        data = make_order(1_000, invalid)
+        title = f"build_object_graph (1,000 {'invalid' if invalid else 'valid'} lines)"
+        report(
+            title,
+            {
+                "all errors": best_of(lambda d=data: load(d), 20),
+                "max_errors=100": best_of(lambda d=data: load(d, 100), 20),
+                "max_errors=1 (fail fast)": best_of(lambda d=data: load(d, 1), 20),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
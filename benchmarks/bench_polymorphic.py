@@ -0,0 +1,88 @@
+"""Decode a polymorphic ListOf where every item carries a type field."""
+
+from _common import best_of, report
+
+import odin
+from odin import resources
+from odin.codecs import dict_codec
+
+
+class Shape(odin.Resource):
+    class Meta:
+        namespace = "bench.polymorphic"
+        abstract = True
+
+    name = odin.StringField()
+
+
+class Circle(Shape):
+    radius = odin.FloatField()
+
+
+class Square(Shape):
+    side = odin.FloatField()
+
+
+class Triangle(Shape):
+    base = odin.FloatField()
+    height = odin.FloatField()
+
+
+class Drawing(odin.Resource):
+    class Meta:
+        namespace = "bench.polymorphic"
+
+    shapes = odin.ListOf(Shape)
+
+
+def build_document(count: int, qualified: bool) -> dict:
+    prefix = "bench.polymorphic." if qualified else ""
+    kinds = (
+        ("Circle", {"radius": 1.5}),
+        ("Square", {"side": 2.0}),
+        ("Triangle", {"base": 3.0, "height": 4.0}),
+    )
+    return {
+        "$": "bench.polymorphic.Drawing",
+        "shapes": [
+            {
+                "$": prefix + kinds[idx % 3][0],
+                "name": f"shape {idx}",
+                **kinds[idx % 3][1],
+            }
+            for idx in range(count)
+        ],
+    }
+
+
+def bench_document(count: int, qualified: bool):
+    document = build_document(count, qualified)
+    shapes = document["shapes"]
+
+    def candidates():
+        return [resources._resolve_type_from_candidates(s, Shape) for s in shapes]
+
+    def dispatch():
+        return [resources._resolve_type_from_resource(s, Shape) for s in shapes]
+
+    label = "qualified" if qualified else "relative"
+    report(
+        f"Resolve types of {count} shapes ({label} names)",
+        {
+            "check candidates": best_of(candidates, 100),
+            "dispatch table": best_of(dispatch, 100),
+        },
+    )
+    report(
+        f"Load drawing of {count} shapes ({label} names)",
+        {"dict_codec.load": best_of(lambda: dict_codec.load(document), 20)},
+    )
+
+
+def main():
+    for qualified in (True, False):
+        bench_document(1000, qualified)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Registry lookups used on hot paths (codecs, mappings and schema generation).
+
+The *scan* results reproduce the previous implementation (name formatting and
+linear scans on every call) for comparison.
+"""
+
+from _common import best_of, report
+
+import odin
+from odin import registration
+from odin.registration import generate_mapping_cache_name
+
+
+class Animal(odin.Resource):
+    class Meta:
+        namespace = "bench.registry"
+        abstract = True
+
+    name = odin.StringField()
+
+
+class Dog(Animal):
+    class Meta:
+        namespace = "bench.registry"
+
+
+class Cat(Animal):
+    class Meta:
+        namespace = "bench.registry"
+
+
+class DogToCat(odin.Mapping):
+    from_obj = Dog
+    to_obj = Cat
+
+
+def main():
+    cache = registration.ResourceCache()
+
+    def scan_get_resource():
+        return cache.resources.get("bench.registry.Dog".lower())
+
+    def scan_get_mapping():
+        return cache.mappings[generate_mapping_cache_name(Dog, Cat)]
+
+    def scan_get_field_resolver():
+        for base_type, field_resolver in cache.field_resolvers:
+            if issubclass(Dog, base_type):
+                return field_resolver(Dog)
+
+    def scan_get_child_resources():
+        return {
+            child for child in cache.resources.values() if issubclass(child, Animal)
+        }
+
+    number = 100_000
+    report(
+        "get_resource",
+        {
+            "scan": best_of(scan_get_resource, number),
+            "indexed": best_of(
+                lambda: cache.get_resource("bench.registry.Dog"), number
+            ),
+        },
+    )
+    report(
+        "get_mapping",
+        {
+            "scan": best_of(scan_get_mapping, number),
+            "indexed": best_of(lambda: cache.get_mapping(Dog, Cat), number),
+        },
+    )
+    report(
+        "get_field_resolver",
+        {
+            "scan": best_of(scan_get_field_resolver, number),
+            "indexed": best_of(lambda: cache.get_field_resolver(Dog), number),
+        },
+    )
+    report(
+        f"get_child_resources ({len(cache.resources)} registered names)",
+        {
+            "scan": best_of(scan_get_child_resources, number // 100),
+            "indexed": best_of(
+                lambda: cache.get_child_resources(Animal), number // 100
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare the generated resource ``__init__`` with the generic implementation."""
+
+from _common import best_of, report
+
+import odin
+
+
+class Generated(odin.Resource):
+    class Meta:
+        namespace = "bench.init"
+
+    title = odin.StringField()
+    count = odin.IntegerField(default=0)
+    rating = odin.FloatField(null=True)
+    tags = odin.TypedListField(odin.StringField())
+    active = odin.BooleanField(default=True)
+    summary = odin.StringField(null=True)
+
+
+class Generic(Generated):
+    class Meta:
+        namespace = "bench.init"
+        generate_init = False
+
+
+def main():
+    args = ("Consider Phlebas", 471, 4.5, ["sci-fi"], True, "Culture")
+    kwargs = {"title": "Consider Phlebas", "count": 471, "tags": ["sci-fi"]}
+
+    report(
+        "Positional arguments",
+        {
+            "ResourceBase.__init__": best_of(lambda: Generic(*args), 200_000),
+            "generated __init__": best_of(lambda: Generated(*args), 200_000),
+        },
+    )
+    report(
+        "Keyword arguments (with defaults)",
+        {
+            "ResourceBase.__init__": best_of(lambda: Generic(**kwargs), 200_000),
+            "generated __init__": best_of(lambda: Generated(**kwargs), 200_000),
+        },
+    )
+    report(
+        "No arguments (all defaults)",
+        {
+            "ResourceBase.__init__": best_of(Generic, 200_000),
+            "generated __init__": best_of(Generated, 200_000),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare the memory used by resource instances with and without ``__slots__``."""
+
+import gc
+import tracemalloc
+
+import _common  # noqa: F401
+
+import odin
+from odin.utils import getmeta
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.memory"
+
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    genre = odin.StringField(null=True)
+
+
+class SlotsBook(odin.Resource):
+    class Meta:
+        namespace = "bench.memory"
+        slots = True
+
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    genre = odin.StringField(null=True)
+
+
+def bytes_per_instance(resource_type, count: int = 100_000) -> float:
+    """Average number of bytes allocated per resource instance."""
+    values = ("Consider Phlebas", 471, 19.99, True, "sci-fi")
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [resource_type(*values) for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Exclude the list used to hold the instances
+    return (end - start - instances.__sizeof__()) / count
+
+
+def main():
+    title = "Bytes per instance (5 fields)"
+    print(title)
+    print("-" * len(title))
+    for resource_type in (Book, SlotsBook):
+        label = f"{resource_type.__name__} (slots={getmeta(resource_type).slots})"
+        print(f"  {label:<36} {bytes_per_instance(resource_type):10.1f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare the generated to_dict against the generic field iteration."""
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import dict_codec, json_codec
+from odin.utils import getmeta
+
+
+class Author(odin.Resource):
+    class Meta:
+        namespace = "bench.to_dict"
+
+    name = odin.StringField()
+
+
+class Book(odin.Resource):
+    class Meta:
+        namespace = "bench.to_dict"
+
+    title = odin.StringField()
+    isbn = odin.StringField()
+    num_pages = odin.IntegerField()
+    rrp = odin.FloatField()
+    fiction = odin.BooleanField()
+    genre = odin.StringField(null=True)
+    tags = odin.TypedListField(odin.StringField())
+    authors = odin.ListOf(Author)
+
+    @odin.calculated_field
+    def display_title(self):
+        return self.title.title()
+
+
+def generic_to_dict(resource, include_virtual=True, include_type_field=False):
+    """The generic (pre generated function) implementation."""
+    meta = getmeta(resource)
+    fields = meta.all_fields if include_virtual else meta.fields
+    result = {meta.type_field: meta.resource_name} if include_type_field else {}
+    result.update((f.name, f.prepare(f.value_from_object(resource))) for f in fields)
+    return result
+
+
+def main():
+    book = Book(
+        "Consider Phlebas",
+        "0-333-45430-8",
+        471,
+        19.99,
+        True,
+        "sci-fi",
+        ["culture"],
+        [Author("Iain M. Banks")],
+    )
+
+    report(
+        "to_dict",
+        {
+            "generic": best_of(lambda: generic_to_dict(book, True, True), 100_000),
+            "generated": best_of(lambda: book.to_dict(True, True), 100_000),
+        },
+    )
+    report(
+        "Codecs (generated to_dict)",
+        {
+            "dict_codec.dump": best_of(lambda: dict_codec.dump(book), 20_000),
+            "json_codec.dumps": best_of(lambda: json_codec.dumps(book), 20_000),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
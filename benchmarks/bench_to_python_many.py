@@ -0,0 +1,93 @@
+"""Convert columns of values per item compared with ``Field.to_python_many``."""
+
+import enum
+import io
+import uuid
+
+from _common import best_of, report
+
+import odin
+from odin.codecs import csv_codec
+
+
+class Colour(enum.Enum):
+    Red = "red"
+    Green = "green"
+    Blue = "blue"
+
+
+class Row(odin.Resource):
+    class Meta:
+        namespace = "bench.batch"
+
+    name = odin.StringField()
+    count = odin.IntegerField()
+    rating = odin.FloatField(null=True)
+    colour = odin.EnumField(Colour)
+
+
+def per_item(field, values):
+    return [field.to_python(value) for value in values]
+
+
+def bench_field(title, field, values):
+    report(
+        title,
+        {
+            "to_python per item": best_of(lambda: per_item(field, values), 20),
+            "to_python_many": best_of(lambda: field.to_python_many(values), 20),
+        },
+    )
+
+
+def bench_csv(rows):
+    data = "".join(f"name-{i},{i},{i / 2},{Colour.Red.value}\n" for i in range(rows))
+
+    def read(batch_size):
+        reader = csv_codec.reader(io.StringIO(data), Row, includes_header=False)
+        reader.batch_size = batch_size
+        return list(reader)
+
+    report(
+        f"csv_codec.reader ({rows} rows)",
+        {
+            "batch_size=1": best_of(lambda: read(1), 5),
+            "batch_size=256": best_of(lambda: read(256), 5),
+        },
+    )
+
+
+def main():
+    count = 10_000
+    bench_field(f"IntegerField ({count} ints)", odin.IntegerField(), list(range(count)))
+    bench_field(
+        f"IntegerField ({count} strings)",
+        odin.IntegerField(),
+        [str(i) for i in range(count)],
+    )
+    bench_field(
+        f"UUIDField ({count} strings)",
+        odin.UUIDField(),
+        [str(uuid.uuid4()) for _ in range(count)],
+    )
+    bench_field(
+        f"EnumField ({count} values)",
+        odin.EnumField(Colour),
+        [colour.value for colour in Colour] * (count // 3),
+    )
+
+    field = odin.TypedListField(odin.IntegerField())
+    values = [str(i) for i in range(count)]
+    report(
+        f"TypedListField(IntegerField) ({count} strings)",
+        {
+            "per item": best_of(lambda: per_item(field.field, values), 20),
+            "to_python": best_of(lambda: field.to_python(values), 20),
+        },
+    )
+
+    bench_csv(5_000)
+
+
+if __name__ == "__main__":
+    main()
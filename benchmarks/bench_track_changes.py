@@ -0,0 +1,87 @@
+"""Revalidating deep ListOf/DictAs trees with and without change tracking.
+
+A tree of resources is validated, a single leaf is modified and the root is
+revalidated.
+"""
+
+from _common import best_of, report
+
+import odin
+
+
+def build_types(track_changes: bool):
+    def meta():
+        return type(
+            "Meta",
+            (),
+            {
+                "namespace": f"bench.track_changes.{track_changes}",
+                "track_changes": track_changes,
+            },
+        )
+
+    class Leaf(odin.Resource):
+        Meta = meta()
+
+        name = odin.StringField(max_length=50)
+        value = odin.IntegerField(min_value=0)
+        ratio = odin.FloatField(null=True)
+        created = odin.DateTimeField(null=True)
+
+    class Branch(odin.Resource):
+        Meta = meta()
+
+        name = odin.StringField()
+        detail = odin.DictAs(Leaf)
+        leaves = odin.ListOf(Leaf)
+
+    class Root(odin.Resource):
+        Meta = meta()
+
+        name = odin.StringField()
+        branches = odin.ListOf(Branch)
+
+    return Root, Branch, Leaf
+
+
+def build_tree(types, branches: int, leaves: int):
+    root_type, branch_type, leaf_type = types
+    return root_type(
+        name="root",
+        branches=[
+            branch_type(
+                name=f"branch-{b}",
+                detail=leaf_type(name="detail", value=b),
+                leaves=[
+                    leaf_type(name=f"leaf-{idx}", value=idx) for idx in range(leaves)
+                ],
+            )
+            for b in range(branches)
+        ],
+    )
+
+
+def main():
+    for branches, leaves in ((10, 10), (50, 50)):
+        results = {}
+        for track_changes in (False, True):
+            tree = build_tree(build_types(track_changes), branches, leaves)
+            tree.full_clean()
+            leaf = tree.branches[0].leaves[0]
+
+            def revalidate(tree=tree, leaf=leaf):
+                leaf.value += 1
+                tree.full_clean()
+
+            label = "tracked" if track_changes else "untracked"
+            results[label] = best_of(revalidate, 20, repeat=3)
+            if track_changes:
+                results["tracked (force)"] = best_of(
+                    lambda tree=tree: tree.full_clean(force=True), 20, repeat=3
+                )
+
+        report(f"Revalidate {branches} branches x {leaves} leaves", results)
+
+
+if __name__ == "__main__":
+    main()
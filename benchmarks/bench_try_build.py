@@ -0,0 +1,111 @@
+"""Compare the raising build/full clean APIs with the non-raising try_build/validate."""
+
+import contextlib
+
+from _common import best_of, report
+
+import odin
+from odin.exceptions import ValidationError
+from odin.resources import build_object_graph, try_build
+
+
+class Line(odin.Resource):
+    sku = odin.StringField(max_length=8)
+    quantity = odin.IntegerField(min_value=1)
+
+
+class Shipment(odin.Resource):
+    carrier = odin.StringField()
+    lines = odin.ListOf(Line)
+
+
+class Order(odin.Resource):
+    ref = odin.StringField(max_length=8)
+    shipments = odin.ListOf(Shipment)
+
+
+def make_record(idx: int, invalid: bool) -> dict:
+    return {
+        "ref": f"o-{idx}",
+        "shipments": [
+            {
+                "carrier": "post",
+                "lines": [
+                    {"sku": f"sku-{line}", "quantity": 0 if invalid else 1}
+                    for line in range(3)
+                ],
+            }
+        ],
+    }
+
+
+# A feed where every fifth record is invalid
+FEED = [make_record(idx, invalid=idx % 5 == 0) for idx in range(1_000)]
+VALID = [make_record(idx, invalid=False) for idx in range(1_000)]
+
+
+def load_raising(records):
+    loaded = []
+    for record in records:
+        try:
+            loaded.append(build_object_graph(record, Order))
+        except ValidationError as ve:
+            loaded.append(ve.error_messages)
+    return loaded
+
+
+def load_result(records):
+    loaded = []
+    for record in records:
+        result = try_build(record, Order)
+        loaded.append(result.value if result.is_valid else result.errors)
+    return loaded
+
+
+def errors_only(loaded):
+    return [item if isinstance(item, dict) else None for item in loaded]
+
+
+def check_identical(records):
+    if errors_only(load_raising(records)) != errors_only(load_result(records)):
+        msg = "Raising and non-raising builds report different errors"
+        raise RuntimeError(msg)
+
+
+def clean_raising(resources):
+    for resource in resources:
+        with contextlib.suppress(ValidationError):
+            resource.full_clean()
+
+
+def clean_result(resources):
+    for resource in resources:
+        resource.validate()
+
+
+def main():
+    for title, records in (
+        ("1,000 valid records", VALID),
+        ("1,000 records (20% invalid)", FEED),
+    ):
+        check_identical(records)
+        report(
+            f"Build {title}",
+            {
+                "build_object_graph": best_of(lambda r=records: load_raising(r), 10),
+                "try_build": best_of(lambda r=records: load_result(r), 10),
+            },
+        )
+
+        resources = [build_object_graph(r, Order, full_clean=False) for r in records]
+        report(
+            f"Validate {title}",
+            {
+                "full_clean": best_of(lambda r=resources: clean_raising(r), 10),
+                "validate": best_of(lambda r=resources: clean_result(r), 10),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,150 @@
-# Disable logging if an explicit handler is not added
-import logging
-
-logging.getLogger("odin.registration").addHandler(logging.NullHandler())
-
-from odin import exceptions  # noqa
-from odin.adapters import ResourceAdapter  # noqa
-from odin.annotated_resource import *  # noqa
-from odin.annotated_resource import type_aliases as types  # noqa
-from odin.fields import *  # noqa
-from odin.fields.composite import *  # noqa
-from odin.fields.virtual import *  # noqa
-from odin.helpers import *  # noqa
-from odin.mapping import *  # noqa
-from odin.proxy import ResourceProxy  # noqa
-from odin.resources import Resource  # noqa
+"""Odin - Data-structure definition/validation/traversal, mapping and serialisation toolkit.
+
+Public names are imported from their modules on first access (see ``_LAZY_ATTRIBUTES``)
+so that ``import odin`` (and importing a single codec) remains cheap.
+"""
+
+import importlib
+
+# Avoid the cost of importing typing (type checkers treat this as typing.TYPE_CHECKING)
+TYPE_CHECKING = False
 
 __authors__ = "Tim Savage <tim@savage.company>"
 __copyright__ = "Copyright (C) 2021 Tim Savage"
+
+
+def _exports(module_name: str, *names: str) -> dict[str, tuple[str, str | None]]:
+    return {name: (module_name, name) for name in names}
+
+
+# Public name -> (module, attribute); an attribute of None refers to the module itself.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    **_exports("odin.adapters", "ResourceAdapter"),
+    **_exports(
+        "odin.annotated_resource",
+        "Options",
+        "AnnotatedResourceType",
+        "AnnotatedResource",
+        "AResource",
+    ),
+    **_exports(
+        "odin.fields",
+        "NotProvided",
+        "NotProvidedType",
+        "BaseField",
+        "Field",
+        "BooleanField",
+        "StringField",
+        "UrlField",
+        "IntegerField",
+        "FloatField",
+        "DateField",
+        "TimeField",
+        "NaiveTimeField",
+        "DateTimeField",
+        "NaiveDateTimeField",
+        "HttpDateTimeField",
+        "TimeStampField",
+        "EmailField",
+        "IPv4Field",
+        "IPv6Field",
+        "IPv46Field",
+        "ListField",
+        "UUIDField",
+        "DictField",
+        "ObjectField",
+        "ArrayField",
+        "TypedArrayField",
+        "TypedListField",
+        "TypedDictField",
+        "TypedObjectField",
+        "EnumField",
+        "PathField",
+        "RegexField",
+    ),
+    **_exports(
+        "odin.fields.composite",
+        "CompositeField",
+        "DictAs",
+        "ObjectAs",
+        "ListOf",
+        "ArrayOf",
+        "DictOf",
+    ),
+    **_exports(
+        "odin.fields.virtual",
+        "ConstantField",
+        "CalculatedField",
+        "calculated_field",
+        "MultiPartField",
+    ),
+    **_exports("odin.helpers", "ValidationErrorCollection"),
+    **_exports(
+        "odin.mapping",
+        "Mapping",
+        "map_field",
+        "map_list_field",
+        "assign_field",
+        "define",
+        "assign",
+    ),
+    **_exports("odin.proxy", "ResourceProxy"),
+    **_exports("odin.resources", "Resource"),
+    "types": ("odin.annotated_resource.type_aliases", None),
+    # Sub-modules that were previously available after ``import odin``
+    **{
+        name: (f"odin.{name}", None)
+        for name in (
+            "adapters",
+            "annotated_resource",
+            "bases",
+            "compiler",
+            "datetimeutil",
+            "exceptions",
+            "fields",
+            "helpers",
+            "mapping",
+            "proxy",
+            "registration",
+            "resources",
+            "utils",
+            "validators",
+        )
+    },
+}
+
+__all__ = tuple(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    # Cache so future lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES} - {"TYPE_CHECKING"})
+
+
+if TYPE_CHECKING:
+    from odin import exceptions  # noqa
+    from odin.adapters import ResourceAdapter  # noqa
+    from odin.annotated_resource import *  # noqa
+    from odin.annotated_resource import type_aliases as types  # noqa
+    from odin.fields import *  # noqa
+    from odin.fields.composite import *  # noqa
+    from odin.fields.virtual import *  # noqa
+    from odin.helpers import *  # noqa
+    from odin.mapping import *  # noqa
+    from odin.proxy import ResourceProxy  # noqa
+    from odin.resources import Resource  # noqa
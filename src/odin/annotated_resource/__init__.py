@@ -27,7 +27,9 @@ from odin.resources import (
     ResourceBase,
     ResourceOptions,
     _add_parent_fields_to_class,
+    _finalise_resource,
     _new_meta_instance,
+    _new_resource_class,
 )
 
 from .type_resolution import Options, process_attribute
@@ -96,13 +98,17 @@ class AnnotatedResourceType(type):
             # If this isn't a subclass of NewResource, don't do anything special.
             return super_new(mcs, name, bases, attrs)
 
+        # Resolve fields from annotations; required to determine slots before
+        # the class is created.
+        class_attrs = dict(_iterate_attrs(attrs))
+
         # Create the class.
-        new_class = super_new(mcs, name, bases, {"__module__": attrs.pop("__module__")})
+        new_class, meta_def = _new_resource_class(
+            mcs, name, bases, parents, class_attrs
+        )
 
         # Create new meta instance
-        new_meta = _new_meta_instance(
-            meta_options_type, attrs.pop("Meta", None), new_class
-        )
+        new_meta = _new_meta_instance(meta_options_type, meta_def, new_class)
         new_meta.abstract = abstract
 
         # Bail out early if we have already created this class.
@@ -111,7 +117,7 @@ class AnnotatedResourceType(type):
             return r
 
         # Add all field attributes to the class.
-        for field_name, field in _iterate_attrs(attrs):
+        for field_name, field in class_attrs.items():
             new_class.add_to_class(field_name, field)
 
         _add_parent_fields_to_class(new_class, new_meta, parents)
@@ -129,6 +135,8 @@ class AnnotatedResourceType(type):
             if hasattr(field, "on_resource_ready"):
                 field.on_resource_ready()
 
+        _finalise_resource(new_class, new_meta)
+
         if abstract:
             return new_class
 
@@ -155,5 +163,7 @@ class AnnotatedResource(
 ):
     """New Style Resource utilising type annotations for defining fields."""
 
+    __slots__ = ()
+
 
 AResource = AnnotatedResource
@@ -11,6 +11,8 @@ class AnyField(Field):
     The main use for this field is the Any type for Annotated resources
     """
 
+    __slots__ = ()
+
     data_type_name = "Any"
 
     def to_python(self, value):
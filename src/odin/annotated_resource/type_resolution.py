@@ -6,6 +6,7 @@ import functools
 import pathlib
 import re
 import uuid
+from collections.abc import Callable
 from types import UnionType
 from typing import Annotated, Any, Final, Union, get_args, get_origin
 
@@ -50,6 +51,7 @@ class Options:
         "field_type",
         "base_args",
         "field_args",
+        "nested_args",
         "extra_args",
     )
 
@@ -88,6 +90,8 @@ class Options:
         }
         if default not in (None, NotProvided):
             self.field_args["default"] = default
+        # Arguments that are fields resolved from a type (eg items of a list)
+        self.nested_args: dict[str, Any] = {}
 
     def __repr__(self):
         summary = ", ".join(
@@ -98,6 +102,15 @@ class Options:
             f"Options({field_type}, {summary})" if field_type else f"Options({summary})"
         )
 
+    def copy(self) -> "Options":
+        """Copy of these options (arguments can be changed without affecting this instance)."""
+        obj = Options.__new__(Options)
+        obj.field_type = self.field_type
+        obj.base_args = self.base_args.copy()
+        obj.field_args = self.field_args.copy()
+        obj.nested_args = self.nested_args.copy()
+        return obj
+
     @property
     def actual_field_type(self):
         """Actual field type."""
@@ -137,8 +150,14 @@ class Options:
     def construct_field(self) -> Field:
         """Instantiate field object"""
         if self.field_type:
+            kwargs = self._kwargs()
+            if self.nested_args:
+                kwargs.update(
+                    (name, process_attribute(tp))
+                    for name, tp in self.nested_args.items()
+                )
             try:
-                return self.field_type(**self._kwargs())
+                return self.field_type(**kwargs)
             except TypeError as ex:
                 self._improve_error(ex)
                 raise
@@ -169,7 +188,7 @@ SIMPLE_TYPE_MAP: dict[type, type[Field] | functools.partial] = {
 }
 
 
-def _create_field_from_list_type(args: tuple, options: Options) -> BaseField:
+def _resolve_list_type(args: tuple, options: Options) -> Options:
     """Handle the various types of list."""
     if args:
         (tp,) = args
@@ -180,15 +199,15 @@ def _create_field_from_list_type(args: tuple, options: Options) -> BaseField:
             options.field_type = ListOf
 
         else:
-            options.field_args["field"] = process_attribute(tp)
+            options.nested_args["field"] = tp
             options.field_type = TypedListField
     else:
         options.field_type = ListField
 
-    return options.construct_field()
+    return options
 
 
-def _create_field_from_dict_type(args: tuple, options: Options) -> BaseField:
+def _resolve_dict_type(args: tuple, options: Options) -> Options:
     """Handle the various types of mapping."""
     if args:
         key_field, value_field = args
@@ -201,17 +220,17 @@ def _create_field_from_dict_type(args: tuple, options: Options) -> BaseField:
             options.field_type = DictOf
 
         else:
-            options.field_args["key_field"] = process_attribute(key_field)
-            options.field_args["value_field"] = process_attribute(value_field)
+            options.nested_args["key_field"] = key_field
+            options.nested_args["value_field"] = value_field
             options.field_type = TypedDictField
 
     else:
         options.field_type = DictField
 
-    return options.construct_field()
+    return options
 
 
-def _create_nullable_field(args, options: Options) -> BaseField:
+def _resolve_nullable_type(args, options: Options) -> Options:
     """Handle union fields."""
 
     type_none = type(None)
@@ -231,7 +250,7 @@ def _create_nullable_field(args, options: Options) -> BaseField:
         raise ResourceDefError(msg)
 
     options.field_args["null"] = True
-    return process_attribute(tp, options)
+    return _resolve_options(tp, options)
 
 
 def _set_options_field_type(options: Options, tp: type):
@@ -255,10 +274,10 @@ def _set_options_field_type(options: Options, tp: type):
         raise ResourceDefError(msg)
 
 
-def _create_field_via_origin(origin, tp, options: Options) -> BaseField:
+def _resolve_via_origin(origin, tp, options: Options) -> Options:
     if origin is Union or origin is UnionType:
         args = get_args(tp)
-        return _create_nullable_field(args, options)
+        return _resolve_nullable_type(args, options)
 
     if origin is Final:
         # Constant
@@ -267,26 +286,26 @@ def _create_field_via_origin(origin, tp, options: Options) -> BaseField:
             msg = "Final fields require a value"
             raise ResourceDefError(msg)
         options.base_args["value"] = value
-        return options.construct_field()
+        return options
 
     # If type already defined skip lookup
     if options.is_field_type_valid:
-        return options.construct_field()
+        return options
 
     if issubclass(origin, list):
-        return _create_field_from_list_type(get_args(tp), options)
+        return _resolve_list_type(get_args(tp), options)
 
     if issubclass(origin, dict):
-        return _create_field_from_dict_type(get_args(tp), options)
+        return _resolve_dict_type(get_args(tp), options)
 
     msg = f"Unable to resolve field for sub-scripted type {tp!r}"
     raise ResourceDefError(msg)
 
 
-def _create_field_for_type(tp, options: Options) -> Field:
+def _resolve_type(tp, options: Options) -> Options:
     # If type already defined skip lookup
     if options.is_field_type_valid:
-        return options.construct_field()
+        return options
 
     # Is a basic type
     if isinstance(tp, type):
@@ -298,28 +317,107 @@ def _create_field_for_type(tp, options: Options) -> Field:
         msg = f"Annotation is not a type instance {tp!r}"
         raise ResourceDefError(msg)
 
-    return options.construct_field()
+    return options
 
 
-def _create_field_via_annotated(tp, value) -> BaseField:
-    """Process an Annotated type."""
+def _resolve_options(tp, options: Options) -> Options:
+    """Resolve the field type (and arguments) of options from a type."""
+    if origin := get_origin(tp):
+        return _resolve_via_origin(origin, tp, options)
+    return _resolve_type(tp, options)
 
-    if isinstance(value, Options):
-        msg = "Options should included in the Annotation"
-        raise ResourceDefError(msg)
 
-    # Resolve sub-type and options
+def _annotated_options(tp) -> tuple[Any, Options, bool]:
+    """Split an Annotated type into the sub-type and options.
+
+    Returns the sub-type, options and if the options are from the annotation.
+    """
     tp, metadata = get_args(tp)
     if isinstance(metadata, Options):
-        options = metadata
-        options.field_args["default"] = value
-    else:
-        options = Options(value)
+        return tp, metadata, True
+    return tp, Options(), False
 
-    if origin := get_origin(tp):
-        return _create_field_via_origin(origin, tp, options)
+
+def _is_constant(tp) -> bool:
+    """Type (or a sub-type that shares options) is Final; the value is used."""
+    origin = get_origin(tp)
+    if origin is Final:
+        return True
+    if origin is Annotated:
+        return _is_constant(get_args(tp)[0])
+    if origin is Union or origin is UnionType:
+        return any(_is_constant(arg) for arg in get_args(tp))
+    return False
+
+
+class FieldFactory:
+    """Create fields for an annotation from options resolved up front.
+
+    Resolving a type (walking unions, sub-scripted types, the simple type map
+    etc.) only depends on the annotation, schemas reuse the same annotations
+    many times so factories are cached by :py:func:`field_factory`.
+    """
+
+    __slots__ = ("options", "annotated", "kwargs", "nested", "accepts_default")
+
+    def __init__(self, options: Options, annotated: bool):
+        self.options = options
+        self.annotated = annotated
+        self.kwargs = options._kwargs()
+        self.nested = tuple(
+            (name, _nested_factory(tp)) for name, tp in options.nested_args.items()
+        )
+        # Default is only supplied to (non-virtual) fields
+        self.accepts_default = options.is_field_type_valid
+
+    def __call__(self, value: Any = NotProvided) -> BaseField:
+        """Create a field with the default value supplied."""
+        options = self.options
+        if options.field_type is None:
+            return options.construct_field()
+
+        kwargs = self.kwargs.copy()
+        # Options from an annotation always use the value (as with process_attribute)
+        if self.accepts_default and (
+            self.annotated or value not in (None, NotProvided)
+        ):
+            kwargs["default"] = value
+        for name, factory in self.nested:
+            kwargs[name] = factory()
+
+        try:
+            return options.field_type(**kwargs)
+        except TypeError as ex:
+            options._improve_error(ex)
+            raise
+
+
+def _nested_factory(tp) -> Callable[[], BaseField]:
+    """Factory for a field nested in another field (eg the items of a list)."""
+    if not _is_constant(tp):
+        try:
+            return field_factory(tp)
+        except TypeError:
+            # Annotation is not hashable (eg metadata of Annotated)
+            pass
+    return functools.partial(process_attribute, tp)
+
+
+@functools.lru_cache(maxsize=1024)
+def field_factory(tp) -> FieldFactory:
+    """Get the (cached) field factory for an annotation.
+
+    Constant (``Final``) annotations are not supported as they use the value
+    of the attribute, see :py:func:`process_attribute`.
+    """
+    if get_origin(tp) is Annotated:
+        tp, options, annotated = _annotated_options(tp)
+        # Leave the options of the annotation unchanged
+        options = options.copy()
     else:
-        return _create_field_for_type(tp, options)
+        options, annotated = Options(), False
+
+    return FieldFactory(_resolve_options(tp, options), annotated)
 
 
 def process_attribute(
@@ -334,13 +432,27 @@ def process_attribute(
     if isinstance(value, _base_field):
         return value
 
-    if origin := get_origin(tp):
-        if origin is Annotated:
-            return _create_field_via_annotated(tp, value)
+    if not isinstance(value, Options) and not _is_constant(tp):
+        try:
+            factory = field_factory(tp)
+        except TypeError:
+            # Annotation is not hashable (eg metadata of Annotated)
+            pass
+        else:
+            return factory(value)
 
-        options = value if isinstance(value, Options) else Options(value)
-        return _create_field_via_origin(origin, tp, options)
+    if get_origin(tp) is Annotated:
+        if isinstance(value, Options):
+            msg = "Options should included in the Annotation"
+            raise ResourceDefError(msg)
+
+        tp, options, annotated = _annotated_options(tp)
+        if annotated:
+            options.field_args["default"] = value
+        else:
+            options = Options(value)
 
     else:
         options = value if isinstance(value, Options) else Options(value)
-        return _create_field_for_type(tp, options)
+
+    return _resolve_options(tp, options).construct_field()
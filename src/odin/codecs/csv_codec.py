@@ -23,7 +23,7 @@ from odin import bases
 from odin.datastructures import CaseLessStringList
 from odin.exceptions import CodecDecodeError, ValidationError
 from odin.fields import NotProvided
-from odin.resources import create_resource_from_iter
+from odin.resources import create_resource_from_iter, create_resources_from_iter
 from odin.utils import getmeta
 
 CONTENT_TYPE = "text/csv"
@@ -64,6 +64,11 @@ class Reader(bases.TypedResourceIterable):
     The default value to use if a field is empty. This can be used to default to *None*.
     """
 
+    batch_size = 256
+    """
+    Number of rows read before the values of each column are converted (together).
+    """
+
     def __init__(
         self, f, resource_type, full_clean=True, error_callback=None, **reader_kwargs
     ):
@@ -123,12 +128,7 @@ class Reader(bases.TypedResourceIterable):
 
         def create_resource(values, i):
             try:
-                return create_resource_from_iter(
-                    # Handle empty values
-                    (default_empty_value if v == "" else v for v in values),
-                    resource,
-                    full_clean,
-                )
+                return create_resource_from_iter(values, resource, full_clean)
             except ValidationError as ve:
                 # Don't raise these through yield as will cause a StopIteration
                 # even if validation error can be handled safely.
@@ -139,21 +139,45 @@ class Reader(bases.TypedResourceIterable):
                 if handle_validation_error(ve, i) is False:
                     raise
 
+        def create_resources(batch, first_idx):
+            try:
+                yield from create_resources_from_iter(batch, resource, full_clean)
+            except ValidationError:
+                # Create each row to handle the error(s) of each row
+                for i, values in enumerate(batch, first_idx):
+                    res = create_resource(values, i)
+                    if res:
+                        yield res
+
+        def handle_empty(v):
+            return default_empty_value if v == "" else v
+
         if self.includes_header:
             mapping = self.field_mapping
+            row_offset = 1  # Add one to index as row "0" will be the header
 
-            for idx, row in enumerate(self._reader):
+            def prepare_row(row):
                 # Check if row is less than mapping (as this will causes errors)!
-                res = create_resource(
-                    (s if s is NotProvided else row[s] for s in mapping), idx + 1
-                )  # Add one to index as row "0" will be the header
-                if res:
-                    yield res
+                return [
+                    s if s is NotProvided else handle_empty(row[s]) for s in mapping
+                ]
+
         else:
-            for idx, row in enumerate(self._reader):
-                res = create_resource(row, idx)
-                if res:
-                    yield res
+            row_offset = 0
+
+            def prepare_row(row):
+                return [handle_empty(v) for v in row]
+
+        # Rows are read in batches so the values of each column are converted together
+        batch_size = self.batch_size
+        batch = []
+        for idx, row in enumerate(self._reader):
+            batch.append(prepare_row(row))
+            if len(batch) >= batch_size:
+                yield from create_resources(batch, idx + row_offset + 1 - len(batch))
+                batch = []
+        if batch:
+            yield from create_resources(batch, idx + row_offset + 1 - len(batch))
 
         self.row_count = idx + 1  # Add one to get a count from the last index
 
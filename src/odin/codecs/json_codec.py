@@ -1,10 +1,34 @@
+import codecs
+import contextlib
 import datetime
+import functools
 import json
+import math
+import re
 import typing
 import uuid
+from collections.abc import Callable, Iterator, Sequence
+from json.encoder import encode_basestring_ascii
+from typing import Any
 
-from odin import ResourceAdapter, bases, resources, serializers
-from odin.exceptions import CodecDecodeError, CodecEncodeError
+from odin import (
+    ResourceAdapter,
+    bases,
+    compiler,
+    registration,
+    resources,
+    serializers,
+)
+from odin import fields as fields_module
+from odin.exceptions import (
+    CodecDecodeError,
+    CodecEncodeError,
+    ValidationError,
+    check_max_errors,
+    error_limit,
+)
+from odin.fields.composite import CompositeField, DictOf, ListOf
+from odin.utils import getmeta
 
 LIST_TYPES = (bases.ResourceIterable, typing.ValuesView, typing.KeysView)
 JSON_TYPES = {
@@ -15,6 +39,17 @@ JSON_TYPES = {
 }
 CONTENT_TYPE = "application/json"
 
+# Kind of the composite fields that create resources (by to_python method)
+_RESOURCE_FIELD_KINDS = {
+    CompositeField.to_python: "dict_as",
+    ListOf.to_python: "list_of",
+    DictOf.to_python: "dict_of",
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*").match
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*").match
+_TOKEN_TAIL = re.compile(r"[^ \t\n\r\[\]{},:]*").match
+
 
 class OdinEncoder(json.JSONEncoder):
     """Encoder for Odin resources."""
@@ -39,7 +74,685 @@ class OdinEncoder(json.JSONEncoder):
         return super().default(o)
 
 
-def load(fp, resource=None, full_clean=True, default_to_not_supplied=False):
+_FLOAT_CONSTANTS = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _float_str(o: float) -> str:
+    """Encode a float as :py:class:`json.JSONEncoder` (with ``allow_nan``)."""
+    text = float.__repr__(o)
+    return _FLOAT_CONSTANTS.get(text, text)
+
+
+# Encoders of scalar values by (exact) type
+_SCALARS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _float_str,
+    bool: {True: "true", False: "false"}.__getitem__,
+    type(None): lambda o: "null",
+}
+
+# Field native types with an encoder that is inlined into generated code
+_FIELD_SCALARS = {
+    str: "encode_str",
+    int: "int_str",
+    float: "float_str",
+    bool: "bool_str",
+}
+
+
+def _scalar_native_type(field) -> type | None:
+    """Scalar type of the (prepared) values of a field if it can be inlined."""
+    if (
+        isinstance(field, fields_module.Field)
+        and type(field).prepare is fields_module.BaseField.prepare
+    ):
+        native_types = compiler.native_types(field)
+        if native_types and native_types[0] in _FIELD_SCALARS:
+            return native_types[0]
+    return None
+
+
+def _encode_key(key) -> str:
+    """Encode a dict key as :py:class:`json.JSONEncoder` (without ``skipkeys``)."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, float):
+        return f'"{_float_str(key)}"'
+    if key is True or key is False or key is None:
+        return f'"{_SCALARS[key.__class__](key)}"'
+    if isinstance(key, int):
+        return f'"{int.__repr__(key)}"'
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
+
+
+class DirectEncoder:
+    """Encode resources directly into JSON without building intermediate dicts.
+
+    Produces output identical to :py:class:`OdinEncoder` with the default
+    :py:class:`json.JSONEncoder` options. A function is generated for each
+    resource type that formats the pre-encoded keys (and type field) of the
+    resource with the encoded value of each field, values of scalar fields are
+    encoded inline. Other values are encoded with a function selected (and
+    cached) by the type of the value.
+
+    Generated functions are cached by the encoder instance, use
+    :py:func:`get_encoder` to obtain a shared instance.
+    """
+
+    __slots__ = ("_encoders", "include_type_field", "include_virtual_fields")
+
+    def __init__(self, include_virtual_fields=True, include_type_field=True):
+        self.include_virtual_fields = include_virtual_fields
+        self.include_type_field = include_type_field
+        self._encoders: dict[type, Callable[[Any], str]] = {
+            **_SCALARS,
+            list: self._encode_list,
+            tuple: self._encode_list,
+            dict: self._encode_dict,
+        }
+
+    def encode(self, o) -> str:
+        """Return a JSON string representation of o."""
+        try:
+            return self._encode(o)
+        except RecursionError:
+            msg = "Circular reference detected"
+            raise ValueError(msg) from None
+
+    def _encode(self, o) -> str:
+        encoder = self._encoders.get(o.__class__)
+        if encoder is None:
+            encoder = self._type_encoder(o.__class__)
+        return encoder(o)
+
+    def _encode_list(self, o) -> str:
+        return f"[{', '.join(map(self._encode, o))}]"
+
+    def _encode_dict(self, o) -> str:
+        encode = self._encode
+        items = ", ".join(
+            [
+                f"{encode_basestring_ascii(key) if key.__class__ is str else _encode_key(key)}"
+                f": {encode(value)}"
+                for key, value in o.items()
+            ]
+        )
+        return f"{{{items}}}"
+
+    def _encode_to_dict(self, o) -> str:
+        return self._encode_dict(
+            o.to_dict(self.include_virtual_fields, self.include_type_field)
+        )
+
+    def _encode_iterable(self, o) -> str:
+        return self._encode_list(list(o))
+
+    def _encode_json_type(self, o) -> str:
+        serializer = JSON_TYPES.get(o.__class__)
+        if serializer is None:
+            # Removed from JSON_TYPES
+            del self._encoders[o.__class__]
+            return self._encode(o)
+        return self._encode(serializer(o))
+
+    def _type_encoder(self, cls: type) -> Callable[[Any], str]:
+        """Select an encoder for a type (other than the exact JSON types).
+
+        Follows the order of :py:class:`json.JSONEncoder`, sub-classes of JSON types
+        are encoded as the JSON type, then the order of :py:meth:`OdinEncoder.default`.
+        """
+        if issubclass(cls, str):
+            encoder = encode_basestring_ascii
+        elif issubclass(cls, int):
+            encoder = int.__repr__
+        elif issubclass(cls, float):
+            encoder = _float_str
+        elif issubclass(cls, list | tuple):
+            encoder = self._encode_list
+        elif issubclass(cls, dict):
+            encoder = self._encode_dict
+        elif issubclass(cls, resources.ResourceBase):
+            if cls.to_dict is resources.ResourceBase.to_dict:
+                encoder = self._resource_encoder(cls)
+            else:
+                encoder = self._encode_to_dict
+        elif issubclass(cls, ResourceAdapter):
+            encoder = self._encode_to_dict
+        elif issubclass(cls, LIST_TYPES):
+            encoder = self._encode_iterable
+        elif cls in JSON_TYPES:
+            encoder = self._encode_json_type
+        else:
+            msg = f"Object of type {cls.__name__} is not JSON serializable"
+            raise TypeError(msg)
+
+        self._encoders[cls] = encoder
+        return encoder
+
+    def _resource_encoder(self, resource_type: type) -> Callable[[Any], str]:
+        meta = getmeta(resource_type)
+        fields = meta.all_fields if self.include_virtual_fields else meta.fields
+        names = [field.name for field in fields]
+        if self.include_type_field:
+            names.append(meta.type_field)
+
+        if len(set(names)) != len(names):
+            # Duplicate keys; encode the dict so later values replace earlier ones
+            return self._encode_to_dict
+
+        return self._generate_resource_encoder(
+            fields,
+            *((meta.type_field, meta.resource_name) if self.include_type_field else ()),
+        )
+
+    def _generate_resource_encoder(
+        self, fields, type_field: str | None = None, resource_name=None
+    ) -> Callable[[Any], str]:
+        """Generate a function that encodes a resource.
+
+        The generated function has the signature::
+
+            encode(resource)
+
+        and returns the JSON encoded resource.
+        """
+        prefix = compiler.NAME_PREFIX
+        namespace = {
+            f"{prefix}encode": self._encode,
+            f"{prefix}encode_str": encode_basestring_ascii,
+            f"{prefix}int_str": int.__repr__,
+            f"{prefix}float_str": _float_str,
+            f"{prefix}bool_str": _SCALARS[bool],
+        }
+
+        def literal(text: str) -> str:
+            return text.replace("{", "{{").replace("}", "}}")
+
+        source = ["def encode(resource):"]
+        items = []
+        if type_field is not None:
+            items.append(
+                literal(
+                    f"{encode_basestring_ascii(type_field)}: "
+                    f"{encode_basestring_ascii(resource_name)}"
+                )
+            )
+
+        for idx, field in enumerate(fields):
+            source.append(
+                f"    value_{idx} = {compiler.field_value_source(field, idx, namespace)}"
+            )
+            value = f"value_{idx}"
+            native_type = _scalar_native_type(field)
+            if native_type is None:
+                encoded = f"{prefix}encode({value})"
+            else:
+                ref = f"{prefix}{native_type.__name__}"
+                namespace[ref] = native_type
+                encoded = (
+                    f"{prefix}{_FIELD_SCALARS[native_type]}({value}) "
+                    f"if {value}.__class__ is {ref} else {prefix}encode({value})"
+                )
+            items.append(
+                f"{literal(encode_basestring_ascii(field.name))}: {{{encoded}}}"
+            )
+
+        source.append(f"    return f'{{{{{', '.join(items)}}}}}'")
+        return compiler.build_function("encode", source, namespace)
+
+
+@functools.cache
+def _direct_encoder(include_virtual_fields=True, include_type_field=True):
+    return DirectEncoder(include_virtual_fields, include_type_field)
+
+
+_DIRECT_ENCODER_OPTIONS = frozenset(("include_virtual_fields", "include_type_field"))
+
+
+class JSONBackend:
+    """JSON backend using the standard library :py:mod:`json` module.
+
+    A backend provides the ``loads`` function and the encoder used by the codec
+    for the :py:class:`OdinEncoder` (when no other options are supplied). Other
+    backends fall back to this backend for any document they can not handle, so
+    the values loaded and the errors raised are the same for all backends.
+    """
+
+    name = "json"
+
+    def loads(self, s):
+        """Decode a JSON document; raises ``ValueError`` if the document is invalid."""
+        return json.loads(s)
+
+    def encoder(
+        self, include_virtual_fields=True, include_type_field=True
+    ) -> Callable[[Any], str]:
+        """Function that encodes a value into a JSON string."""
+        return _direct_encoder(include_virtual_fields, include_type_field).encode
+
+
+class OrjsonBackend(JSONBackend):
+    """JSON backend using :py:mod:`orjson` (if installed).
+
+    Odin types are encoded with :py:meth:`OdinEncoder.default` as the ``orjson``
+    default hook. The output is compact (without spaces after separators) and
+    UTF-8 rather than ASCII escaped, so the text differs from the standard library
+    backend (the values are the same); types supported natively by ``orjson``
+    (other than dates and times) are not passed to :py:const:`JSON_TYPES`.
+
+    Documents that ``orjson`` does not support (eg integers outside of the 64-bit
+    range, non-finite floats or circular references) are handled by the standard
+    library backend.
+    """
+
+    name = "orjson"
+
+    # orjson decodes integers outside of the 64-bit range as floats (rather than
+    # rejecting them) so documents are checked for a run of digits that may be
+    # such an integer; digits are translated to 9 (a single pass, much faster than
+    # a regex) and only a document with a run is checked with the regex.
+    _long_integer = "9" * 19
+    _digits = str.maketrans("0123456789", "9" * 10)
+    _digits_bytes = bytes.maketrans(b"0123456789", b"9" * 10)
+    _integer = re.compile(r'(?<![0-9.eE+"-])-?[0-9]{19,}(?![0-9.eE"])')
+    _integer_bytes = re.compile(rb'(?<![0-9.eE+"-])-?[0-9]{19,}(?![0-9.eE"])')
+
+    def __init__(self):
+        import orjson  # noqa: PLC0415
+
+        self._orjson = orjson
+
+    def _has_long_integer(self, s) -> bool:
+        """Check if a document may contain an integer outside of the 64-bit range."""
+        if isinstance(s, str):
+            if self._long_integer not in s.translate(self._digits):
+                return False
+            integers = self._integer.finditer(s)
+        else:
+            if self._long_integer.encode() not in s.translate(self._digits_bytes):
+                return False
+            integers = self._integer_bytes.finditer(s)
+        return any(not -(2**63) <= int(match.group()) < 2**64 for match in integers)
+
+    def loads(self, s):
+        orjson = self._orjson
+        if not self._has_long_integer(s):
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass  # Use the standard library to decode (or raise the same error)
+        return super().loads(s)
+
+    def encoder(
+        self, include_virtual_fields=True, include_type_field=True
+    ) -> Callable[[Any], str]:
+        orjson = self._orjson
+        dumps = orjson.dumps
+        odin_default = OdinEncoder(include_virtual_fields, include_type_field).default
+        resource_base = resources.ResourceBase
+
+        def default(o):
+            # Check the common types before OdinEncoder.default
+            if isinstance(o, resource_base):
+                return o.to_dict(include_virtual_fields, include_type_field)
+            json_type = JSON_TYPES.get(o.__class__)
+            if json_type is not None:
+                return json_type(o)
+            return odin_default(o)
+
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        fallback = super().encoder(include_virtual_fields, include_type_field)
+
+        def encode(o) -> str:
+            try:
+                data = dumps(o, default=default, option=option)
+            except orjson.JSONEncodeError:
+                # Use the standard library to encode (or raise the same error)
+                return fallback(o)
+            # orjson encodes non-finite floats as null
+            if b"null" in data and _has_non_finite_float(o, default):
+                return fallback(o)
+            return data.decode()
+
+        return encode
+
+
+def _has_non_finite_float(o, default) -> bool:
+    """Check if a value (encoded with the default hook) contains a non-finite float."""
+    pending = [o]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, list | tuple):
+            pending.extend(value)
+        elif not isinstance(value, str | int | None):
+            # Values not encoded by the default hook (eg enums) are skipped
+            with contextlib.suppress(TypeError):
+                pending.append(default(value))
+    return False
+
+
+BACKENDS: dict[str, type[JSONBackend]] = {
+    "json": JSONBackend,
+    "orjson": OrjsonBackend,
+}
+"""Available backends by name."""
+
+AUTO_PREFERENCE: Sequence[str] = ("orjson", "json")
+"""Names of backends in order of preference (fastest first) for the ``auto`` backend."""
+
+_backend_instances: dict[str, JSONBackend] = {}
+
+
+def _backend_instance(name: str) -> JSONBackend | None:
+    """Get (or create) an instance of a named backend; None if not installed."""
+    try:
+        return _backend_instances[name]
+    except KeyError:
+        pass
+
+    try:
+        backend_type = BACKENDS[name]
+    except KeyError:
+        msg = f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}"
+        raise ValueError(msg) from None
+
+    try:
+        backend = backend_type()
+    except ImportError:
+        return None
+    _backend_instances[name] = backend
+    return backend
+
+
+def available_backends() -> list[str]:
+    """Names of the backends that can be used (their dependencies are installed)."""
+    return [name for name in BACKENDS if _backend_instance(name) is not None]
+
+
+def get_backend(backend: str | JSONBackend | None = None) -> JSONBackend:
+    """Resolve a backend.
+
+    :param backend: A backend instance, the name of a backend or ``"auto"`` for the
+        first installed backend of :py:const:`AUTO_PREFERENCE` (the fastest); if not
+        supplied the current backend (see :py:func:`set_backend`) is returned. The
+        standard library backend is used if a named backend is not installed.
+    """
+    if backend is None:
+        return _current_backend
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend == "auto":
+        for name in AUTO_PREFERENCE:
+            instance = _backend_instance(name)
+            if instance is not None:
+                return instance
+        return _backend_instance("json")
+    return _backend_instance(backend) or _backend_instance("json")
+
+
+def set_backend(backend: str | JSONBackend | None = "json") -> JSONBackend:
+    """Set the backend used by the JSON codec (and JSON Lines codec).
+
+    .. code-block:: python
+
+        json_codec.set_backend("auto")  # Use the fastest installed backend
+
+    Backends load the same values, but the format of the output differs; the
+    ``orjson`` backend writes compact JSON (without spaces after separators) with
+    non-ASCII characters encoded as UTF-8 rather than escaped.
+
+    :param backend: A backend instance, the name of a backend or ``"auto"`` for the
+        fastest installed backend (see :py:func:`get_backend`); the standard library
+        backend is used if the named backend is not installed.
+    :returns: The backend now in use.
+    """
+    global _current_backend  # noqa: PLW0603
+    _current_backend = get_backend(backend or "json")
+    return _current_backend
+
+
+_current_backend = JSONBackend()
+
+
+def get_encoder(cls=OdinEncoder, *, backend=None, **kwargs) -> Callable[[Any], str]:
+    """Get a function that encodes a value into a JSON string.
+
+    The encoder of the backend is used for the :py:class:`OdinEncoder` when no
+    options (other than those of the ``OdinEncoder``) are supplied, otherwise an
+    instance of the encoder class is created (and the standard library used).
+
+    :param cls: Encoder to use serializing to a string.
+    :param backend: Backend to use (see :py:func:`get_backend`).
+    :param kwargs: Options passed to the encoder.
+    """
+    if cls is OdinEncoder and _DIRECT_ENCODER_OPTIONS.issuperset(kwargs):
+        return get_backend(backend).encoder(**kwargs)
+    return cls(**kwargs).encode
+
+
+class _TypedObject(dict):
+    """Object with a type field decoded by the single pass object hook.
+
+    Values of composite fields are replaced by the child resources; the resource
+    is created when the object is used by a field (see :py:class:`_SinglePass`).
+    """
+
+    __slots__ = ("resource_type",)
+
+
+class _SinglePass:
+    """Create resources as a document is decoded (see :py:func:`loads`).
+
+    The object hook replaces the values of ``DictAs``, ``ListOf`` and ``DictOf``
+    fields with resources created from the typed objects decoded within them (if
+    the field resolves the same type, as each resource would be created by the
+    field). Every typed object must be used by a field (or be the document);
+    if not (eg the object is the value of another type of field) the document
+    can not be built in a single pass.
+    """
+
+    __slots__ = ("_created", "_preparers", "_resource_types", "_used")
+
+    def __init__(self):
+        self._resource_types = {}
+        self._preparers = {}
+        self._created = 0
+        self._used = 0
+
+    def object_hook(self, d):
+        name = d.get(resources.DEFAULT_TYPE_FIELD)
+        if name is None:
+            return d
+
+        self._created += 1
+        try:
+            resource_type = self._resource_types[name]
+        except (KeyError, TypeError):
+            resource_type = self._resource_type(name)
+        if resource_type is not None:
+            self._preparer(resource_type)(d)
+
+        typed = _TypedObject(d)
+        typed.resource_type = resource_type
+        return typed
+
+    def _resource_type(self, name):
+        """Registered resource type of a typed object."""
+        if not (name and isinstance(name, str)):
+            return None
+        resource_type = self._resource_types[name] = registration.get_resource(name)
+        return resource_type
+
+    def _preparer(self, resource_type) -> Callable[[dict], None]:
+        """Function that replaces the values of the composite fields of an object
+        with resources."""
+        try:
+            return self._preparers[resource_type]
+        except KeyError:
+            pass
+
+        field_values = [
+            (field.name, self._field_value(kind, field))
+            for field in getmeta(resource_type).init_fields
+            if (kind := _RESOURCE_FIELD_KINDS.get(type(field).to_python))
+        ]
+
+        def prepare(d):
+            for name, field_value in field_values:
+                if name in d:
+                    d[name] = field_value(d[name])
+
+        self._preparers[resource_type] = prepare
+        return prepare
+
+    def _field_value(self, kind, field) -> Callable[[Any], Any]:
+        """Function that returns the value of a composite field with resources.
+
+        Resources are only used if every item is a resource (that can not fail to
+        convert); otherwise the value is returned unchanged.
+        """
+        resolved = {}
+
+        def resource(value):
+            """Resource created from a value if the same type is resolved by the field."""
+            if type(value) is not _TypedObject or value.resource_type is None:
+                return None
+
+            name = value[resources.DEFAULT_TYPE_FIELD]
+            try:
+                resource_type, from_dict, extra_attrs = resolved[name]
+            except KeyError:
+                of = field.of
+                try:
+                    resource_type = resources._resolve_type_from_resource(value, of)  # noqa: SLF001
+                except ValidationError:
+                    resource_type = from_dict = extra_attrs = None
+                else:
+                    from_dict = getmeta(resource_type).compiled_from_dict
+                    extra_attrs = (
+                        resource_type.extra_attrs
+                        is not resources.ResourceBase.extra_attrs
+                    )
+                # Types resolved from the (default) type field are cached by name
+                if getmeta(of).type_field == resources.DEFAULT_TYPE_FIELD:
+                    resolved[name] = resource_type, from_dict, extra_attrs
+
+            if resource_type is not value.resource_type:
+                return None
+
+            # The object is consumed, values that are not fields (including the
+            # type) are only kept if the resource handles extra attributes.
+            if extra_attrs:
+                value = dict(value)
+            else:
+                del value[resources.DEFAULT_TYPE_FIELD]
+            try:
+                return from_dict(resource_type, value, False, False)
+            except (ValidationError, ValueError, TypeError):
+                return None  # Raised again when built by the field
+
+        def dict_as(value):
+            built = resource(value)
+            if built is None:
+                return value
+            self._used += 1
+            return built
+
+        def list_of(value):
+            if type(value) is list:
+                items = [resource(item) for item in value]
+                if None not in items:
+                    self._used += len(items)
+                    return items
+            return value
+
+        def dict_of(value):
+            if type(value) is dict and not field.key_choices:
+                items = {key: resource(item) for key, item in value.items()}
+                if None not in items.values():
+                    self._used += len(items)
+                    return items
+            return value
+
+        return {"dict_as": dict_as, "list_of": list_of, "dict_of": dict_of}[kind]
+
+    def build(self, value, resource, full_clean, default_to_not_supplied):
+        """Build the decoded document (see :py:func:`odin.resources.build_object_graph`)."""
+        result = self._build(value, resource, full_clean, default_to_not_supplied)
+        if self._used != self._created:
+            msg = "Document can not be built in a single pass."
+            raise ValueError(msg)
+        return result
+
+    def _build(self, value, resource, full_clean, default_to_not_supplied):
+        value_type = type(value)
+        if value_type is list:
+            return [
+                self._build(item, resource, full_clean, default_to_not_supplied)
+                for item in value
+            ]
+
+        if value_type is _TypedObject:
+            self._used += 1
+            if (
+                resource
+                and resources._resolve_type_from_resource(value, resource)  # noqa: SLF001
+                is not value.resource_type
+            ):
+                msg = "Document can not be built in a single pass."
+                raise ValueError(msg)
+            value = dict(value)
+
+        elif value_type is dict and resource:
+            # Object without a type field; resources are created as for its fields
+            self._preparer(resources._resolve_type_from_resource(value, resource))(  # noqa: SLF001
+                value
+            )
+
+        elif value_type is not dict:
+            return value
+
+        return resources.create_resource_from_dict(
+            value, resource, full_clean, False, default_to_not_supplied, False
+        )
+
+
+def _loads_single_pass(s, resource, full_clean, default_to_not_supplied, max_errors):
+    """Decode and build resources in a single pass (see :py:func:`loads`).
+
+    Raises ``ValidationError`` (or ``ValueError``) if the document can not be
+    built in a single pass or is not valid.
+    """
+    single_pass = _SinglePass()
+    value = json.loads(s, object_hook=single_pass.object_hook)
+    if max_errors is None:
+        return single_pass.build(value, resource, full_clean, default_to_not_supplied)
+    with error_limit(max_errors):
+        return single_pass.build(value, resource, full_clean, default_to_not_supplied)
+
+
+def load(  # noqa: PLR0913
+    fp,
+    resource=None,
+    full_clean=True,
+    default_to_not_supplied=False,
+    lazy=False,
+    *,
+    max_errors=None,
+    single_pass=False,
+    backend=None,
+):
     """
     Load a from a JSON encoded file.
 
@@ -52,13 +765,40 @@ def load(fp, resource=None, full_clean=True, default_to_not_supplied=False):
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied: Used for loading partial resources. Any fields not
         supplied are replaced with NOT_SUPPLIED.
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
+    :param single_pass: Create resources as objects with a ``$`` type field are
+        decoded (see :py:meth:`loads`).
+    :param backend: JSON backend used to decode the file (see :py:func:`get_backend`).
     :returns: A resource object or object graph of resources loaded from file.
 
     """
-    return loads(fp.read(), resource, full_clean, default_to_not_supplied)
+    check_max_errors(max_errors)
+    return loads(
+        fp.read(),
+        resource,
+        full_clean,
+        default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
+        single_pass=single_pass,
+        backend=backend,
+    )
 
 
-def loads(s, resource=None, full_clean=True, default_to_not_supplied=False):
+def loads(  # noqa: PLR0913
+    s,
+    resource=None,
+    full_clean=True,
+    default_to_not_supplied=False,
+    lazy=False,
+    *,
+    max_errors=None,
+    single_pass=False,
+    backend=None,
+):
     """
     Load from a JSON encoded string.
 
@@ -75,19 +815,269 @@ def loads(s, resource=None, full_clean=True, default_to_not_supplied=False):
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied: Used for loading partial resources. Any fields not
         supplied are replaced with NOT_SUPPLIED.
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
+    :param single_pass: Create resources as the JSON is decoded; each object with a
+        ``$`` type field that is the value of a ``DictAs``, ``ListOf`` or ``DictOf``
+        field (or the document) is created when the parent object is decoded, so the
+        decoded document is not traversed a second time. Any document that can not
+        be built in a single pass (eg a typed object is the value of another type of
+        field) or is not valid is built again as normal, so the values returned and
+        errors raised are identical. Ignored if building lazy resources; documents
+        are always decoded with the standard library.
+    :param backend: JSON backend used to decode the string (see :py:func:`get_backend`).
     :returns: A resource object or object graph of resources parsed from supplied
         string.
 
     """
+    check_max_errors(max_errors)
+    if single_pass and not lazy:
+        try:
+            return _loads_single_pass(
+                s, resource, full_clean, default_to_not_supplied, max_errors
+            )
+        except (ValidationError, ValueError, TypeError):
+            pass  # Build again to raise the same errors as the two pass path
+
     try:
         return resources.build_object_graph(
-            json.loads(s), resource, full_clean, False, default_to_not_supplied
+            get_backend(backend).loads(s),
+            resource,
+            full_clean,
+            False,
+            default_to_not_supplied,
+            lazy,
+            max_errors=max_errors,
         )
     except (ValueError, TypeError) as ex:
         raise CodecDecodeError(str(ex)) from ex
 
 
-def dump(resource, fp, cls=OdinEncoder, **kwargs):
+class _ArrayReader:
+    """Incrementally read the values of a JSON array from a file pointer.
+
+    Text is read in chunks and each value decoded with ``JSONDecoder.raw_decode``;
+    only the text of the value being decoded (and the current chunk) is held in
+    memory.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_chunk_size",
+        "_decode",
+        "_decoder",
+        "_depth",
+        "_eof",
+        "_fp",
+        "_idx",
+    )
+
+    def __init__(self, fp, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decode = json.JSONDecoder().raw_decode
+        self._decoder = None
+        self._buffer = ""
+        self._idx = 0
+        self._eof = False
+        self._depth = 0
+
+    def _read(self, size: int):
+        """Read at least size more characters (unless the end of file is reached)."""
+        # Drop the text that has already been consumed
+        parts = [self._buffer[self._idx :]]
+        self._idx = 0
+        remaining = size
+        while remaining > 0 and not self._eof:
+            chunk = self._fp.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+            if isinstance(chunk, bytes):
+                if self._decoder is None:
+                    self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+                chunk = self._decoder.decode(chunk, final=self._eof)
+            parts.append(chunk)
+            remaining -= len(chunk)
+        self._buffer = "".join(parts)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end of file)."""
+        while True:
+            self._idx = _WHITESPACE(self._buffer, self._idx).end()
+            if self._idx < len(self._buffer):
+                return self._buffer[self._idx]
+            if self._eof:
+                return ""
+            self._read(self._chunk_size)
+
+    def expect(self, char: str):
+        """Consume the next character, which must be char."""
+        found = self.peek()
+        if found != char:
+            msg = f"Expecting {char!r} (found {found or 'EOF'!r})"
+            raise CodecDecodeError(msg)
+        self._idx += 1
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        if not self.peek():
+            msg = "Expecting value (found 'EOF')"
+            raise CodecDecodeError(msg)
+        while True:
+            try:
+                value, end = self._decode(self._buffer, self._idx)
+            except json.JSONDecodeError as ex:
+                if self._eof or not self._incomplete(ex):
+                    # Positions are relative to the buffer so only report the message
+                    raise CodecDecodeError(ex.msg) from ex
+                # At least double the text available
+                self._read(max(len(self._buffer) - self._idx, self._chunk_size))
+                continue
+
+            # A number at the end of the text may be truncated (eg "1" of "1.5")
+            tail = _NUMBER_TAIL(self._buffer, end).end()
+            if tail == len(self._buffer) and not self._eof:
+                self._read(self._chunk_size)
+                continue
+
+            self._idx = end
+            return value
+
+    def _incomplete(self, ex: json.JSONDecodeError) -> bool:
+        """Check if a decode error may be caused by the end of the buffer.
+
+        The error of a truncated value is either at the end of the buffer or at
+        the start of a token (eg a string, number or literal) that runs to the end.
+        """
+        buffer = self._buffer
+        return (
+            ex.pos >= len(buffer)
+            or ex.msg.startswith("Unterminated string")
+            or _TOKEN_TAIL(buffer, ex.pos).end() == len(buffer)
+        )
+
+    def seek(self, path: Sequence[str]):
+        """Move to the value of a path of keys into nested objects."""
+        self._depth = len(path)
+        for key in path:
+            self.expect("{")
+            while self.peek() != "}":
+                name = self.value()
+                self.expect(":")
+                if name == key:
+                    break
+                self.value()  # Skip the value
+                if self.peek() != "}":
+                    self.expect(",")
+            else:
+                msg = f"Key {key!r} of path not found"
+                raise CodecDecodeError(msg)
+
+    def items(self) -> Iterator[Any]:
+        """Iterate the values of the array and check the rest of the document."""
+        self.expect("[")
+        if self.peek() != "]":
+            while True:
+                yield self.value()
+                if self.peek() == "]":
+                    break
+                self.expect(",")
+        self._idx += 1
+        self._end()
+
+    def _end(self):
+        """Skip the rest of the objects that contain the array; the end of file must follow."""
+        for _ in range(self._depth):
+            while self.peek() != "}":
+                self.expect(",")
+                self.value()
+                self.expect(":")
+                self.value()
+            self._idx += 1
+        found = self.peek()
+        if found:
+            msg = f"Expecting EOF (found {found!r})"
+            raise CodecDecodeError(msg)
+
+
+def iterload(  # noqa: PLR0913
+    fp,
+    resource=None,
+    full_clean=True,
+    default_to_not_supplied=False,
+    *,
+    path: str | Sequence[str] | None = None,
+    chunk_size: int = 64 * 1024,
+    max_errors=None,
+) -> Iterator:
+    """
+    Load resources from a JSON encoded array one at a time.
+
+    The file is parsed incrementally and each item of the array is loaded as it
+    is read, so memory use is bounded by the size of the largest item rather than
+    the size of the document. Items are loaded as for :py:meth:`loads`, any
+    ``ValidationError`` is raised when the invalid item is reached.
+
+    .. code-block:: python
+
+        with open("books.json") as f:
+            for book in json_codec.iterload(f, Book):
+                ...
+
+    :param fp: a file pointer (text or binary) to read JSON data from.
+    :param resource: A resource type, resource name or list of resources and names to
+        use as the base for creating each resource.
+    :param full_clean: Do a full clean of each resource as part of the loading process.
+    :param default_to_not_supplied: Used for loading partial resources. Any fields not
+        supplied are replaced with NOT_SUPPLIED.
+    :param path: Keys (or a ``.`` separated string of keys) of nested objects to the
+        array, eg ``"data.books"``; the document must be an array if not supplied.
+    :param chunk_size: Size of the chunks read from the file.
+    :param max_errors: Stop validating an item once this many errors have been found.
+    :returns: An iterator of resource objects (or values if the items are not objects).
+
+    """
+    check_max_errors(max_errors)
+    if isinstance(path, str):
+        path = path.split(".")
+    return _iterload(
+        _ArrayReader(fp, chunk_size),
+        path or (),
+        resource,
+        full_clean=full_clean,
+        default_to_not_supplied=default_to_not_supplied,
+        max_errors=max_errors,
+    )
+
+
+def _iterload(  # noqa: PLR0913
+    reader: _ArrayReader,
+    path: Sequence[str],
+    resource,
+    *,
+    full_clean,
+    default_to_not_supplied,
+    max_errors,
+) -> Iterator:
+    """Generator of the items loaded by :py:func:`iterload`."""
+    reader.seek(path)
+    for item in reader.items():
+        try:
+            yield resources.build_object_graph(
+                item,
+                resource,
+                full_clean,
+                False,
+                default_to_not_supplied,
+                max_errors=max_errors,
+            )
+        except (ValueError, TypeError) as ex:
+            raise CodecDecodeError(str(ex)) from ex
+
+
+def dump(resource, fp, cls=OdinEncoder, *, backend=None, **kwargs):
     """
     Dump to a JSON encoded file.
 
@@ -95,25 +1085,32 @@ def dump(resource, fp, cls=OdinEncoder, **kwargs):
     :param cls: Encoder to use serializing to a string; default is the
         :py:class:`OdinEncoder`.
     :param fp: The file pointer that represents the output file.
+    :param backend: JSON backend used to encode the resource (see
+        :py:func:`get_backend`); only used with the ``OdinEncoder``.
 
     """
     try:
-        json.dump(resource, fp, cls=cls, **kwargs)
+        if cls is OdinEncoder and _DIRECT_ENCODER_OPTIONS.issuperset(kwargs):
+            fp.write(get_encoder(backend=backend, **kwargs)(resource))
+        else:
+            json.dump(resource, fp, cls=cls, **kwargs)
     except ValueError as ex:
         raise CodecEncodeError(str(ex)) from ex
 
 
-def dumps(resource, cls=OdinEncoder, **kwargs):
+def dumps(resource, cls=OdinEncoder, *, backend=None, **kwargs):
     """
     Dump to a JSON encoded string.
 
     :param resource: The root resource to dump to a JSON encoded file.
     :param cls: Encoder to use serializing to a string; default is the
         :py:class:`OdinEncoder`.
+    :param backend: JSON backend used to encode the resource (see
+        :py:func:`get_backend`); only used with the ``OdinEncoder``.
     :returns: JSON encoded string.
 
     """
     try:
-        return json.dumps(resource, cls=cls, **kwargs)
+        return get_encoder(cls, backend=backend, **kwargs)(resource)
     except ValueError as ex:
         raise CodecEncodeError(str(ex)) from ex
@@ -0,0 +1,198 @@
+"""
+JSON Lines Codec
+~~~~~~~~~~~~~~~~
+
+Codec for iterating a JSON Lines (newline delimited JSON) file and parsing each
+line into a Resource.
+
+Like the CSV codec the JSON Lines codec yields multiple resources rather than a
+single document, unlike CSV each line can contain nested resources.
+
+Reading data from a JSON Lines file::
+
+    with open("my_file.jsonl") as f:
+        for resource in jsonl_codec.reader(f, MyResource):
+            ...
+
+Writing data to a JSON Lines file::
+
+    with open("my_file.jsonl", "w") as f:
+        jsonl_codec.dump(f, resources)
+
+"""
+
+from io import StringIO
+
+from odin import bases
+from odin.codecs.json_codec import OdinEncoder, get_backend, get_encoder
+from odin.exceptions import CodecDecodeError, CodecEncodeError, ValidationError
+from odin.resources import build_object_graph
+
+CONTENT_TYPE = "application/x-ndjson"
+
+
+class Reader(bases.TypedResourceIterable):
+    """
+    Customisable reader object.
+    """
+
+    default_to_not_supplied = False
+    """
+    Used for loading partial resources. Any fields not supplied are replaced with
+    NOT_SUPPLIED.
+    """
+
+    backend = None
+    """
+    JSON backend used to decode each line; defaults to the backend of the JSON codec
+    (see :py:func:`odin.codecs.json_codec.get_backend`).
+    """
+
+    def __init__(self, f, resource_type, full_clean=True, error_callback=None):
+        """
+        Initialise a reader
+
+        :param f: Input file (or file like) object to read, text or binary.
+        :param resource_type: Resource type (or list of types) to create from each line.
+        :param full_clean: Perform a full clean on objects
+        :param error_callback: Optional callback for errors
+
+        """
+        super().__init__(resource_type)
+        self._f = f
+        self.full_clean = full_clean
+        if error_callback:
+            self.handle_validation_error = error_callback
+
+        # Built in counters
+        self.row_count = None
+        self.error_count = None
+
+    def __iter__(self):
+        # Reset error count
+        self.error_count = 0
+
+        # Local vars
+        resource = self.resource_type
+        full_clean = self.full_clean
+        default_to_not_supplied = self.default_to_not_supplied
+        handle_validation_error = getattr(self, "handle_validation_error", None)
+        loads = get_backend(self.backend).loads
+        row_count = 0
+
+        for idx, line in enumerate(self._f):
+            # Skip blank lines (eg a trailing new line)
+            if not line.strip():
+                continue
+            row_count += 1
+
+            try:
+                data = loads(line)
+            except ValueError as ex:
+                msg = f"Line {idx + 1}: {ex}"
+                raise CodecDecodeError(msg) from ex
+
+            # Resources are created outside of yield so exceptions raised by the
+            # consumer are not handled as validation errors.
+            try:
+                result = build_object_graph(
+                    data, resource, full_clean, False, default_to_not_supplied
+                )
+            except ValidationError as ve:
+                self.error_count += 1
+                if not handle_validation_error:
+                    raise
+                # If handle error explicitly returns False raise exception
+                if handle_validation_error(ve, idx) is False:
+                    raise
+                continue
+            except (ValueError, TypeError) as ex:
+                msg = f"Line {idx + 1}: {ex}"
+                raise CodecDecodeError(msg) from ex
+
+            yield result
+
+        self.row_count = row_count
+
+
+def reader(f, resource, full_clean=True, error_callback=None):
+    """
+    JSON Lines reader that returns resource objects
+
+    :param f: file like object (text or binary)
+    :param resource: Resource type (or list of types) to create from each line.
+    :param full_clean: Perform a full clean on each object
+    :param error_callback: Callback called with the validation error and line index
+        of an invalid line; the error is raised if the callback returns ``False``
+        (or no callback is supplied).
+    :return: Iterable reader object
+    :rtype: Reader
+
+    """
+    return Reader(f, resource, full_clean, error_callback)
+
+
+def _check_single_line(kwargs):
+    """Encoder options must write each resource to a single line."""
+    if kwargs.get("indent") is not None:
+        msg = "indent can not be used with JSON Lines; each resource is a single line."
+        raise ValueError(msg)
+    if any("\n" in separator for separator in kwargs.get("separators") or ()):
+        msg = "separators can not contain a new line with JSON Lines."
+        raise ValueError(msg)
+
+
+def dump(f, resources, cls=OdinEncoder, batch_size=256, *, backend=None, **kwargs):
+    """
+    Dump resources into a JSON Lines file.
+
+    Resources are encoded as they are iterated (so lazy iterables eg a
+    :py:class:`odin.mapping.MappingResult` are not evaluated up front) and lines
+    written to the file in batches.
+
+    :param f: File to dump to.
+    :param resources: Collection (or any :py:class:`odin.bases.ResourceIterable`) of
+        resources to dump.
+    :param cls: Encoder to use serializing each resource; default is the
+        :py:class:`odin.codecs.json_codec.OdinEncoder`.
+    :param batch_size: Number of lines encoded before being written to the file.
+    :param backend: JSON backend used to encode each resource (see
+        :py:func:`odin.codecs.json_codec.get_backend`).
+    :param kwargs: Additional parameters to be supplied to the encoder instance; as
+        each resource is written to a single line ``indent`` (or ``separators`` that
+        contain a new line) raises ``ValueError``.
+
+    """
+    _check_single_line(kwargs)
+    encode = get_encoder(cls, backend=backend, **kwargs)
+    lines = []
+    try:
+        for resource in resources:
+            lines.append(encode(resource))
+            lines.append("\n")
+            if len(lines) >= batch_size * 2:
+                f.write("".join(lines))
+                lines = []
+    except ValueError as ex:
+        raise CodecEncodeError(str(ex)) from ex
+    finally:
+        # Write any lines encoded before the end (or an error)
+        if lines:
+            f.write("".join(lines))
+
+
+def dumps(resources, cls=OdinEncoder, *, backend=None, **kwargs):
+    """
+    Dump resources to a JSON Lines string.
+
+    :param resources: Collection of resources to dump.
+    :param cls: Encoder to use serializing each resource; default is the
+        :py:class:`odin.codecs.json_codec.OdinEncoder`.
+    :param backend: JSON backend used to encode each resource.
+    :param kwargs: Additional parameters to be supplied to the encoder instance.
+    :returns: JSON Lines encoded string.
+
+    """
+    buf = StringIO()
+    dump(buf, resources, cls=cls, backend=backend, **kwargs)
+    return buf.getvalue()
@@ -12,6 +12,7 @@ except ImportError:
     ) from None  # noqa
 
 from odin import ResourceAdapter, bases, resources, serializers
+from odin.exceptions import check_max_errors
 
 TYPE_SERIALIZERS = {
     datetime.date: serializers.date_iso_format,
@@ -41,11 +42,14 @@ class OdinPacker(msgpack.Packer):
             return TYPE_SERIALIZERS[o.__class__](o)
 
 
-def load(
+def load(  # noqa: PLR0913
     fp: TextIO,
     resource: resources.ResourceBase = None,
     full_clean: bool = True,
     default_to_not_supplied: bool = False,
+    lazy: bool = False,
+    *,
+    max_errors: int | None = None,
 ):
     """Load a from a MessagePack encoded file.
 
@@ -56,18 +60,32 @@ def load(
         creating a resource.
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied:
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
     :returns: A resource object or object graph of resources loaded from file.
     """
+    check_max_errors(max_errors)
     return resources.build_object_graph(
-        msgpack.load(fp), resource, full_clean, default_to_not_supplied
+        msgpack.load(fp),
+        resource,
+        full_clean,
+        False,
+        default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
     )
 
 
-def loads(
+def loads(  # noqa: PLR0913
     s: str,
     resource: resources.ResourceBase = None,
     full_clean: bool = True,
     default_to_not_supplied: bool = False,
+    lazy: bool = False,
+    *,
+    max_errors: int | None = None,
 ):
     """Load from a MessagePack encoded string/bytes.
 
@@ -83,11 +101,22 @@ def loads(
         creating a resource.
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied:
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
     :returns: A resource object or object graph of resources parsed from supplied
         string.
     """
+    check_max_errors(max_errors)
     return resources.build_object_graph(
-        msgpack.loads(s), resource, full_clean, False, default_to_not_supplied
+        msgpack.loads(s),
+        resource,
+        full_clean,
+        False,
+        default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
     )
 
 
@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 
 from odin import ResourceAdapter, resources
-from odin.exceptions import CodecDecodeError
+from odin.exceptions import CodecDecodeError, check_max_errors
 from odin.resources import ResourceBase
 
 try:
@@ -16,7 +16,15 @@ TOML_TYPES = {}
 CONTENT_TYPE = "application/toml"
 
 
-def load(fp, resource=None, full_clean=True, default_to_not_supplied=False):
+def load(  # noqa: PLR0913
+    fp,
+    resource=None,
+    full_clean=True,
+    default_to_not_supplied=False,
+    lazy=False,
+    *,
+    max_errors=None,
+):
     """
     Load a resource from a TOML encoded file.
 
@@ -34,10 +42,14 @@ def load(fp, resource=None, full_clean=True, default_to_not_supplied=False):
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied: Used for loading partial resources. Any fields not
         supplied are replaced with NOT_SUPPLIED.
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
     :returns: A resource object or object graph of resources loaded from file.
 
     """
-
+    check_max_errors(max_errors)
     try:
         data = toml.load(fp)
     except toml.TomlDecodeError as ex:
@@ -49,10 +61,20 @@ def load(fp, resource=None, full_clean=True, default_to_not_supplied=False):
         full_clean,
         False,
         default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
     )
 
 
-def loads(s, resource=None, full_clean=True, default_to_not_supplied=False):
+def loads(  # noqa: PLR0913
+    s,
+    resource=None,
+    full_clean=True,
+    default_to_not_supplied=False,
+    lazy=False,
+    *,
+    max_errors=None,
+):
     """Load a resource from a TOML encoded string.
 
     If a ``resource`` value is supplied it is used as the base resource for the
@@ -68,10 +90,14 @@ def loads(s, resource=None, full_clean=True, default_to_not_supplied=False):
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied: Used for loading partial resources. Any fields not
         supplied are replaced with NOT_SUPPLIED.
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
     :returns: A resource object or object graph of resources loaded from file.
 
     """
-
+    check_max_errors(max_errors)
     try:
         data = toml.loads(s)
     except toml.TomlDecodeError as ex:
@@ -83,6 +109,8 @@ def loads(s, resource=None, full_clean=True, default_to_not_supplied=False):
         full_clean,
         False,
         default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
     )
 
 
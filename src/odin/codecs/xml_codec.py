@@ -37,6 +37,8 @@ class TextField(StringField):
     Special String field for representing XML text blocks.
     """
 
+    __slots__ = ()
+
 
 def _serialize_to_string(value):
     if value.__class__ in XML_TYPES:
@@ -4,7 +4,7 @@ from io import StringIO
 from typing import TextIO
 
 from odin import ResourceAdapter, bases, resources
-from odin.exceptions import CodecEncodeError
+from odin.exceptions import CodecEncodeError, check_max_errors
 
 try:
     import yaml
@@ -47,11 +47,14 @@ OdinDumper.add_multi_representer(ResourceAdapter, OdinDumper.represent_resource)
 OdinDumper.add_multi_representer(bases.ResourceIterable, OdinDumper.represent_list)
 
 
-def load(
+def load(  # noqa: PLR0913
     fp: TextIO | str,
     resource: resources.ResourceBase = None,
     full_clean: bool = True,
     default_to_not_supplied: bool = False,
+    lazy: bool = False,
+    *,
+    max_errors: int | None = None,
 ):
     """Load a resource from a YAML encoded file.
 
@@ -68,9 +71,14 @@ def load(
     :param full_clean: Do a full clean of the object as part of the loading process.
     :param default_to_not_supplied: Used for loading partial resources. Any fields not
         supplied are replaced with NOT_SUPPLIED.
+    :param lazy: Build lazy resources; field values are only converted when first
+        accessed and validation is deferred until ``full_clean`` is called.
+    :param max_errors: Stop validating once this many errors have been found; use 1
+        to fail fast on the first error. The default of ``None`` collects all errors.
     :returns: A resource object or object graph of resources loaded from file.
 
     """
+    check_max_errors(max_errors)
     return resources.build_object_graph(
         #  The SafeLoader is used here, this is to allow for CSafeLoader to be used.
         yaml.load(fp, SafeLoader),  # nosec - B506:yaml_load
@@ -78,6 +86,8 @@ def load(
         full_clean,
         False,
         default_to_not_supplied,
+        lazy,
+        max_errors=max_errors,
     )
 
 
@@ -0,0 +1,610 @@
+"""
+Compiler
+~~~~~~~~
+
+Generation of resource specific functions.
+
+The generic implementations on :py:class:`odin.resources.ResourceBase` have
+to inspect the resource meta data on every call. Resources are defined once
+and used many times, so the functions in this module build specialised
+versions (with field names, defaults and converters resolved up front) that
+can be installed on a resource type.
+
+"""
+
+import functools
+import inspect
+import keyword
+import operator
+import types
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+from odin.exceptions import (
+    ValidationError,
+    ValidationResult,
+    error_limit_reached,
+    release_errors,
+)
+from odin.fields import BaseField, Field, NotProvided, trusted_native_types
+
+# Prefix used for any names injected into the namespace of generated code.
+# Field names are rejected if they collide with this prefix.
+NAME_PREFIX = "__odin_"
+
+# Names used by generated code that can not be used for field names.
+RESERVED_NAMES = frozenset(("self", "args", "kwargs"))
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(code: str, name: str) -> types.CodeType:
+    """Compile source code; resources with the same fields share generated code."""
+    return compile(code, f"<odin generated {name}>", "exec")
+
+
+def build_function(
+    name: str, source: Sequence[str], namespace: dict[str, Any]
+) -> Callable:
+    """Compile the source lines of a function and return the function object.
+
+    :param name: Name of the function defined by source.
+    :param source: Lines of source code that define the function.
+    :param namespace: Global namespace the function is compiled within.
+    """
+    code = "\n".join(source)
+    exec(_compile(code, name), namespace)  # noqa: S102
+    func = namespace[name]
+    func.__odin_source__ = code
+    return func
+
+
+def is_valid_name(name: str | None) -> bool:
+    """Name can be used as an identifier in generated code."""
+    return bool(
+        name
+        and name.isidentifier()
+        and not keyword.iskeyword(name)
+        and not name.startswith(NAME_PREFIX)
+        and name not in RESERVED_NAMES
+    )
+
+
+def deferred(func: Callable) -> Callable:
+    """Mark a function as a placeholder for a function generated on first call.
+
+    The placeholder is responsible for generating (and installing) the function.
+    """
+    func.__odin_deferred__ = True
+    return func
+
+
+def is_generated(func) -> bool:
+    """Function was generated by this module (or is a placeholder for one)."""
+    return hasattr(func, "__odin_source__") or hasattr(func, "__odin_deferred__")
+
+
+def default_expression(field: Field, namespace: dict[str, Any], ref: str) -> str:
+    """Generate an expression that produces the default value for a field.
+
+    Constant defaults are inlined (as a reference in the namespace), callable
+    defaults are called and fields that customise ``get_default`` fall back to
+    calling the method.
+    """
+    field_type = type(field)
+    if (
+        field_type.get_default is not Field.get_default
+        or field_type.has_default is not Field.has_default
+    ):
+        namespace[ref] = field.get_default
+        return f"{ref}()"
+
+    default = field.default
+    if default is NotProvided:
+        return "None"
+
+    namespace[ref] = default
+    return f"{ref}()" if callable(default) else ref
+
+
+def generate_init(
+    resource_type: type,
+    fields: Sequence[Field],
+    generic_init: Callable,
+    frozen: bool = False,
+) -> Callable | None:
+    """Generate an ``__init__`` method for the supplied resource fields.
+
+    The generated method matches the behaviour of ``ResourceBase.__init__``;
+    positional arguments are assigned in field order and take precedence over
+    keyword arguments, keyword arguments are matched by attribute name and any
+    remaining fields are assigned their default value.
+
+    Fields are accepted as positional only parameters, this ensures the
+    handling of values supplied both positionally and by keyword is unchanged.
+
+    Sub-classes that reach the generated method (eg via ``super().__init__``)
+    are handed to the generic init as their fields may differ.
+
+    :param resource_type: Resource type the init is being generated for.
+    :param fields: Fields used to initialise the resource.
+    :param generic_init: Generic init used for sub-classes.
+    :param frozen: Resource is frozen, values are assigned with
+        ``object.__setattr__``.
+    :returns: Generated init method or ``None`` if an init could not be
+        generated for these fields.
+
+    """
+    attnames = [f.attname for f in fields]
+    if len(set(attnames)) != len(attnames) or not all(
+        is_valid_name(name) for name in attnames
+    ):
+        # Shadowed fields (duplicate names) and names that are not valid
+        # identifiers rely on the generic init.
+        return None
+
+    missing = f"{NAME_PREFIX}missing"
+    namespace = {
+        missing: _MISSING,
+        f"{NAME_PREFIX}resource_type": resource_type,
+        f"{NAME_PREFIX}generic_init": generic_init,
+        f"{NAME_PREFIX}setattr": object.__setattr__,
+        # Builtins are aliased as field names (parameters) would shadow them
+        f"{NAME_PREFIX}len": len,
+        f"{NAME_PREFIX}next": next,
+        f"{NAME_PREFIX}iter": iter,
+        f"{NAME_PREFIX}TypeError": TypeError,
+    }
+    field_count = len(fields)
+
+    params = "".join(f"{name}={missing}, " for name in attnames)
+    values = "".join(f"{name}, " for name in attnames)
+    source = [
+        f"def __init__(self, {params}{'/, ' if params else ''}*args, **kwargs):",
+        f"    if self.__class__ is not {NAME_PREFIX}resource_type:",
+        f"        return {NAME_PREFIX}generic_init(",
+        "            self,",
+        f"            *[value for value in ({values}) if value is not {missing}],",
+        "            *args,",
+        "            **kwargs,",
+        "        )",
+        "    if args:",
+        f"        raise {NAME_PREFIX}TypeError(",
+        f'            f"This resource takes {field_count} positional "',
+        f'            f"arguments but {{{field_count} + {NAME_PREFIX}len(args)}} where given."',
+        "        )",
+        "    if kwargs:",
+    ]
+    for field in fields:
+        name = field.attname
+        source += [
+            f"        if {name} is {missing}:",
+            f"            {name} = kwargs.pop({name!r}, {missing})",
+            "        else:",
+            f"            kwargs.pop({field.name!r}, None)",
+        ]
+    source += [
+        "        if kwargs:",
+        f"            raise {NAME_PREFIX}TypeError(",
+        f"                f\"'{{{NAME_PREFIX}next({NAME_PREFIX}iter(kwargs))}}' \"",
+        '                "is an invalid keyword argument for this function"',
+        "            )",
+    ]
+    for idx, field in enumerate(fields):
+        name = field.attname
+        default = default_expression(field, namespace, f"{NAME_PREFIX}default_{idx}")
+        source += [
+            f"    if {name} is {missing}:",
+            f"        {name} = {default}",
+        ]
+    if frozen:
+        source += [
+            f"    {NAME_PREFIX}setattr(self, {name!r}, {name})" for name in attnames
+        ]
+    else:
+        source += [f"    self.{name} = {name}" for name in attnames]
+
+    return build_function("__init__", source, namespace)
+
+
+def native_types(field: Field) -> tuple[type, ...]:
+    """Types that the ``to_python`` method of a field returns unchanged.
+
+    See :py:func:`odin.fields.trusted_native_types`.
+    """
+    return trusted_native_types(type(field))
+
+
+def _from_dict_namespace() -> dict[str, Any]:
+    return {
+        f"{NAME_PREFIX}not_provided": NotProvided,
+        f"{NAME_PREFIX}ValidationError": ValidationError,
+        f"{NAME_PREFIX}ValidationResult": ValidationResult,
+        f"{NAME_PREFIX}error_limit_reached": error_limit_reached,
+        f"{NAME_PREFIX}release_errors": release_errors,
+    }
+
+
+def _from_dict_values(
+    fields: Sequence[Field], namespace: dict[str, Any], limit_reached: Sequence[str]
+) -> list[str]:
+    """Source that pops and converts the value of each field from ``d``.
+
+    :param fields: Fields used to initialise the resource.
+    :param namespace: Namespace of the generated function.
+    :param limit_reached: Source executed once the error limit is reached.
+    """
+    missing = f"{NAME_PREFIX}not_provided"
+    validation_error = f"{NAME_PREFIX}ValidationError"
+    source = [
+        "    errors = {}",
+        "    pop = d.pop",
+    ]
+    for idx, field in enumerate(fields):
+        name = field.name
+        target = f"value_{idx}"
+        to_python = f"{NAME_PREFIX}to_python_{idx}"
+        namespace[to_python] = field.to_python
+
+        if field.use_default_if_not_provided:
+            ref = f"{NAME_PREFIX}default_{idx}"
+            default = default_expression(field, namespace, ref)
+        else:
+            default = "None"
+
+        source += [
+            f"    {target} = pop({name!r}, {missing})",
+            f"    if {target} is {missing}:",
+            "        if not default_to_not_provided:",
+            f"            {target} = {default}",
+        ]
+
+        types = native_types(field)
+        if len(types) == 1:
+            ref = f"{NAME_PREFIX}native_{idx}"
+            namespace[ref] = types[0]
+            source.append(f"    elif type({target}) is {ref}:")
+            source.append("        pass")
+        elif types:
+            ref = f"{NAME_PREFIX}native_{idx}"
+            namespace[ref] = frozenset(types)
+            source.append(f"    elif type({target}) in {ref}:")
+            source.append("        pass")
+
+        source += [
+            "    else:",
+            "        try:",
+            f"            {target} = {to_python}({target})",
+            f"        except {validation_error} as ve:",
+            f"            errors[{name!r}] = ve.error_messages",
+            *(f"            {line}" for line in limit_reached),
+        ]
+
+    return source
+
+
+def generate_from_dict(fields: Sequence[Field]) -> Callable:
+    """Generate a function that creates a resource from a dict.
+
+    The generated function has the signature::
+
+        from_dict(resource_type, d, full_clean, default_to_not_provided)
+
+    and matches the behaviour of ``create_resource_from_dict`` once the resource
+    type has been resolved; values are popped from ``d`` (any remaining values
+    are passed to ``extra_attrs``), converted with ``to_python`` (skipped if the
+    value is already a native type of the field) and any errors aggregated
+    (up to the active error limit, see ``odin.exceptions.error_limit``).
+
+    :param fields: Fields used to initialise the resource.
+
+    """
+    validation_error = f"{NAME_PREFIX}ValidationError"
+    namespace = _from_dict_namespace()
+    source = [
+        "def from_dict(resource_type, d, full_clean, default_to_not_provided):",
+        *_from_dict_values(
+            fields,
+            namespace,
+            [
+                f"if {NAME_PREFIX}error_limit_reached(ve) and full_clean:",
+                f"    raise {validation_error}(errors)",
+            ],
+        ),
+    ]
+
+    values = ", ".join(f"value_{idx}" for idx in range(len(fields)))
+    source += [
+        "    if errors:",
+        "        if full_clean:",
+        f"            raise {validation_error}(errors)",
+        "        # Values are validated again by a later full clean",
+        f"        {NAME_PREFIX}release_errors(errors)",
+        f"    new_resource = resource_type({values})",
+        "    if d:",
+        "        new_resource.extra_attrs(d)",
+        "    if full_clean:",
+        "        new_resource.full_clean()",
+        "    return new_resource",
+    ]
+
+    return build_function("from_dict", source, namespace)
+
+
+def generate_try_from_dict(
+    fields: Sequence[Field], full_clean_errors: Callable[[Any], Any]
+) -> Callable:
+    """Generate a function that creates and validates a resource from a dict
+    without raising ``ValidationError``.
+
+    The generated function has the signature::
+
+        try_from_dict(resource_type, d, default_to_not_provided)
+
+    and returns a :py:class:`odin.exceptions.ValidationResult` with either the
+    new resource or the errors that ``from_dict`` (with ``full_clean``) would
+    have raised.
+
+    :param fields: Fields used to initialise the resource.
+    :param full_clean_errors: Callable that returns the errors from a full clean
+        of the new resource (``None`` if the resource is valid).
+
+    """
+    result = f"{NAME_PREFIX}ValidationResult"
+    namespace = _from_dict_namespace()
+    namespace[f"{NAME_PREFIX}full_clean_errors"] = full_clean_errors
+    source = [
+        "def try_from_dict(resource_type, d, default_to_not_provided):",
+        *_from_dict_values(
+            fields,
+            namespace,
+            [
+                f"if {NAME_PREFIX}error_limit_reached(ve):",
+                f"    return {result}(None, errors)",
+            ],
+        ),
+    ]
+
+    values = ", ".join(f"value_{idx}" for idx in range(len(fields)))
+    source += [
+        "    if errors:",
+        f"        return {result}(None, errors)",
+        f"    new_resource = resource_type({values})",
+        "    if d:",
+        "        new_resource.extra_attrs(d)",
+        f"    errors = {NAME_PREFIX}full_clean_errors(new_resource)",
+        "    if errors is not None:",
+        f"        return {result}(None, errors)",
+        f"    return {result}(new_resource)",
+    ]
+
+    return build_function("try_from_dict", source, namespace)
+
+
+def _is_direct_read(field: BaseField) -> bool:
+    """Field value can be read directly from the resource attribute."""
+    return type(field).value_from_object is BaseField.value_from_object
+
+
+def _is_identity_prepare(field: BaseField) -> bool:
+    """Field prepare returns the value unchanged."""
+    return type(field).prepare is BaseField.prepare
+
+
+def field_reader(field: BaseField) -> Callable[[Any], Any]:
+    """Generate a callable that returns the prepared value of a field.
+
+    Equivalent to ``field.prepare(field.value_from_object(resource))`` with
+    the ``value_from_object`` and ``prepare`` calls skipped where they would
+    be no-ops.
+    """
+    get_value = (
+        operator.attrgetter(field.attname)
+        if _is_direct_read(field)
+        else field.value_from_object
+    )
+
+    if _is_identity_prepare(field):
+        return get_value
+
+    prepare = field.prepare
+
+    def reader(resource):
+        return prepare(get_value(resource))
+
+    return reader
+
+
+def field_value_source(field: BaseField, idx: int, namespace: dict[str, Any]) -> str:
+    """Source of an expression for the prepared value of a field of ``resource``.
+
+    Values of fields that do not customise ``value_from_object`` are read directly
+    and ``prepare`` is only called if the field customises it.
+
+    :param field: Field to read.
+    :param idx: Index of the field (used to name references in the namespace).
+    :param namespace: Namespace of the generated function.
+    """
+    if not (_is_direct_read(field) and is_valid_name(field.attname)):
+        ref = f"{NAME_PREFIX}value_{idx}"
+        namespace[ref] = field_reader(field)
+        return f"{ref}(resource)"
+
+    value = f"resource.{field.attname}"
+    if not _is_identity_prepare(field):
+        ref = f"{NAME_PREFIX}prepare_{idx}"
+        namespace[ref] = field.prepare
+        value = f"{ref}({value})"
+    return value
+
+
+def generate_to_dict(
+    fields: Sequence[BaseField], type_field: str | None = None, resource_name=None
+) -> Callable:
+    """Generate a function that converts a resource into a dict.
+
+    The generated function has the signature::
+
+        to_dict(resource)
+
+    and matches the behaviour of ``ResourceBase.to_dict``; the dict is built
+    with a single literal, values of fields that do not customise
+    ``value_from_object`` are read directly and ``prepare`` is only called if
+    the field customises it.
+
+    :param fields: Fields to include in the dict.
+    :param type_field: Name of the type field to include (if any).
+    :param resource_name: Resource name stored in the type field.
+
+    """
+    namespace = {}
+    items = []
+    if type_field is not None:
+        namespace[f"{NAME_PREFIX}resource_name"] = resource_name
+        items.append(f"{type_field!r}: {NAME_PREFIX}resource_name")
+
+    for idx, field in enumerate(fields):
+        value = field_value_source(field, idx, namespace)
+        items.append(f"{field.name!r}: {value}")
+
+    source = ["def to_dict(resource):", "    return {"]
+    source += [f"        {item}," for item in items]
+    source.append("    }")
+
+    return build_function("to_dict", source, namespace)
+
+
+def field_converter(field: Field) -> Callable[[Any], Any]:
+    """Generate a callable that converts a raw value with ``to_python``.
+
+    Values that are already a native type of the field are returned unchanged
+    and invalid values are retained (as with ``create_resource_from_dict`` when
+    ``full_clean`` is not requested).
+    """
+    to_python = field.to_python
+    types = frozenset(native_types(field))
+
+    def convert(value):
+        if type(value) in types:
+            return value
+        try:
+            return to_python(value)
+        except ValidationError:
+            return value
+
+    return convert
+
+
+def field_clean(field: Field) -> Callable[[Any], Any]:
+    """Generate a clean callable for a field that uses the compiled validation chain.
+
+    Matches :py:meth:`odin.fields.Field.clean`; no-op validation stages are
+    dropped by :py:attr:`odin.fields.Field.validation_chain`. Fields that
+    customise ``clean`` are used unchanged.
+    """
+    if type(field).clean is not Field.clean:
+        return field.clean
+
+    to_python = field.to_python
+    check = field.validation_chain
+    use_default = field.use_default_if_not_provided
+    get_default = field.get_default
+
+    if check is None:
+
+        def clean(value):
+            if value is NotProvided:
+                value = get_default() if use_default else None
+            return to_python(value)
+
+    else:
+
+        def clean(value):
+            if value is NotProvided:
+                value = get_default() if use_default else None
+            value = to_python(value)
+            check(value)
+            return value
+
+    return clean
+
+
+def field_try_clean(field: Field) -> Callable[[Any], ValidationResult] | None:
+    """Non-raising clean of a field, ``None`` if the field does not customise
+    :py:meth:`odin.fields.Field.try_clean` (eg composite fields that validate
+    child resources), these fields are cleaned with ``field_clean``.
+    """
+    if type(field).try_clean is Field.try_clean:
+        return None
+    return field.try_clean
+
+
+class ValidationStep(NamedTuple):
+    """Step in the validation plan of a resource."""
+
+    field: Field
+    name: str
+    attname: str
+    get_value: Callable[[Any], Any]
+    null: bool
+    clean: Callable[[Any], Any]
+    # Non-raising clean of fields that validate child resources (else None)
+    try_clean: Callable[[Any], ValidationResult] | None
+    clean_method: Callable[[Any, Any], Any] | None
+    readonly: bool
+    mutable_value: bool
+
+
+def _resource_clean_method(resource_type: type, attname: str):
+    """Resolve a ``clean_FIELDNAME`` method to a ``(instance, value)`` callable."""
+    name = f"clean_{attname}"
+    attr = inspect.getattr_static(resource_type, name, None)
+    if attr is None:
+        return None
+    if isinstance(attr, types.FunctionType):
+        return attr
+
+    # Other descriptors are resolved against the instance (as they were prior
+    # to building a plan).
+    def clean_method(instance, value):
+        method = getattr(instance, name)
+        return method(value) if callable(method) else value
+
+    return clean_method
+
+
+def build_validation_plan(
+    resource_type: type,
+    fields: Sequence[Field],
+    readonly_fields: Sequence[Field],
+) -> tuple[ValidationStep, ...]:
+    """Build the plan used to clean the fields of a resource.
+
+    Resolves the resource level ``clean_FIELDNAME`` methods, the read-only state
+    of each field and a clean callable with any no-op stages removed.
+
+    :param resource_type: Resource type that defines the fields.
+    :param fields: Fields to be cleaned.
+    :param readonly_fields: Fields that are not assigned the cleaned value.
+    """
+    readonly_fields = frozenset(readonly_fields)
+    return tuple(
+        ValidationStep(
+            field,
+            field.name,
+            field.attname,
+            (
+                operator.attrgetter(field.attname)
+                if _is_direct_read(field)
+                else field.value_from_object
+            ),
+            field.null,
+            field_clean(field),
+            field_try_clean(field),
+            _resource_clean_method(resource_type, field.attname),
+            field in readonly_fields,
+            field.mutable_value,
+        )
+        for field in fields
+    )
@@ -23,6 +23,8 @@ class ArrowField(Field):
 
     """
 
+    __slots__ = ("assume_local",)
+
     default_error_messages = {
         "invalid": "Not a valid datetime string.",
     }
@@ -12,6 +12,8 @@ class LatitudeField(ScalarField):
     Field that contains a latitude value.
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a latitude.",
     }
@@ -33,6 +35,8 @@ class LongitudeField(ScalarField):
     Field that contains a longitude value.
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a longitude.",
     }
@@ -54,6 +58,8 @@ class LatLngField(Field):
     Field that contains a lat/long pair.
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a (latitude, longitude).",
     }
@@ -75,6 +81,8 @@ class PointField(Field):
     Field that contains a point in cartesian space. This can be either 2D (on a plain) or 3D (includes a z-axis).
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a point in 2D or 3D cartesian space.",
     }
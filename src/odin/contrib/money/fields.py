@@ -10,6 +10,8 @@ __all__ = ("AmountField",)
 class AmountField(ScalarField):
     """Field that contains a monetary amount (with an optional currency)."""
 
+    __slots__ = ("allowed_currencies",)
+
     default_error_messages = {
         "invalid": "'%s' value must be a (amount, currency).",
         "invalid_currency": "'%s' currency is not supported.",
@@ -14,6 +14,8 @@ __all__ = ("FloatField",)
 class PintField(Field, ABC):
     """Base class for Pint fields."""
 
+    __slots__ = ("units",)
+
     def __init__(self, units: str, **kwargs):
         super().__init__(**kwargs)
 
@@ -50,6 +52,8 @@ class PintField(Field, ABC):
 
 
 class FloatField(PintField):
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a float.",
     }
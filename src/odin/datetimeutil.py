@@ -1,8 +1,23 @@
 import datetime
 import re
 import time
-from email.utils import formatdate as format_http_datetime  # noqa
-from email.utils import parsedate_tz as parse_http_datetime
+from functools import cache, lru_cache
+
+
+def __getattr__(name: str):
+    # email.utils is costly to import and is only required to parse (or format)
+    # uncommon HTTP date time formats.
+    if name in ("format_http_datetime", "parse_http_datetime"):
+        from email import utils  # noqa: PLC0415
+
+        value = (
+            utils.formatdate if name == "format_http_datetime" else utils.parsedate_tz
+        )
+        globals()[name] = value
+        return value
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 class IgnoreTimezone:
@@ -81,26 +96,35 @@ class FixedTimezone(datetime.tzinfo):
         minutes = abs(seconds // 60)
         hours = minutes // 60
         minutes %= 60
-        name = f"{sign}{hours:02d}:{minutes:02d}"
-
-        if sign == "-":
-            hours *= -1
-            minutes *= -1
-
-        return cls(datetime.timedelta(hours=hours, minutes=minutes), name)
+        return cls.interned(sign, hours, minutes)
 
     @classmethod
     def from_hours_minutes(cls, hours: int, minutes: int = 0) -> datetime.tzinfo:
         """Generate a timezone from a time offset in hours and optional minutes."""
         sign = "-" if hours < 0 else ""
-        hours = abs(hours)
-        minutes = abs(minutes)
-        name = f"{sign}{hours:02d}:{minutes:02d}"
+        return cls.interned(sign, abs(hours), abs(minutes))
 
-        if sign == "-":
-            hours *= -1
-            minutes *= -1
+    @classmethod
+    def interned(cls, sign: str, hours: int, minutes: int) -> "FixedTimezone":
+        """Get the (shared) timezone for an offset.
+
+        Timezones are immutable so a single instance is created for each offset
+        (and name) rather than one for every parsed value.
 
+        :param sign: Sign of the offset, either "-" or "+" (or "" for positive).
+        :param hours: Hours of the offset (unsigned).
+        :param minutes: Minutes of the offset (unsigned).
+        """
+        if cls is not FixedTimezone:
+            return cls._create(sign, hours, minutes)
+        return _interned_timezone(sign, hours, minutes)
+
+    @classmethod
+    def _create(cls, sign: str, hours: int, minutes: int) -> "FixedTimezone":
+        name = f"{sign}{hours:02d}:{minutes:02d}"
+        if sign == "-":
+            hours = -hours
+            minutes = -minutes
         return cls(datetime.timedelta(hours=hours, minutes=minutes), name)
 
     @classmethod
@@ -117,16 +141,9 @@ class FixedTimezone(datetime.tzinfo):
         if tz in ("Z", "GMT", "UTC"):
             return utc
 
-        sign = groups["tz_sign"]
-        hours = int(groups["tz_hour"])
-        minutes = int(groups["tz_minute"] or 0)
-        name = f"{sign}{hours:02d}:{minutes:02d}"
-
-        if sign == "-":
-            hours = -hours
-            minutes = -minutes
-
-        return cls(datetime.timedelta(hours=hours, minutes=minutes), name)
+        return cls.interned(
+            groups["tz_sign"], int(groups["tz_hour"]), int(groups["tz_minute"] or 0)
+        )
 
     def __init__(self, offset: datetime.timedelta = None, name: str = None):
         """Initialise a fixed timezone."""
@@ -173,6 +190,11 @@ class FixedTimezone(datetime.tzinfo):
         self.name = state.get("name")
 
 
+@cache
+def _interned_timezone(sign: str, hours: int, minutes: int) -> FixedTimezone:
+    return FixedTimezone._create(sign, hours, minutes)
+
+
 def get_tz_aware_dt(
     dt: datetime.datetime, assumed_tz: datetime.tzinfo = local
 ) -> datetime.datetime:
@@ -219,12 +241,116 @@ def parse_iso_date_string(date_string: str) -> datetime.date:
     if not isinstance(date_string, str):
         raise ValueError("Expected string")
 
+    # Fast path for the (common) fully padded format (excluding ISO week dates)
+    if len(date_string) == 10 and date_string[4] == "-" == date_string[7]:  # noqa: PLR2004
+        try:
+            return date_fromisoformat(date_string)
+        except ValueError:
+            pass
+
     try:
         return datetime.datetime.strptime(date_string, "%Y-%m-%d").date()
     except ValueError:
         raise ValueError("Expected ISO 8601 formatted date string.") from None
 
 
+date_fromisoformat = datetime.date.fromisoformat
+time_fromisoformat = datetime.time.fromisoformat
+datetime_fromisoformat = datetime.datetime.fromisoformat
+
+_UTC_NAMES = frozenset(("Z", "GMT", "UTC"))
+
+
+def _split_fraction(value: str, end: int) -> tuple[str, str] | None:
+    """Split a value into the date/time (up to ``end``) and the timezone designator.
+
+    A fraction of a second is included with the date/time if it is in the
+    ``fromisoformat`` equivalent (6 digit) format, the regular expression treats
+    other lengths as a count of microseconds so ``None`` is returned.
+    """
+    if len(value) < end:
+        return None
+    if value[end : end + 1] != ".":
+        return value[:end], value[end:]
+    fraction_end = end + 7
+    if value[end + 1 : fraction_end].isdigit() and len(value) >= fraction_end:
+        if value[fraction_end : fraction_end + 1].isdigit():
+            return None
+        return value[:fraction_end], value[fraction_end:]
+    return None
+
+
+@lru_cache(maxsize=256)
+def _iso_timezone(value: str, allow_names: bool) -> datetime.tzinfo:
+    """Parse an ISO 8601 timezone designator, raises ``LookupError`` if not matched."""
+    if value == "Z" or (allow_names and value in _UTC_NAMES):
+        return utc
+
+    sign = value[:1]
+    offset = value[1:]
+    if allow_names and len(offset) == 4:  # noqa: PLR2004
+        offset = f"{offset[:2]}:{offset[2:]}"
+    if (
+        sign not in ("+", "-")
+        or len(offset) not in (2, 5)
+        or not offset[:2].isdigit()
+        or (len(offset) == 5 and not (offset[2] == ":" and offset[3:].isdigit()))  # noqa: PLR2004
+    ):
+        raise LookupError(value)
+    return FixedTimezone.interned(sign, int(offset[:2]), int(offset[3:] or 0))
+
+
+def _fast_parse_iso_time(
+    time_string: str, default_timezone: IgnorableTimezone
+) -> datetime.time:
+    """Parse a time using ``fromisoformat``.
+
+    Raises ``ValueError`` (or ``LookupError``) if the value is not in the subset
+    of formats that are semantically equivalent to the regular expression.
+    """
+    parts = _split_fraction(time_string, 8)
+    if parts is None or time_string[2:3] != ":" or time_string[5:6] != ":":
+        raise LookupError(time_string)
+    time_part, tz_string = parts
+    value = time_fromisoformat(time_part)
+    if default_timezone is IgnoreTimezone:
+        if tz_string:
+            _iso_timezone(tz_string, False)
+        return value
+    tz = _iso_timezone(tz_string, False) if tz_string else default_timezone
+    return value.replace(tzinfo=tz)
+
+
+def _fast_parse_iso_datetime(
+    datetime_string: str, default_timezone: IgnorableTimezone
+) -> datetime.datetime:
+    """Parse a datetime using ``fromisoformat``.
+
+    Raises ``ValueError`` (or ``LookupError``) if the value is not in the subset
+    of formats that are semantically equivalent to the regular expression.
+    """
+    parts = _split_fraction(datetime_string, 19)
+    if (
+        parts is None
+        or datetime_string[4:5] != "-"
+        or datetime_string[7:8] != "-"
+        or datetime_string[10:11] not in ("T", "t", " ")
+        or datetime_string[13:14] != ":"
+        or datetime_string[16:17] != ":"
+    ):
+        raise LookupError(datetime_string)
+    datetime_part, tz_string = parts
+    if tz_string[:1] == " ":
+        tz_string = tz_string[1:]
+    value = datetime_fromisoformat(datetime_part)
+    if default_timezone is IgnoreTimezone:
+        if tz_string:
+            _iso_timezone(tz_string, True)
+        return value
+    tz = _iso_timezone(tz_string, True) if tz_string else default_timezone
+    return value.replace(tzinfo=tz)
+
+
 def parse_iso_time_string(
     time_string: str, default_timezone: IgnorableTimezone = utc
 ) -> datetime.time:
@@ -232,6 +358,11 @@ def parse_iso_time_string(
     if not isinstance(time_string, str):
         raise ValueError("Expected string")
 
+    try:
+        return _fast_parse_iso_time(time_string, default_timezone)
+    except (LookupError, ValueError):
+        pass
+
     matches = ISO8601_TIME_STRING_RE.match(time_string)
     if not matches:
         raise ValueError("Expected ISO 8601 formatted time string.")
@@ -251,12 +382,13 @@ def parse_iso_time_string(
     )
 
 
-def parse_iso_datetime_string(
-    datetime_string: str, default_timezone: IgnorableTimezone = utc
+def _parse_iso_datetime_string(
+    datetime_string: str, default_timezone: IgnorableTimezone
 ) -> datetime.datetime:
-    """Parse a datetime in the string format defined by ISO 8601."""
-    if not isinstance(datetime_string, str):
-        raise ValueError("Expected string")
+    try:
+        return _fast_parse_iso_datetime(datetime_string, default_timezone)
+    except (LookupError, ValueError):
+        pass
 
     matches = ISO8601_DATETIME_STRING_RE.match(datetime_string)
     if not matches:
@@ -280,6 +412,40 @@ def parse_iso_datetime_string(
     )
 
 
+# LRU cache of parsed datetime strings (disabled by default)
+_cached_parse_iso_datetime_string = None
+
+
+def set_datetime_cache_size(maxsize: int):
+    """Cache the result of parsing datetime strings.
+
+    Useful where the same timestamps are repeated in many documents, the most
+    recently parsed ``maxsize`` values are retained; a size of 0 disables the
+    cache (the default).
+    """
+    global _cached_parse_iso_datetime_string  # noqa: PLW0603
+    _cached_parse_iso_datetime_string = (
+        lru_cache(maxsize=maxsize)(_parse_iso_datetime_string) if maxsize else None
+    )
+
+
+def parse_iso_datetime_string(
+    datetime_string: str, default_timezone: IgnorableTimezone = utc
+) -> datetime.datetime:
+    """Parse a datetime in the string format defined by ISO 8601."""
+    if not isinstance(datetime_string, str):
+        raise ValueError("Expected string")
+
+    cached_parse = _cached_parse_iso_datetime_string
+    if cached_parse is not None:
+        try:
+            return cached_parse(datetime_string, default_timezone)
+        except TypeError:
+            # Default timezone is not hashable
+            pass
+    return _parse_iso_datetime_string(datetime_string, default_timezone)
+
+
 def to_ecma_datetime_string(
     dt: datetime.datetime, default_timezone: datetime.tzinfo = local
 ) -> str:
@@ -297,20 +463,6 @@ def to_ecma_datetime_string(
     )
 
 
-def parse_http_datetime_string(datetime_string: str) -> datetime.datetime:
-    """Parse a datetime in the string format defined by ISO-1123 (or HTTP date time)."""
-    elements = None
-    if isinstance(datetime_string, str):
-        elements = parse_http_datetime(datetime_string)
-
-    if not elements:
-        raise ValueError("Expected ISO-1123 formatted datetime string.")
-
-    return datetime.datetime(
-        *elements[:6], tzinfo=FixedTimezone.from_seconds(elements[-1])
-    )
-
-
 HTTP_DAY_OF_WEEK = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 HTTP_MONTH = [
     "Jan",
@@ -326,6 +478,68 @@ HTTP_MONTH = [
     "Nov",
     "Dec",
 ]
+_HTTP_MONTH_NUMBER = {
+    f" {name} ": f"{idx:02d}" for idx, name in enumerate(HTTP_MONTH, 1)
+}
+_GMT = FixedTimezone.interned("", 0, 0)
+
+
+def _fast_parse_http_datetime(datetime_string: str) -> datetime.datetime | None:
+    """Parse the preferred (IMF-fixdate) format eg ``Sun, 06 Nov 1994 08:49:37 GMT``."""
+    if (
+        len(datetime_string) != 29  # noqa: PLR2004
+        or datetime_string[25:] != " GMT"
+        or datetime_string[3:5] != ", "
+        or datetime_string[:3] not in HTTP_DAY_OF_WEEK
+        or datetime_string[16] != " "
+        or datetime_string[19] != ":"
+        or datetime_string[22] != ":"
+    ):
+        return None
+    month = _HTTP_MONTH_NUMBER.get(datetime_string[7:12])
+    if month is None:
+        return None
+    try:
+        dt = datetime_fromisoformat(
+            f"{datetime_string[12:16]}-{month}-{datetime_string[5:7]}"
+            f"T{datetime_string[17:25]}"
+        )
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        return None
+    return dt.replace(tzinfo=_GMT)
+
+
+def parse_http_datetime_string(datetime_string: str) -> datetime.datetime:
+    """Parse a datetime in the string format defined by ISO-1123 (or HTTP date time)."""
+    if isinstance(datetime_string, str):
+        dt = _fast_parse_http_datetime(datetime_string)
+        if dt is not None:
+            return dt
+
+    from email.utils import parsedate_tz  # noqa: PLC0415
+
+    elements = None
+    if isinstance(datetime_string, str):
+        elements = parsedate_tz(datetime_string)
+
+    if not elements:
+        raise ValueError("Expected ISO-1123 formatted datetime string.")
+
+    return datetime.datetime(
+        *elements[:6], tzinfo=FixedTimezone.from_seconds(elements[-1])
+    )
+
+
+@lru_cache(maxsize=128)
+def _format_http_datetime(dt: datetime.datetime) -> str:
+    """Format a (UTC) datetime truncated to the second, cached as servers commonly
+    format the same second many times."""
+    return (
+        f"{HTTP_DAY_OF_WEEK[dt.weekday()]}, {dt.day:02d} {HTTP_MONTH[dt.month - 1]} "
+        f"{dt.year:04d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} GMT"
+    )
 
 
 def to_http_datetime_string(
@@ -333,9 +547,4 @@ def to_http_datetime_string(
 ) -> str:
     """Convert a python datetime into the string format defined by ISO-1123 (or HTTP date time)."""
     dt = get_tz_aware_dt(dt, default_timezone).astimezone(utc)
-    timeval = time.mktime(dt.timetuple())
-    now = time.localtime(timeval)
-    return (
-        f"{HTTP_DAY_OF_WEEK[now[6]]}, {now[2]:02d} {HTTP_MONTH[now[1] - 1]} {now[0]:04d} "
-        f"{now[3]:02d}:{now[4]:02d}:{now[5]:02d} {'GMT'}"
-    )
+    return _format_http_datetime(dt.replace(microsecond=0))
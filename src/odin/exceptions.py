@@ -1,6 +1,9 @@
 """Exceptions raised by Odin."""
 
-from typing import Final
+import contextlib
+import contextvars
+from collections.abc import Iterator
+from typing import Any, Final, NamedTuple
 
 from odin import registration
 
@@ -102,6 +105,136 @@ registration.register_validation_error_handler(
 )
 
 
+class ValidationResult(NamedTuple):
+    """Outcome of validating a value without raising ``ValidationError``.
+
+    Either the validated ``value`` or the ``errors`` found (the same messages
+    that would be the ``error_messages`` of the exception).
+    """
+
+    value: Any = None
+    errors: dict[str, list] | list | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        """No errors were found."""
+        return self.errors is None
+
+    def unwrap(self) -> Any:
+        """Return the value or raise ``ValidationError`` for the errors."""
+        if self.errors is not None:
+            raise ValidationError(self.errors)
+        return self.value
+
+
+def check_max_errors(max_errors: int | None):
+    """Check a ``max_errors`` argument is ``None`` or an integer of at least 1.
+
+    Called before any work is done by functions that accept ``max_errors`` (eg
+    codecs, so an invalid value is not reported as a decode error).
+    """
+    if max_errors is None:
+        return
+    if not isinstance(max_errors, int):
+        msg = f"max_errors must be an int or None, not {max_errors.__class__.__name__}."
+        raise TypeError(msg)
+    if max_errors < 1:
+        msg = "max_errors must be at least 1."
+        raise ValueError(msg)
+
+
+class ErrorLimit:
+    """Limit on the number of errors collected before validation stops.
+
+    Each field (or item of a list or dict field) that fails validation counts
+    as a single error regardless of the number of messages it produces.
+    """
+
+    __slots__ = ("count", "max_errors")
+
+    def __init__(self, max_errors: int):
+        check_max_errors(max_errors)
+        self.max_errors = max_errors
+        self.count = 0
+
+    def __repr__(self):
+        return f"ErrorLimit({self.count}/{self.max_errors})"
+
+    @property
+    def reached(self) -> bool:
+        """The limit has been reached and collecting errors should stop."""
+        return self.count >= self.max_errors
+
+
+_error_limit: contextvars.ContextVar[ErrorLimit | None] = contextvars.ContextVar(
+    "odin_error_limit", default=None
+)
+
+
+@contextlib.contextmanager
+def error_limit(max_errors: int | None) -> Iterator[ErrorLimit | None]:
+    """Stop collecting validation errors once ``max_errors`` have been found.
+
+    A ``max_errors`` of 1 fails fast on the first error; ``None`` collects all
+    errors (unless an enclosing limit is active). The partial errors raised keep
+    the same structure as if every error had been collected.
+
+    .. code-block:: python
+
+        with error_limit(1):
+            resource.full_clean()
+
+    """
+    if max_errors is None:
+        yield _error_limit.get()
+        return
+
+    limit = ErrorLimit(max_errors)
+    token = _error_limit.set(limit)
+    try:
+        yield limit
+    finally:
+        _error_limit.reset(token)
+
+
+def count_errors(error_messages: list | dict) -> int:
+    """Number of errors (fields/items with messages) in a tree of error messages."""
+    if isinstance(error_messages, dict):
+        return sum(map(count_errors, error_messages.values()))
+    # Errors of a child resource are wrapped in a list of messages
+    nested = [m for m in error_messages if isinstance(m, dict)]
+    return sum(map(count_errors, nested)) + (len(nested) < len(error_messages))
+
+
+def error_limit_reached(
+    error: ValidationError | dict | list, count: int | None = None
+) -> bool:
+    """Record an error caught while collecting errors against the active limit.
+
+    Errors with a dict of messages have already been counted by the collector
+    that raised (or returned) them and are not counted again unless an explicit
+    count is given.
+
+    :param error: The error that was caught (or the error messages returned).
+    :param count: Number of errors the exception represents.
+    :returns: ``True`` if the limit has been reached and collection should stop.
+    """
+    limit = _error_limit.get()
+    if limit is None:
+        return False
+    if count is None:
+        count = 0 if isinstance(error, dict) or hasattr(error, "message_dict") else 1
+    limit.count += count
+    return limit.count >= limit.max_errors
+
+
+def release_errors(error_messages: list | dict):
+    """Return errors that have been discarded to the active limit."""
+    limit = _error_limit.get()
+    if limit is not None:
+        limit.count -= count_errors(error_messages)
+
+
 class ResourceException(ValidationError):
     """Errors raised when generating resource from files.
 
@@ -113,6 +246,10 @@ class ResourceDefError(Exception):
     """Exceptions raised if a resource definition contains errors."""
 
 
+class FrozenResourceError(AttributeError):
+    """Attempt to assign (or delete) an attribute of a frozen resource."""
+
+
 class MappingError(Exception):
     """Exceptions related to mapping, will typically be a more specific
     `MappingSetupError` or `MappingExecutionError`."""
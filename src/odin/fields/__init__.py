@@ -1,12 +1,11 @@
-import copy
 import datetime
 import enum
 import pathlib
 import re
 import uuid
-from collections.abc import Sequence
-from functools import cached_property
-from typing import Any, TypeVar
+from collections.abc import Callable, MutableMapping, Sequence
+from functools import cache
+from typing import Any, NamedTuple, TypeVar
 
 from odin import datetimeutil, exceptions, registration
 from odin.utils import getmeta
@@ -70,6 +69,217 @@ NotProvidedType = type[NotProvided]
 NOT_PROVIDED = NotProvided
 
 
+@cache
+def trusted_native_types(field_type: type) -> tuple[type, ...]:
+    """Types that the ``to_python`` method of a field type returns unchanged.
+
+    The ``native_types`` declared on a field class are only trusted if they are
+    declared on the same class (or a sub-class) that defines ``to_python``, a
+    sub-class that customises ``to_python`` does not inherit them.
+    """
+    mro = field_type.__mro__
+
+    def defined_at(attr: str) -> int:
+        return next(idx for idx, klass in enumerate(mro) if attr in klass.__dict__)
+
+    if defined_at("native_types") <= defined_at("to_python"):
+        return tuple(field_type.native_types)
+    return ()
+
+
+def _to_python_each(to_python, values: Sequence) -> list:
+    """Convert each value and collect errors keyed by the index of the value."""
+    converted = []
+    errors = {}
+    for idx, value in enumerate(values):
+        try:
+            converted.append(to_python(value))
+        except exceptions.ValidationError as ve:
+            errors[str(idx)] = ve.error_messages
+            if exceptions.error_limit_reached(ve):
+                break
+    if errors:
+        raise exceptions.ValidationError(errors)
+    return converted
+
+
+@cache
+def _default_error_messages(field_type: type) -> dict[str, str]:
+    """Default error messages of a field type merged along the MRO.
+
+    The table is shared, callers must copy it before making any changes.
+    """
+    messages = {}
+    for c in reversed(field_type.__mro__):
+        messages.update(getattr(c, "default_error_messages", {}))
+    return messages
+
+
+class ErrorMessages(MutableMapping):
+    """Error messages of a field.
+
+    A copy-on-write overlay of the (shared) default error messages of the field
+    type; the table is only copied for fields that override messages or that
+    change a message after the field is created.
+    """
+
+    __slots__ = ("_messages", "_shared")
+
+    def __init__(
+        self, defaults: dict[str, str], overrides: dict[str, str] | None = None
+    ):
+        if overrides:
+            self._messages = {**defaults, **overrides}
+            self._shared = False
+        else:
+            self._messages = defaults
+            self._shared = True
+
+    def _own(self) -> dict[str, str]:
+        if self._shared:
+            self._messages = self._messages.copy()
+            self._shared = False
+        return self._messages
+
+    def __getitem__(self, key: str) -> str:
+        return self._messages[key]
+
+    def __setitem__(self, key: str, value: str):
+        self._own()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._own()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._messages
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __repr__(self):
+        return repr(self._messages)
+
+
+# Empty values that can be matched by type (any empty instance of the type)
+_EMPTY_TYPES = frozenset((str, bytes, list, tuple, dict, set, frozenset))
+
+
+@cache
+def empty_check(field_type: type) -> Callable[[Any], bool]:
+    """Callable that tests if a value is one of the ``empty_values`` of a field type.
+
+    Where possible values are matched by type (rather than comparing against
+    each empty value) as this is the common case for values that are not empty.
+    """
+    empty_values = field_type.empty_values
+    empty_types = tuple({v.__class__ for v in empty_values if v is not None})
+    if any(v for v in empty_values) or not _EMPTY_TYPES.issuperset(empty_types):
+        return empty_values.__contains__
+
+    if any(v is None for v in empty_values):
+        return lambda value: (
+            value is None or (isinstance(value, empty_types) and not value)
+        )
+    return lambda value: isinstance(value, empty_types) and not value
+
+
+def _choices_check(field: "Field") -> Callable[[Any], bool] | None:
+    """Callable that tests if a value is a valid choice, ``None`` without choices."""
+    choices = field.choice_values
+    if not choices:
+        return None
+
+    try:
+        contains = frozenset(choices).__contains__
+    except TypeError:
+        # Unhashable choices
+        return choices.__contains__
+
+    def is_choice(value) -> bool:
+        try:
+            return contains(value)
+        except TypeError:
+            return value in choices
+
+    return is_choice
+
+
+class _CompiledValidation(NamedTuple):
+    validate: Callable[[Any], None]
+    run_validators: Callable[[Any], None]
+    chain: Callable[[Any], None] | None
+
+
+def _compile_validation(field: "Field") -> _CompiledValidation:
+    """Compile the validation stages of a field.
+
+    Generates ``Field.validate`` and ``Field.run_validators`` with the choices,
+    empty check and validation error handlers resolved up front, and a single
+    chain of both stages (``None`` if validation can have no effect). Methods
+    of fields that customise either stage are called as is by the chain.
+    """
+    field_type = field.__class__
+    is_empty = empty_check(field_type)
+    is_choice = _choices_check(field)
+    null = field.null
+    validators = tuple(field.validators)
+    table = registration.get_validation_error_table()
+
+    def check_validators(value):
+        errors = []
+        for validator in validators:
+            try:
+                validator(value)
+            except table.error_types as e:
+                table.handlers[e.__class__](e, field, errors)
+        if errors:
+            raise exceptions.ValidationError(errors)
+
+    def validate(value):
+        if is_choice is not None and not is_empty(value) and not is_choice(value):
+            msg = field.error_messages["invalid_choice"] % value
+            raise exceptions.ValidationError(msg)
+        if value is None and not null:
+            raise exceptions.ValidationError(field.error_messages["null"])
+
+    def run_validators(value):
+        if validators and not is_empty(value):
+            check_validators(value)
+
+    compiled_validate = field_type.validate is Field.validate
+    compiled_run_validators = field_type.run_validators is Field.run_validators
+    if compiled_validate and compiled_run_validators:
+        if is_choice is None and not validators:
+            chain = None if null else validate
+        else:
+
+            def chain(value):
+                if is_empty(value):
+                    if value is None and not null:
+                        raise exceptions.ValidationError(field.error_messages["null"])
+                    return
+                if is_choice is not None and not is_choice(value):
+                    msg = field.error_messages["invalid_choice"] % value
+                    raise exceptions.ValidationError(msg)
+                if value is None and not null:
+                    raise exceptions.ValidationError(field.error_messages["null"])
+                if validators:
+                    check_validators(value)
+
+    else:
+        first = validate if compiled_validate else field.validate
+        second = run_validators if compiled_run_validators else field.run_validators
+
+        def chain(value):
+            first(value)
+            second(value)
+
+    return _CompiledValidation(validate, run_validators, chain)
+
+
 class Field(BaseField):
     """Base class for fields."""
 
@@ -81,6 +291,14 @@ class Field(BaseField):
     }
     data_type_name = None
     empty_values = EMPTY_VALUES
+    # Types (matched exactly) that ``to_python`` returns unchanged; allows
+    # conversion to be skipped for values that are already the correct type.
+    native_types: tuple[type, ...] = ()
+    # Values can be modified in place (eg lists and dicts); resources that track
+    # changes always revalidate these fields.
+    mutable_value: bool = False
+    # Compiled validation is bound to the field instance
+    _transient_attrs = frozenset(("_validation",))
 
     __slots__ = (
         "null",
@@ -92,6 +310,9 @@ class Field(BaseField):
         "choices",
         "error_messages",
         "resource",
+        "_choice_values",
+        "_shadow",
+        "_validation",
     )
 
     def __init__(  # noqa: PLR0913
@@ -147,26 +368,32 @@ class Field(BaseField):
             raise ValueError(msg)
         self.choices = choices
 
-        messages = {}
-        for c in reversed(self.__class__.__mro__):
-            messages.update(getattr(c, "default_error_messages", {}))
-        messages.update(error_messages or {})
-        self.error_messages = messages
+        self.error_messages = ErrorMessages(
+            _default_error_messages(self.__class__), error_messages
+        )
 
         self.resource = None
 
     def __deepcopy__(self, memodict):
         # We don't have to deepcopy very much here, since most things are not
         # intended to be altered after initial creation.
-        obj = copy.copy(self)
+        obj = self.clone()
         memodict[id(self)] = obj
         return obj
 
-    @cached_property
+    @property
     def choice_values(self):
         """Choice values to allow choices to simplify checking if a choice is valid."""
-        if self.choices is not None:
-            return tuple(c[0] for c in self.choices)
+        try:
+            return self._choice_values
+        except AttributeError:
+            pass
+
+        choices = self.choices
+        self._choice_values = value = (
+            None if choices is None else tuple(c[0] for c in choices)
+        )
+        return value
 
     @property
     def choices_doc_text(self) -> Sequence[tuple[str, str]]:
@@ -188,33 +415,83 @@ class Field(BaseField):
         """
         raise NotImplementedError()
 
-    def run_validators(self, value):
-        """Execute validators against supplied value."""
-        if value in self.empty_values:
-            return
+    def to_python_many(self, values: Sequence) -> list:
+        """
+        Convert a sequence of values with ``to_python``.
 
-        errors = []
-        for v in self.validators:
+        Values that are already a native type of the field are not converted. Any
+        errors are raised as a single ``odin.exceptions.ValidationError`` keyed by
+        the index (as a string) of each value. Fields can override this method to
+        convert values in bulk.
+        """
+        to_python = self.to_python
+        native = trusted_native_types(self.__class__)
+        try:
+            if native:
+                return [v if v.__class__ in native else to_python(v) for v in values]
+            return list(map(to_python, values))
+        except exceptions.ValidationError:
+            pass
+
+        # Convert each value to collect all errors
+        return _to_python_each(to_python, values)
+
+    def clean_many(self, values: Sequence) -> list:
+        """
+        Clean a sequence of values, the equivalent of calling ``clean`` on each value.
+
+        Errors are raised as a single ``odin.exceptions.ValidationError`` keyed by
+        the index (as a string) of each value; values are only validated if all
+        values could be converted.
+        """
+        if any(v is NotProvided for v in values):
+            values = [
+                (self.get_default() if self.use_default_if_not_provided else None)
+                if v is NotProvided
+                else v
+                for v in values
+            ]
+        values = self.to_python_many(values)
+
+        check = self.validation_chain
+        if check is None:
+            return values
+
+        errors = {}
+        for idx, value in enumerate(values):
             try:
-                v(value)
-            except registration.get_validation_error_list() as e:
-                handler = registration.get_validation_error_handler(e)
-                handler(e, self, errors)
+                check(value)
+            except exceptions.ValidationError as ve:
+                errors[str(idx)] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
         if errors:
             raise exceptions.ValidationError(errors)
+        return values
+
+    def _compiled_validation(self) -> _CompiledValidation:
+        try:
+            return self._validation
+        except AttributeError:
+            self._validation = compiled = _compile_validation(self)
+            return compiled
+
+    @property
+    def validation_chain(self) -> Callable[[Any], None] | None:
+        """
+        Single callable that applies ``validate`` and ``run_validators`` to a value.
+
+        Compiled on first use, ``None`` if validation can have no effect.
+        """
+        return self._compiled_validation().chain
+
+    def run_validators(self, value):
+        """Execute validators against supplied value."""
+        self._compiled_validation().run_validators(value)
 
     def validate(self, value):
         """Validate a supplied value."""
-        if (
-            self.choice_values
-            and (value not in self.empty_values)
-            and (value not in self.choice_values)
-        ):
-            msg = self.error_messages["invalid_choice"] % value
-            raise exceptions.ValidationError(msg)
-
-        if not self.null and value is None:
-            raise exceptions.ValidationError(self.error_messages["null"])
+        self._compiled_validation().validate(value)
 
     def clean(self, value):
         """
@@ -225,10 +502,24 @@ class Field(BaseField):
         if value is NotProvided:
             value = self.get_default() if self.use_default_if_not_provided else None
         value = self.to_python(value)
-        self.validate(value)
-        self.run_validators(value)
+        try:
+            check = self._validation.chain
+        except AttributeError:
+            check = self._compiled_validation().chain
+        if check is not None:
+            check(value)
         return value
 
+    def try_clean(self, value) -> exceptions.ValidationResult:
+        """
+        Clean a value, returning a result with either the cleaned value or the
+        errors (rather than raising ``ValidationError``).
+        """
+        try:
+            return exceptions.ValidationResult(self.clean(value))
+        except exceptions.ValidationError as ve:
+            return exceptions.ValidationResult(None, ve.error_messages)
+
     def has_default(self):
         """Returns a bool of whether this field has a default value."""
         return self.default is not NotProvided
@@ -249,10 +540,13 @@ class Field(BaseField):
 class BooleanField(Field):
     """Field that must contain a boolean value."""
 
+    __slots__ = ()
+
     default_error_messages = {"invalid": "'%s' value must be either True or False."}
     true_strings = ("t", "true", "y", "yes", "on", "1", "✓")
     false_strings = ("f", "false", "n", "no", "off", "0")
     data_type_name = "Boolean"
+    native_types = (bool,)
 
     def to_python(self, value):
         if value is None:
@@ -285,7 +579,10 @@ class StringField(Field):
         The maximum length (in characters) of the field. The ``max_length`` value is enforced Odin’s validation.
     """
 
+    __slots__ = ("empty", "max_length")
+
     data_type_name = "String"
+    native_types = (str,)
 
     def __init__(self, max_length: int = None, empty: bool = None, **options):
         super().__init__(**options)
@@ -314,6 +611,8 @@ class StringField(Field):
 class UrlField(StringField):
     """Field that must create a URL."""
 
+    __slots__ = ()
+
     data_type_name = "URL"
 
     def __init__(self, **options):
@@ -322,6 +621,8 @@ class UrlField(StringField):
 
 
 class ScalarField(Field):
+    __slots__ = ("min_value", "max_value")
+
     scalar_type = int
 
     def __init__(self, min_value=None, max_value=None, **options):
@@ -343,23 +644,44 @@ class ScalarField(Field):
             msg = self.error_messages["invalid"] % value
             raise exceptions.ValidationError(msg) from None
 
+    def to_python_many(self, values: Sequence) -> list:
+        """Convert values with ``scalar_type`` in bulk (falling back to ``to_python``)."""
+        # Empty values can not be converted by scalar type so will fall back
+        if (
+            self.empty_values is EMPTY_VALUES
+            and type(self).to_python is ScalarField.to_python
+        ):
+            try:
+                return list(map(self.scalar_type, values))
+            except (TypeError, ValueError):
+                pass
+        return super().to_python_many(values)
+
 
 class IntegerField(ScalarField):
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a integer.",
     }
     data_type_name = "Integer"
+    native_types = (int,)
 
 
 class FloatField(ScalarField):
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "'%s' value must be a float.",
     }
     data_type_name = "Float"
+    native_types = (float,)
     scalar_type = float
 
 
 class _IsoFormatMixin(BaseField):
+    __slots__ = ()
+
     def as_string(self, value):
         """
         Generate a string representation of a field.
@@ -380,10 +702,13 @@ class DateField(_IsoFormatMixin, Field):
 
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Not a valid date string.",
     }
     data_type_name = "ISO-8601 Date"
+    native_types = (datetime.date,)
 
     def to_python(self, value):
         if value in self.empty_values:
@@ -413,10 +738,13 @@ class TimeField(_IsoFormatMixin, Field):
 
     """
 
+    __slots__ = ("assume_local",)
+
     default_error_messages = {
         "invalid": "Not a valid time string.",
     }
     data_type_name = "ISO-8601 Time"
+    native_types = (datetime.time,)
 
     def __init__(self, assume_local: bool = False, **options):
         super().__init__(**options)
@@ -450,6 +778,8 @@ class NaiveTimeField(_IsoFormatMixin, Field):
 
     """
 
+    __slots__ = ("ignore_timezone",)
+
     default_error_messages = {
         "invalid": "Not a valid time string.",
     }
@@ -501,10 +831,13 @@ class DateTimeField(_IsoFormatMixin, Field):
 
     """
 
+    __slots__ = ("assume_local",)
+
     default_error_messages = {
         "invalid": "Not a valid datetime string.",
     }
     data_type_name = "ISO-8601 DateTime"
+    native_types = (datetime.datetime,)
 
     def __init__(self, assume_local: bool = False, **options):
         super().__init__(**options)
@@ -538,6 +871,8 @@ class NaiveDateTimeField(_IsoFormatMixin, Field):
 
     """
 
+    __slots__ = ("ignore_timezone",)
+
     default_error_messages = {
         "invalid": "Not a valid datetime string.",
     }
@@ -584,10 +919,13 @@ class HttpDateTimeField(Field):
 
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Not a valid HTTP datetime string.",
     }
     data_type_name = "ISO-1123 DateTime"
+    native_types = (datetime.datetime,)
 
     def to_python(self, value):
         if value in self.empty_values:
@@ -621,10 +959,13 @@ class TimeStampField(Field):
 
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Not a valid UNIX timestamp.",
     }
     data_type_name = "Integer"
+    native_types = (datetime.datetime,)
 
     def to_python(self, value):
         if value in self.empty_values:
@@ -649,11 +990,14 @@ class TimeStampField(Field):
 
 
 class DictField(Field):
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Must be a dict.",
     }
     data_type_name = "Dict"
     empty_values = (None, "", [], ())
+    mutable_value = True
 
     def __init__(self, **options):
         options.setdefault("default", dict)
@@ -679,11 +1023,15 @@ ObjectField = DictField
 
 
 class ListField(Field):
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Must be an array.",
     }
     data_type_name = "List"
     empty_values = (None, "", {}, ())
+    native_types = (list, tuple)
+    mutable_value = True
 
     def __init__(self, **options):
         options.setdefault("default", list)
@@ -708,6 +1056,8 @@ ArrayField = ListField
 class TypedListField(ListField):
     """Field that handles a list of a specific type."""
 
+    __slots__ = ("field",)
+
     @staticmethod
     def data_type_name(instance):
         type_name = instance.field.data_type_name
@@ -735,19 +1085,7 @@ class TypedListField(ListField):
         if not value:
             return value
 
-        value_list = []
-        errors = {}
-        field_to_python = self.field.to_python
-        for idx, item in enumerate(value):
-            try:
-                value_list.append(field_to_python(item))
-            except exceptions.ValidationError as ve:
-                errors[str(idx)] = ve.error_messages
-
-        if errors:
-            raise exceptions.ValidationError(errors)
-
-        return value_list
+        return self.field.to_python_many(value)
 
     def validate(self, value):
         """Validate each item against field"""
@@ -761,6 +1099,8 @@ class TypedListField(ListField):
                     field_validate(item)
                 except exceptions.ValidationError as ve:
                     errors[str(idx)] = ve.error_messages
+                    if exceptions.error_limit_reached(ve):
+                        break
 
             if errors:
                 raise exceptions.ValidationError(errors)
@@ -779,6 +1119,8 @@ class TypedListField(ListField):
                     field_run_validators(item)
                 except exceptions.ValidationError as ve:
                     errors[str(idx)] = ve.error_messages
+                    if exceptions.error_limit_reached(ve):
+                        break
 
             if errors:
                 raise exceptions.ValidationError(errors)
@@ -807,6 +1149,8 @@ class TypedDictField(DictField):
 
     """
 
+    __slots__ = ("key_field", "value_field")
+
     @staticmethod
     def data_type_name(instance):
         key_type_name = instance.key_field.data_type_name
@@ -832,6 +1176,19 @@ class TypedDictField(DictField):
         if not value:
             return value
 
+        # Convert keys and values in bulk, on any error fall back to converting
+        # each item to report errors.
+        try:
+            return dict(
+                zip(
+                    self.key_field.to_python_many(list(value)),
+                    self.value_field.to_python_many(list(value.values())),
+                    strict=True,
+                )
+            )
+        except exceptions.ValidationError:
+            pass
+
         value_dict = {}
         key_errors = []
         value_errors = {}
@@ -849,6 +1206,8 @@ class TypedDictField(DictField):
                 value_dict[key] = self.value_field.to_python(val)
             except exceptions.ValidationError as ve:
                 value_errors[key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
 
         if key_errors:
             raise exceptions.ValidationError(key_errors)
@@ -881,6 +1240,8 @@ class TypedDictField(DictField):
 
             except exceptions.ValidationError as ve:
                 value_errors[key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
 
         if key_errors:
             raise exceptions.ValidationError(key_errors)
@@ -910,6 +1271,8 @@ class TypedDictField(DictField):
                 self.value_field.run_validators(val)
             except exceptions.ValidationError as ve:
                 value_errors[key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
 
         if key_errors:
             raise exceptions.ValidationError(key_errors)
@@ -934,6 +1297,8 @@ class EmailField(StringField):
     Validates that a string represents a valid Email address.
     """
 
+    __slots__ = ()
+
     data_type_name = "Email"
 
     def __init__(self, **options):
@@ -948,6 +1313,8 @@ class IPv4Field(StringField):
     Validates that a string represents a valid IPv4 address format.
     """
 
+    __slots__ = ()
+
     data_type_name = "IPv4"
 
     def __init__(self, **options):
@@ -962,6 +1329,8 @@ class IPv6Field(StringField):
     Validates that a string represents a valid IPv6 address format.
     """
 
+    __slots__ = ()
+
     data_type_name = "IPv6"
 
     def __init__(self, **options):
@@ -976,6 +1345,8 @@ class IPv46Field(StringField):
     Validates that a string represents a valid IPv4 or IPv6 address format.
     """
 
+    __slots__ = ()
+
     data_type_name = "IPv46"
 
     def __init__(self, **options):
@@ -990,7 +1361,10 @@ class UUIDField(Field):
     Validates that the string represents a universally unique identifier.
     """
 
+    __slots__ = ()
+
     data_type_name = "UUID"
+    native_types = (uuid.UUID,)
 
     def to_python(self, value):
         """Convert the value to a UUID."""
@@ -1029,6 +1403,23 @@ class UUIDField(Field):
         except ValueError as e:
             raise exceptions.ValidationError(e.args[0], code="invalid") from None
 
+    def to_python_many(self, values: Sequence) -> list:
+        """Convert UUID strings in bulk (falling back to ``to_python``)."""
+        if type(self).to_python is UUIDField.to_python:
+            uuid_type = uuid.UUID
+            try:
+                return [
+                    v
+                    if v.__class__ is uuid_type
+                    else uuid_type(v)
+                    if v.__class__ is str
+                    else self.to_python(v)
+                    for v in values
+                ]
+            except (ValueError, exceptions.ValidationError):
+                pass
+        return super().to_python_many(values)
+
 
 ET = TypeVar("ET", bound=enum.Enum)
 
@@ -1036,6 +1427,8 @@ ET = TypeVar("ET", bound=enum.Enum)
 class EnumField(Field):
     """Field for handling Python enums."""
 
+    __slots__ = ("enum_type",)
+
     data_type_name = "Enum"
 
     def __init__(self, enum_type: type[ET], **options):
@@ -1071,6 +1464,20 @@ class EnumField(Field):
                 self.error_messages["invalid_choice"] % value
             ) from None
 
+    def to_python_many(self, values: Sequence) -> list:
+        """Convert values to enums in bulk (falling back to ``to_python``)."""
+        if type(self).to_python is EnumField.to_python:
+            enum_type = self.enum_type
+            members = enum_type._value2member_map_
+            try:
+                return [
+                    v if v is None or v.__class__ is enum_type else members[v]
+                    for v in values
+                ]
+            except (KeyError, TypeError):
+                pass
+        return super().to_python_many(values)
+
     def prepare(self, value: ET | None):
         """Prepare enum for serialisation."""
         if (value is not None) and isinstance(value, self.enum_type):
@@ -1080,6 +1487,8 @@ class EnumField(Field):
 class PathField(Field):
     """Field for handling Python Paths"""
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Value %s is not a valid path.",
     }
@@ -1114,6 +1523,8 @@ class RegexField(Field):
     Regular expressions use the Python syntax.
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Value '%s' is not a valid regular expression.",
         "syntax": "Value '%s' contains invalid syntax: %s.",
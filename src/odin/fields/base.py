@@ -1,11 +1,64 @@
 from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Names of all slots defined by cls (and its bases)."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(n for n in names if n not in ("__dict__", "__weakref__"))
+
+
+class CreationCounter:
+    """Order in which fields are created (used to retain the order of fields).
+
+    Read from a field the value is the position of the field, read from a field
+    type the value is the position that will be assigned to the next field.
+    """
+
+    __slots__ = ("next_value",)
+
+    def __init__(self):
+        self.next_value = 0
+
+    def __get__(self, instance, owner=None) -> int:
+        if instance is None:
+            return self.next_value
+        return instance._creation_counter
+
+    def __set__(self, instance, value: int):
+        instance._creation_counter = value
+
+    def assign(self) -> int:
+        """Fetch and increment the counter."""
+        value = self.next_value
+        self.next_value = value + 1
+        return value
+
+
+_creation_counter = CreationCounter()
 
 
 class BaseField:
     """Base all field inherit from."""
 
+    __slots__ = (
+        "verbose_name",
+        "verbose_name_plural",
+        "name",
+        "doc_text",
+        "attname",
+        "_creation_counter",
+    )
+
     # These track each time an instance is created. Used to retain order.
-    creation_counter = 0
+    creation_counter = _creation_counter
+    # Attributes holding derived state that is not copied (or pickled).
+    _transient_attrs: frozenset[str] = frozenset()
 
     def __init__(
         self,
@@ -18,14 +71,41 @@ class BaseField:
         self.name = name
         self.doc_text = doc_text
 
-        # Fetch and increment the creation counter
-        self.creation_counter = BaseField.creation_counter
-        BaseField.creation_counter += 1
+        self._creation_counter = _creation_counter.assign()
 
         self.attname: str | None = None
 
     def __hash__(self):
-        return self.creation_counter
+        return self._creation_counter
+
+    def __getstate__(self) -> dict[str, Any]:
+        """State of the field (excluding any derived state)."""
+        # Fields of sub-classes that do not define slots have a __dict__
+        state = dict(getattr(self, "__dict__", ()))
+        transient = self._transient_attrs
+        for name in _slot_names(self.__class__):
+            if name not in transient:
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    continue
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state of the field."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def clone(self):
+        """Create a shallow copy of this field.
+
+        Used to add the fields of a parent to a sub-class; fields are not modified
+        once created so the values of attributes are shared with the clone.
+        """
+        cls = self.__class__
+        obj = cls.__new__(cls)
+        obj.__setstate__(self.__getstate__())
+        return obj
 
     def __repr__(self):
         """Displays the module, class and name of the field."""
@@ -2,12 +2,11 @@
 
 import abc
 from collections.abc import Callable, Iterator
-from functools import cached_property
 from typing import Any
 
 from odin import bases, exceptions
-from odin.fields import Field
-from odin.resources import create_resource_from_dict
+from odin.fields import Field, NotProvided
+from odin.resources import create_resource_from_dict, full_clean_errors
 from odin.utils import value_in_choices
 from odin.validators import EMPTY_VALUES
 
@@ -26,6 +25,11 @@ class CompositeField(Field, metaclass=abc.ABCMeta):
 
     Fields that contain other resources eg DictAs/ListOf fields."""
 
+    __slots__ = ("_of", "_resource", "use_container")
+
+    # Child resources can be modified in place.
+    mutable_value = True
+
     @classmethod
     def delayed(cls, resource_callable: Callable[[], Any], **options):
         """Create a delayed resource field.
@@ -71,15 +75,21 @@ class CompositeField(Field, metaclass=abc.ABCMeta):
 
         super().__init__(**options)
 
-    @cached_property
+    @property
     def of(self):
         """Return the resource type."""
+        try:
+            return self._resource
+        except AttributeError:
+            pass
+
         resource = self._of
         if not hasattr(resource, "_meta") and callable(resource):
             resource = resource()
             if not hasattr(resource, "_meta"):
                 msg = f"{resource!r} is not a valid type for a related field."
                 raise TypeError(msg)
+        self._resource = resource
         return resource
 
     def to_python(self, value):
@@ -96,8 +106,51 @@ class CompositeField(Field, metaclass=abc.ABCMeta):
     def validate(self, value):
         """Validate the value."""
         super().validate(value)
+        errors = self.child_errors(value)
+        if errors is not None:
+            raise exceptions.ValidationError(errors)
+
+    def child_errors(self, value) -> list | dict | None:
+        """Errors from a full clean of the child resource(s) of a value.
+
+        Errors are collected without raising ``ValidationError``, ``None`` is
+        returned if the child resources are valid.
+        """
         if value not in EMPTY_VALUES:
-            value.full_clean()
+            return full_clean_errors(value)
+        return None
+
+    def check_empty(self, value):
+        """Check the value is not an empty collection (if not allowed)."""
+
+    def try_clean(self, value) -> exceptions.ValidationResult:
+        """Clean a value, child resources are validated without raising errors."""
+        field_type = type(self)
+        if field_type.clean is not Field.clean or field_type.validate not in (
+            CompositeField.validate,
+            ListOf.validate,
+            DictOf.validate,
+        ):
+            return super().try_clean(value)
+
+        if value is NotProvided:
+            value = self.get_default() if self.use_default_if_not_provided else None
+        try:
+            value = self.to_python(value)
+            Field.validate(self, value)
+        except exceptions.ValidationError as ve:
+            return exceptions.ValidationResult(None, ve.error_messages)
+
+        errors = self.child_errors(value)
+        if errors is not None:
+            return exceptions.ValidationResult(None, errors)
+
+        try:
+            self.check_empty(value)
+            self.run_validators(value)
+        except exceptions.ValidationError as ve:
+            return exceptions.ValidationResult(None, ve.error_messages)
+        return exceptions.ValidationResult(value)
 
     @abc.abstractmethod
     def item_iter_from_object(self, obj):
@@ -114,6 +167,8 @@ class CompositeField(Field, metaclass=abc.ABCMeta):
 class DictAs(CompositeField):
     """Treat a dictionary as a Resource."""
 
+    __slots__ = ()
+
     default_error_messages = {
         "invalid": "Must be a dict of type ``%r``.",
     }
@@ -134,6 +189,8 @@ ObjectAs = DictAs
 class ListOf(CompositeField):
     """List of resources."""
 
+    __slots__ = ("empty",)
+
     default_error_messages = {
         "invalid": "Must be a list of ``%r`` objects.",
         "null": "List cannot contain null entries.",
@@ -158,6 +215,8 @@ class ListOf(CompositeField):
                 values.append(method(value))
             except exceptions.ValidationError as ve:
                 errors[error_key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
 
         if errors:
             raise exceptions.ValidationError(errors)
@@ -184,10 +243,37 @@ class ListOf(CompositeField):
         """Validate the value."""
         # Skip The direct super method and apply it to each list item.
         super(CompositeField, self).validate(value)  # noqa
-        if value is not None:
-            super_validate = super().validate
-            self._process_list(value, super_validate)
+        errors = self.child_errors(value)
+        if errors is not None:
+            raise exceptions.ValidationError(errors)
+        self.check_empty(value)
+
+    def child_errors(self, value) -> dict | None:
+        """Errors from validating each resource in the list keyed by index."""
+        if value is None:
+            return None
+
+        item_validate = super(CompositeField, self).validate
+        errors = {}
+        for idx, item in enumerate(value):
+            try:
+                item_validate(item)
+            except exceptions.ValidationError as ve:
+                errors[str(idx)] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
+                continue
 
+            item_errors = super().child_errors(item)
+            if item_errors is not None:
+                errors[str(idx)] = item_errors
+                if exceptions.error_limit_reached(item_errors):
+                    break
+
+        return errors or None
+
+    def check_empty(self, value):
+        """Check the list is not empty (if not allowed)."""
         if (value is not None) and (not value) and (not self.empty):
             raise exceptions.ValidationError(self.error_messages["empty"])
 
@@ -211,6 +297,8 @@ ArrayOf = ListOf
 class DictOf(CompositeField):
     """Dictionary of resources."""
 
+    __slots__ = ("empty", "key_choices")
+
     default_error_messages = {
         "invalid": "Must be a dict of ``%r`` objects.",
         "null": "Dict cannot contain null entries.",
@@ -239,6 +327,8 @@ class DictOf(CompositeField):
                 values[key] = method(value)
             except exceptions.ValidationError as ve:
                 errors[key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
 
         if errors:
             raise exceptions.ValidationError(errors)
@@ -267,10 +357,41 @@ class DictOf(CompositeField):
         """Validate the value."""
         # Skip The direct super method and apply it to each list item.
         super(CompositeField, self).validate(value)  # noqa
-        if value is not None:
-            super_validate = super().validate
-            self._process_dict(value, super_validate)
+        errors = self.child_errors(value)
+        if errors is not None:
+            raise exceptions.ValidationError(errors)
+        self.check_empty(value)
+
+    def child_errors(self, value) -> list | dict | None:
+        """Errors from validating each resource in the dict keyed by key."""
+        if value is None:
+            return None
+
+        item_validate = super(CompositeField, self).validate
+        key_choices = self.key_choices
+        errors = {}
+        for key, item in value.items():
+            if key_choices and not value_in_choices(key, key_choices):
+                return [self.error_messages["invalid_key"] % item]
+
+            try:
+                item_validate(item)
+            except exceptions.ValidationError as ve:
+                errors[key] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    break
+                continue
+
+            item_errors = super().child_errors(item)
+            if item_errors is not None:
+                errors[key] = item_errors
+                if exceptions.error_limit_reached(item_errors):
+                    break
+
+        return errors or None
 
+    def check_empty(self, value):
+        """Check the dict is not empty (if not allowed)."""
         if (value is not None) and (not value) and (not self.empty):
             raise exceptions.ValidationError(self.error_messages["empty"], code="empty")
 
@@ -18,7 +18,7 @@ class VirtualField(BaseField):
     A virtual fields is treated like any other field during encoding/decoding (provided it can be written to).
     """
 
-    data_type_name = None
+    __slots__ = ("data_type_name", "is_attribute", "key", "resource")
 
     def __init__(  # noqa: PLR0913
         self,
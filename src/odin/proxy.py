@@ -76,6 +76,7 @@ class ResourceProxyOptions(ResourceOptions):
 
     def contribute_to_class(self, cls, _):  # noqa: PLR0912
         cls._meta = self
+        self.resource_type = cls
         cls_name = cls.__name__
         self.name = cls_name
         self.class_name = f"{cls.__module__}.{cls_name}"
@@ -272,6 +273,10 @@ class ResourceProxyBase(ResourceBase):
     def get_shadow(self):
         return self._shadow
 
+    def clone(self, deep=True, fields=None):
+        """Create a proxy of a clone of the shadowed resource."""
+        return self.proxy(self._shadow.clone(deep, fields))
+
 
 class ResourceProxy(ResourceProxyBase, metaclass=ResourceProxyType):
     """
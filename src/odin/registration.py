@@ -7,15 +7,45 @@ def generate_mapping_cache_name(from_obj, to_obj):
     return f"{from_obj.__module__}.{from_obj.__name__} > {to_obj.__module__}.{to_obj.__name__}"
 
 
+class ValidationErrorTable:
+    """Validation error types (for use in an except clause) and their handlers.
+
+    The table is rebuilt in place when a handler is registered so a reference
+    can be held by compiled validators.
+    """
+
+    __slots__ = ("error_types", "handlers")
+
+    def __init__(self):
+        self.error_types = ()
+        self.handlers = {}
+
+    def rebuild(self, handlers):
+        """Rebuild the table from the registered handlers."""
+        self.handlers = dict(handlers)
+        self.error_types = tuple(handlers)
+
+
 class ResourceCache:
     # Use the Borg pattern to share state between all instances. Details at
     # http://aspn.activestate.com/ASPN/Cookbook/Python/Recipe/66531.
     __shared_state = {
+        # Resources keyed by lower case name (and by exact name for fast lookups)
         "resources": {},
+        "resources_by_name": {},
+        # Registered resources keyed by each type in their MRO
         "resource_subclasses": {},
+        # Mappings keyed by name (and by from/to types for fast lookups)
         "mappings": {},
+        "mappings_by_type": {},
+        # Resolver types keyed by base type (and resolvers by object type)
         "field_resolvers": set(),
+        "field_resolver_types": {},
+        "field_resolver_cache": {},
         "validation_error_handlers": {},
+        "validation_error_table": ValidationErrorTable(),
+        # Type dispatch tables keyed by base resource(s)
+        "type_dispatch": {},
     }
 
     def __init__(self):
@@ -30,11 +60,34 @@ class ResourceCache:
         """
         for resource in resources:
             meta = getmeta(resource)
-            resource_name = meta.resource_name.lower()
-            self.resources[resource_name] = resource
-            class_name = meta.class_name.lower()
-            if resource_name != class_name:
-                self.resources[class_name] = resource
+            self._add_resource(meta.resource_name, resource)
+            if meta.resource_name.lower() != meta.class_name.lower():
+                self._add_resource(meta.class_name, resource)
+        # New resources may be accepted by (or change) an existing table
+        self.type_dispatch.clear()
+
+    def _add_resource(self, name: str, resource: type):
+        """Add a resource to the name lookups and the subclass index."""
+        key = name.lower()
+        previous = self.resources.get(key)
+        self.resources[key] = resource
+
+        if previous is not None and previous is not resource:
+            # Exact names are a cache of the lower case lookup
+            self.resources_by_name.clear()
+
+            previous_meta = getmeta(previous)
+            if not any(
+                self.resources.get(n.lower()) is previous
+                for n in (previous_meta.resource_name, previous_meta.class_name)
+            ):
+                # Replaced resource is no longer registered
+                for klass in previous.__mro__:
+                    self.resource_subclasses.get(klass, set()).discard(previous)
+        self.resources_by_name[name] = resource
+
+        for klass in resource.__mro__:
+            self.resource_subclasses.setdefault(klass, set()).add(resource)
 
     def get_resource(self, resource_name: str):
         """
@@ -45,20 +98,35 @@ class ResourceCache:
             requested name has not been registered.
 
         """
-        return self.resources.get(resource_name.lower())
+        resource = self.resources_by_name.get(resource_name)
+        if resource is None:
+            resource = self.resources.get(resource_name.lower())
+            if resource is not None:
+                self.resources_by_name[resource_name] = resource
+        return resource
 
     def get_child_resources(self, resource: type) -> Sequence[type]:
         """
         Get subclasses of a resource.
         """
-        resource_subclasses = self.resource_subclasses.get(resource)
-        if resource_subclasses is None:
-            self.resource_subclasses[resource] = resource_subclasses = {
-                child
-                for child in self.resources.values()
-                if issubclass(child, resource)
-            }
-        return resource_subclasses
+        return self.resource_subclasses.get(resource, set())
+
+    def get_type_dispatch(self, resource, factory):
+        """
+        Get the type dispatch table for a base resource (or resources).
+
+        Tables are built by *factory* on first use and discarded when a
+        resource is registered.
+
+        :param resource: Base resource, resource name or tuple of resources.
+        :param factory: Callable used to build the table for *resource*.
+
+        """
+        try:
+            return self.type_dispatch[resource]
+        except KeyError:
+            table = self.type_dispatch[resource] = factory(resource)
+            return table
 
     def register_mapping(self, mapping):
         """
@@ -69,6 +137,9 @@ class ResourceCache:
         """
         mapping_name = generate_mapping_cache_name(mapping.from_obj, mapping.to_obj)
         self.mappings[mapping_name] = mapping
+        # A type may have been matched by name to a replaced mapping
+        self.mappings_by_type.clear()
+        self.mappings_by_type[(mapping.from_obj, mapping.to_obj)] = mapping
 
     def get_mapping(self, from_obj, to_obj):
         """
@@ -80,8 +151,15 @@ class ResourceCache:
         :raises: KeyError if a mapping cannot be found.
 
         """
-        mapping_name = generate_mapping_cache_name(from_obj, to_obj)
-        return self.mappings[mapping_name]
+        try:
+            return self.mappings_by_type[(from_obj, to_obj)]
+        except KeyError:
+            # Fall back to matching by name (eg types that have been redefined)
+            mapping_name = generate_mapping_cache_name(from_obj, to_obj)
+            mapping = self.mappings_by_type[(from_obj, to_obj)] = self.mappings[
+                mapping_name
+            ]
+            return mapping
 
     def register_field_resolver(self, resolver, base_type):
         """
@@ -94,21 +172,47 @@ class ResourceCache:
 
         """
         self.field_resolvers.add((base_type, resolver))
+        self.field_resolver_types[base_type] = resolver
+        self.field_resolver_cache.clear()
 
     def get_field_resolver(self, obj_type):
         """
         Get a field resolver for an object type.
 
+        Resolvers are resolved along the MRO of *obj_type* (the most specific
+        base type is used) and cached.
+
         :param obj_type: Object type to find a field resolver for.
         :return: A field resolver instance for resolving fields on *obj_type*.
         :raises: KeyError if a resolver cannot be found.
 
         """
-        for base_type, field_resolver in self.field_resolvers:
-            if issubclass(obj_type, base_type):
-                return field_resolver(obj_type)
-        msg = f"No field resolver could be found for {obj_type!r}"
-        raise KeyError(msg)
+        try:
+            return self.field_resolver_cache[obj_type]
+        except KeyError:
+            pass
+
+        resolver_types = self.field_resolver_types
+        field_resolver = next(
+            (resolver_types[t] for t in obj_type.__mro__ if t in resolver_types),
+            None,
+        )
+        if field_resolver is None:
+            # Base types that are not in the MRO (eg ABC virtual subclasses)
+            field_resolver = next(
+                (
+                    resolver
+                    for base_type, resolver in resolver_types.items()
+                    if issubclass(obj_type, base_type)
+                ),
+                None,
+            )
+        if field_resolver is None:
+            msg = f"No field resolver could be found for {obj_type!r}"
+            raise KeyError(msg)
+
+        resolver = self.field_resolver_cache[obj_type] = field_resolver(obj_type)
+        return resolver
 
     def register_validation_error_handler(self, error_type, handler):
         """
@@ -119,6 +223,7 @@ class ResourceCache:
 
         """
         self.validation_error_handlers[error_type] = handler
+        self.validation_error_table.rebuild(self.validation_error_handlers)
 
     def get_validation_error_list(self):
         """
@@ -127,12 +232,17 @@ class ResourceCache:
         :return: List of error types.
 
         """
-        try:
-            return self._validation_error_list
-        except AttributeError:
-            validation_error_list = tuple(self.validation_error_handlers.keys())
-            self._validation_error_list = validation_error_list
-            return validation_error_list
+        return self.validation_error_table.error_types
+
+    def get_validation_error_table(self) -> ValidationErrorTable:
+        """
+        Get the table of validation error types and handlers.
+
+        The same table is returned for the life of the process, it is updated
+        as handlers are registered.
+
+        """
+        return self.validation_error_table
 
     def get_validation_error_handler(self, error_type):
         """
@@ -150,6 +260,7 @@ cache = ResourceCache()
 register_resources = cache.register_resources
 get_resource = cache.get_resource
 get_child_resources = cache.get_child_resources
+get_type_dispatch = cache.get_type_dispatch
 
 register_mapping = cache.register_mapping
 get_mapping = cache.get_mapping
@@ -159,4 +270,5 @@ get_field_resolver = cache.get_field_resolver
 
 register_validation_error_handler = cache.register_validation_error_handler
 get_validation_error_list = cache.get_validation_error_list
+get_validation_error_table = cache.get_validation_error_table
 get_validation_error_handler = cache.get_validation_error_handler
@@ -1,23 +1,40 @@
+import contextlib
+import contextvars
 import copy
 from collections.abc import Callable, Sequence
 from typing import (
     Any,
+    NamedTuple,
     TypeVar,
     cast,
 )
 
-from odin import bases, exceptions, registration
+from odin import bases, compiler, exceptions, registration
 from odin.exceptions import ResourceDefError, ValidationError
 from odin.fields import BaseField, Field, NotProvided, NotProvidedType
-from odin.utils import cached_property, field_iter_items, force_tuple, getmeta
+from odin.utils import cached_property, force_tuple, getmeta
 
 DEFAULT_TYPE_FIELD = "$"
 
 # Set of field names that cannot be used
 RESERVED_FIELD_NAMES = {
     "fields",  # Causes an infinite-recursion with clean_fields being a builtin method
+    "_dirty_fields",  # Used by resources that track changes
+    "_lazy_values",  # Used by lazy resources
 }
 
+# Set while a forced full clean is in progress so changes tracked by child
+# resources are ignored.
+_force_full_clean = contextvars.ContextVar("odin_force_full_clean", default=False)
+
+# Set while the value of a lazy resource is being converted so any child
+# resources are also created lazily.
+_lazy_build = contextvars.ContextVar("odin_lazy_build", default=False)
+
+# Set while resources created from a dict are cleaned (before being returned) so
+# values of frozen resources can be normalised.
+_creating_resources = contextvars.ContextVar("odin_creating_resources", default=False)
+
 
 class ResourceOptions:
     """Shared options used by resource instances."""
@@ -37,6 +54,10 @@ class ResourceOptions:
         "field_sorting",
         "user_data",
         "allow_field_shadowing",
+        "generate_init",
+        "slots",
+        "track_changes",
+        "frozen",
     )
 
     def __init__(self, meta):
@@ -61,7 +82,13 @@ class ResourceOptions:
         self.field_sorting: bool | NotProvidedType = NotProvided
         self.user_data: Any | None = None
         self.allow_field_shadowing: bool | NotProvidedType = NotProvided
+        self.generate_init: bool | NotProvidedType = NotProvided
+        self.slots: bool | NotProvidedType = NotProvided
+        self.track_changes: bool | NotProvidedType = NotProvided
+        self.frozen: bool | NotProvidedType = NotProvided
 
+        self.resource_type: type | None = None
+        self._finalised = False
         self._cache = {}
 
     def __repr__(self):
@@ -70,6 +97,7 @@ class ResourceOptions:
     def contribute_to_class(self, cls, _):
         """Contribute option to a resource class."""
         cls._meta = self
+        self.resource_type = cls
         self.name = cls.__name__
         self.class_name = f"{cls.__module__}.{cls.__name__}"
 
@@ -139,6 +167,26 @@ class ResourceOptions:
         if self.field_sorting is NotProvided:
             self.field_sorting = base.field_sorting if base else False
 
+        # Generation of init is inherited
+        if self.generate_init is NotProvided:
+            self.generate_init = base.generate_init if base else True
+
+        # Slots are inherited
+        if self.slots is NotProvided:
+            self.slots = base.slots if base else False
+
+        # Change tracking is inherited
+        if self.track_changes is NotProvided:
+            self.track_changes = base.track_changes if base else False
+
+        # Frozen is inherited and cannot be disabled by a sub-class
+        if self.frozen is NotProvided:
+            self.frozen = base.frozen if base else False
+        elif base and base.frozen and not self.frozen:
+            raise ResourceDefError(
+                "A resource cannot disable frozen when inherited from a parent."
+            )
+
     def _add_key_field(self, field):
         self._key_fields.append(field)
 
@@ -153,6 +201,8 @@ class ResourceOptions:
         if field.key:
             self._add_key_field(field)
         cached_property.clear_caches(self)
+        if self._finalised:
+            _finalise_resource(self.resource_type, self)
 
     def add_virtual_field(self, field):
         """Dynamically add a virtual field."""
@@ -179,6 +229,89 @@ class ResourceOptions:
         """Fields used in the resource init."""
         return self.fields
 
+    @cached_property
+    def compiled_from_dict(self) -> Callable:
+        """Function generated to create a resource from a dict.
+
+        See :py:func:`odin.compiler.generate_from_dict` for details.
+        """
+        return compiler.generate_from_dict(self.init_fields)
+
+    @cached_property
+    def compiled_try_from_dict(self) -> Callable:
+        """Function generated to create and validate a resource from a dict
+        without raising ``ValidationError``.
+
+        See :py:func:`odin.compiler.generate_try_from_dict` for details.
+        """
+        return compiler.generate_try_from_dict(
+            self.init_fields, _created_full_clean_errors
+        )
+
+    @cached_property
+    def _compiled_to_dict(self) -> dict[tuple[bool, bool], Callable]:
+        """Cache of generated ``to_dict`` functions."""
+        return {}
+
+    def compiled_to_dict(
+        self, include_virtual: bool = True, include_type_field: bool = False
+    ) -> Callable:
+        """Function generated to convert a resource into a dict.
+
+        A function is generated (and cached) for each combination of options.
+        See :py:func:`odin.compiler.generate_to_dict` for details.
+        """
+        key = (include_virtual, include_type_field)
+        try:
+            return self._compiled_to_dict[key]
+        except KeyError:
+            func = self._compiled_to_dict[key] = compiler.generate_to_dict(
+                self.all_fields if include_virtual else self.fields,
+                *((self.type_field, self.resource_name) if include_type_field else ()),
+            )
+            return func
+
+    @cached_property
+    def field_readers(
+        self,
+    ) -> dict[int, tuple[Sequence[BaseField], Sequence[tuple[BaseField, Callable]]]]:
+        """Fields paired with a reader that returns the prepared field value.
+
+        Keyed by the ``id`` of the field sequences of this resource (eg
+        ``all_fields``, ``element_fields``), the sequence is stored with the
+        readers so it is kept alive and can be checked for identity (sequences
+        are lists so can not be keys). Used by :py:func:`odin.utils.field_iter_items`.
+        """
+        return {
+            id(fields): (fields, tuple((f, compiler.field_reader(f)) for f in fields))
+            for fields in (
+                self.all_fields,
+                self.fields,
+                self.virtual_fields,
+                self.attribute_fields,
+                self.element_fields,
+            )
+        }
+
+    @cached_property
+    def field_converters(self) -> dict[str, Callable[[Any], Any]]:
+        """Mapping of attribute name to a converter used by lazy resources.
+
+        See :py:func:`odin.compiler.field_converter` for details.
+        """
+        return {f.attname: compiler.field_converter(f) for f in self.init_fields}
+
+    @cached_property
+    def validation_plan(self) -> Sequence[compiler.ValidationStep]:
+        """Plan used to clean the fields of a resource.
+
+        Built on first use and rebuilt if fields are added to the resource. See
+        :py:func:`odin.compiler.build_validation_plan` for details.
+        """
+        return compiler.build_validation_plan(
+            self.resource_type, self.fields, self.readonly_fields
+        )
+
     @cached_property
     def shadow_fields(self) -> Sequence[Field]:
         """Fields that are shadowing fields on base classes."""
@@ -194,6 +327,26 @@ class ResourceOptions:
             if (hasattr(f, "of") and issubclass(f.of, ResourceBase))
         )
 
+    @cached_property
+    def instance_slots(self) -> Sequence[str]:
+        """Names of the slots (defined by any class) copied by ``clone``."""
+        return tuple(
+            name
+            for klass in self.resource_type.__mro__
+            for name in force_tuple(klass.__dict__.get("__slots__"))
+            if name not in ("__dict__", "__weakref__") and name not in _NON_CLONED_STATE
+        )
+
+    @cached_property
+    def mutable_fields(self) -> Sequence[Field]:
+        """Fields with values that can be modified in place."""
+        return tuple(f for f in self.fields if f.mutable_value)
+
+    @cached_property
+    def has_mutable_fields(self) -> bool:
+        """Resource has fields with values that can be modified in place."""
+        return bool(self.mutable_fields)
+
     @cached_property
     def container_fields(self) -> Sequence[Field]:
         """All composite fields with the container flag.
@@ -247,6 +400,12 @@ class ResourceOptions:
 
         return tuple(sorted((self.field_map[f] for f in field_names), key=hash))
 
+    @cached_property
+    def hash_fields(self) -> Sequence[Field]:
+        """Fields used to hash a frozen resource; the key fields (or all fields)
+        with values that cannot be modified in place (and may not be hashable)."""
+        return tuple(f for f in self.key_fields or self.fields if not f.mutable_value)
+
     @cached_property
     def readonly_fields(self) -> Sequence[BaseField]:
         """Fields that can only be read from."""
@@ -315,17 +474,264 @@ def _add_parent_fields_to_class(
             field for field in base_meta.fields if field.attname not in added_attr_names
         ):
             added_attr_names.add(field.attname)
-            new_class.add_to_class(field.attname, copy.deepcopy(field))
+            new_class.add_to_class(field.attname, field.clone())
 
         # Clone any virtual fields
         for field in base_meta.virtual_fields:
-            new_class.add_to_class(field.attname, copy.deepcopy(field))
+            new_class.add_to_class(field.attname, field.clone())
 
         # Add to parents list
         new_meta.parents += base_meta.parents
         new_meta.parents.append(base)
 
 
+def _inherited_option(meta_def: object | None, bases: Sequence[type], name: str):
+    """Resolve a boolean meta option before the resource type is created.
+
+    Options are inherited in the same way as ``ResourceOptions.inherit_from``.
+    """
+    value = getattr(meta_def, name, NotProvided)
+    if value is NotProvided:
+        value = next(
+            (getattr(getmeta(base), name) for base in bases if hasattr(base, "_meta")),
+            False,
+        )
+    return value
+
+
+def _resource_slots(
+    meta_def: object | None,
+    bases: Sequence[type],
+    parents: Sequence[type],
+    field_names: Sequence[str],
+    attrs: dict[str, Any],
+) -> tuple[str, ...] | None:
+    """Determine the ``__slots__`` for a new resource type.
+
+    This is resolved before the class is created (a requirement of slots) so the
+    slots option is inherited in the same way as ``ResourceOptions.inherit_from``.
+
+    :returns: Slot names or ``None`` if slots are not enabled.
+    """
+    if not _inherited_option(meta_def, bases, "slots"):
+        return None
+
+    # Names that are already slots on a base class
+    provided = set()
+    for base in bases:
+        for klass in base.__mro__:
+            provided.update(force_tuple(klass.__dict__.get("__slots__")))
+
+    # Fields from the new class, any parents and additional slots that have been
+    # explicitly defined (eg to store values supplied to ``extra_attrs``).
+    names = [
+        *field_names,
+        *(
+            f.attname
+            for parent in parents
+            if hasattr(parent, "_meta")
+            for f in getmeta(parent).fields
+        ),
+        *force_tuple(attrs.pop("__slots__", None)),
+        "_lazy_values",
+        *(
+            ("_dirty_fields",)
+            if _inherited_option(meta_def, bases, "track_changes")
+            or _inherited_option(meta_def, bases, "frozen")
+            else ()
+        ),
+        *(("_cached_hash",) if _inherited_option(meta_def, bases, "frozen") else ()),
+    ]
+    return tuple(name for name in dict.fromkeys(names) if name and name not in provided)
+
+
+def _new_resource_class(
+    mcs: type,
+    name: str,
+    bases: tuple[type, ...],
+    parents: Sequence[type],
+    attrs: dict[str, Any],
+) -> tuple[type, object | None]:
+    """Create the class of a new resource type (shared by resource metaclasses).
+
+    ``Meta`` and ``__module__`` (and ``__slots__`` if slots are enabled) are
+    removed from ``attrs``; the remaining attributes are to be added to the class.
+
+    :returns: The new class and the ``Meta`` definition of the resource.
+    """
+    meta_def = attrs.pop("Meta", None)
+    namespace = {"__module__": attrs.pop("__module__")}
+    slots = _resource_slots(
+        meta_def,
+        bases,
+        parents,
+        [name for name, obj in attrs.items() if isinstance(obj, Field)],
+        attrs,
+    )
+    if slots is not None:
+        namespace["__slots__"] = slots
+    # Equivalent to super().__new__ of the resource metaclasses
+    return type.__new__(mcs, name, bases, namespace), meta_def
+
+
+def _install_init(new_class: "ResourceType", new_meta: ResourceOptions):
+    """Install a generated ``__init__`` unless the resource defines its own."""
+    init = new_class.__dict__.get("__init__")
+    if not (
+        init is None or init is ResourceBase.__init__ or compiler.is_generated(init)
+    ):
+        return
+
+    # Only replace the generic init (or one generated for a parent resource).
+    inherited_init = next(
+        base.__dict__["__init__"]
+        for base in new_class.__mro__[1:]
+        if "__init__" in base.__dict__
+    )
+    if not (
+        inherited_init is ResourceBase.__init__ or compiler.is_generated(inherited_init)
+    ):
+        return
+
+    if new_meta.generate_init:
+        # Compiling is the most expensive step of creating a resource type, defer
+        # generating the init until the first instance is created.
+        @compiler.deferred
+        def deferred_init(self, *args, **kwargs):
+            init = new_class.__dict__["__init__"]
+            if init is deferred_init:
+                init = _generate_init(new_class, new_meta)
+            init(self, *args, **kwargs)
+
+        deferred_init.__name__ = "__init__"
+        deferred_init.__qualname__ = f"{new_class.__qualname__}.__init__"
+        new_class.__init__ = deferred_init
+    else:
+        new_class.__init__ = ResourceBase.__init__
+
+
+def _generate_init(new_class: "ResourceType", new_meta: ResourceOptions):
+    """Generate and install the ``__init__`` of a resource."""
+    init = compiler.generate_init(
+        new_class, new_meta.init_fields, ResourceBase.__init__, new_meta.frozen
+    )
+    if init is None:
+        # Use the generic init; fields could not be expressed as parameters.
+        init = ResourceBase.__init__
+    else:
+        init.__qualname__ = f"{new_class.__qualname__}.__init__"
+    new_class.__init__ = init
+    return init
+
+
+def _tracking_setattr(self, name, value):
+    """Set an attribute and record the change (installed if tracking changes)."""
+    object.__setattr__(self, name, value)
+    dirty_fields = self._dirty_fields
+    if dirty_fields is not None:
+        dirty_fields.add(name)
+
+
+def _frozen_setattr(self, name, value):
+    raise exceptions.FrozenResourceError(
+        f"Cannot assign to {name!r}, {self.__class__.__name__!r} is frozen."
+    )
+
+
+def _frozen_delattr(self, name):
+    raise exceptions.FrozenResourceError(
+        f"Cannot delete {name!r}, {self.__class__.__name__!r} is frozen."
+    )
+
+
+def _frozen_key(self) -> tuple:
+    meta = getmeta(self)
+    return tuple(f.value_from_object(self) for f in meta.key_fields or meta.fields)
+
+
+def _frozen_eq(self, other):
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    return _frozen_key(self) == _frozen_key(other)
+
+
+def _frozen_hash(self):
+    value = self._cached_hash
+    if value is None:
+        hash_fields = getmeta(self).hash_fields
+        value = hash(
+            (self.__class__, *(f.value_from_object(self) for f in hash_fields))
+        )
+        object.__setattr__(self, "_cached_hash", value)
+    return value
+
+
+def _frozen_copy(self):
+    # Frozen resources can be shared rather than copied
+    return self
+
+
+def _frozen_deepcopy(self, memo):
+    meta = getmeta(self)
+    if not meta.has_mutable_fields:
+        # Frozen resources with only immutable values can be shared
+        return self
+
+    if self._lazy_values:
+        _load_lazy_values(self)
+    new_resource = _copy_instance_state(self, meta)
+    memo[id(self)] = new_resource
+    for field in meta.mutable_fields:
+        value = copy.deepcopy(field.value_from_object(self), memo)
+        object.__setattr__(new_resource, field.attname, value)
+    return new_resource
+
+
+def _install_frozen(new_class: "ResourceType"):
+    """Install the methods of a frozen resource."""
+    for name, value in (
+        ("__delattr__", _frozen_delattr),
+        ("__eq__", _frozen_eq),
+        ("__hash__", _frozen_hash),
+        ("__copy__", _frozen_copy),
+        ("__deepcopy__", _frozen_deepcopy),
+    ):
+        if name not in new_class.__dict__:
+            setattr(new_class, name, value)
+
+
+def _install_setattr(new_class: "ResourceType", new_meta: ResourceOptions):
+    """Install (or remove) the frozen or change tracking ``__setattr__``."""
+    setattr_ = new_class.__dict__.get("__setattr__")
+    if setattr_ is not None and setattr_ not in (
+        _frozen_setattr,
+        _tracking_setattr,
+        object.__setattr__,
+    ):
+        # Resource defines its own
+        return
+
+    if new_meta.frozen:
+        new_class.__setattr__ = _frozen_setattr
+        _install_frozen(new_class)
+    elif new_meta.track_changes:
+        new_class.__setattr__ = _tracking_setattr
+    elif new_class.__setattr__ is _tracking_setattr:
+        # Opted out of tracking inherited from a parent
+        new_class.__setattr__ = object.__setattr__
+
+
+def _finalise_resource(new_class: "ResourceType", new_meta: ResourceOptions):
+    """Final steps once a resource type has been fully populated.
+
+    This is also re-applied if fields are added after the resource is ready.
+    """
+    new_meta._finalised = True
+
+    _install_init(new_class, new_meta)
+    _install_setattr(new_class, new_meta)
+
+
 class ResourceType(type):
     """Metaclass for all Resources."""
 
@@ -350,12 +756,10 @@ class ResourceType(type):
             return super_new(mcs, name, bases, attrs)
 
         # Create the class.
-        new_class = super_new(mcs, name, bases, {"__module__": attrs.pop("__module__")})
+        new_class, meta_def = _new_resource_class(mcs, name, bases, parents, attrs)
 
         # Create new meta instance
-        new_meta = _new_meta_instance(
-            mcs.meta_options, attrs.pop("Meta", None), new_class
-        )
+        new_meta = _new_meta_instance(mcs.meta_options, meta_def, new_class)
 
         # Bail out early if we have already created this class.
         r = registration.get_resource(new_meta.resource_name)
@@ -388,6 +792,8 @@ class ResourceType(type):
             if hasattr(field, "on_resource_ready"):
                 field.on_resource_ready()
 
+        _finalise_resource(new_class, new_meta)
+
         if new_meta.abstract:
             return new_class
 
@@ -408,6 +814,14 @@ class ResourceType(type):
 
 
 class ResourceBase:
+    __slots__ = ()
+
+    # Instance state, defaults for resources that do not assign them (slotted
+    # resources fall back to ``__getattr__``).
+    _dirty_fields = None  # Fields assigned since the last clean (tracking changes)
+    _lazy_values = None  # Raw values of a lazy resource yet to be converted
+    _cached_hash = None  # Hash of a frozen resource
+
     def __init__(self, *args, **kwargs):
         args_len = len(args)
         meta = getmeta(self)
@@ -422,13 +836,14 @@ class ResourceBase:
         # is *not* consumed. We rely on this, so don't change the order
         # without changing the logic.
         fields_iter = iter(meta.init_fields)
+        set_value = object.__setattr__ if meta.frozen else setattr
         if args_len:
             if not kwargs:
                 for val, field in zip(args, fields_iter, strict=False):
-                    setattr(self, field.attname, val)
+                    set_value(self, field.attname, val)
             else:
                 for val, field in zip(args, fields_iter, strict=False):
-                    setattr(self, field.attname, val)
+                    set_value(self, field.attname, val)
                     kwargs.pop(field.name, None)
 
         # Now we're left with the unprocessed fields that *must* come from
@@ -438,13 +853,26 @@ class ResourceBase:
                 val = kwargs.pop(field.attname)
             except KeyError:
                 val = field.get_default()
-            setattr(self, field.attname, val)
+            set_value(self, field.attname, val)
 
         if kwargs:
             raise TypeError(
                 f"'{list(kwargs)[0]}' is an invalid keyword argument for this function"
             )
 
+    def __getattr__(self, name):
+        # Only called if an attribute is not found; load pending lazy values.
+        if name in ("_dirty_fields", "_lazy_values", "_cached_hash"):
+            return None  # Unassigned slot
+
+        lazy_values = self._lazy_values
+        if lazy_values and name in lazy_values:
+            return _load_lazy_value(self, name, lazy_values)
+
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: {self}>"
 
@@ -468,11 +896,50 @@ class ResourceBase:
         :param include_virtual: Include virtual fields when generating `dict`.
         :param include_type_field: Include type field when generating `dict`.
         """
+        return getmeta(self).compiled_to_dict(include_virtual, include_type_field)(self)
+
+    def clone(self, deep: bool = True, fields: Sequence[str] | None = None):
+        """Create a copy of this resource.
+
+        A faster alternative to ``copy.deepcopy`` that is driven by the resource
+        fields. Field values are copied by reference (values are immutable once
+        converted by ``to_python``) except for values that can be modified in place,
+        for these any lists and dicts are copied and child resources are cloned.
+        Any other attributes (eg those assigned by ``extra_attrs``) are copied by
+        reference.
+
+        Frozen resources are returned as is unless a deep copy is made of a
+        resource with values that can be modified in place.
+
+        :param deep: Copy lists/dicts and clone child resources; otherwise all
+            values are copied by reference (as with ``copy.copy``).
+        :param fields: Names of the fields to copy, any other fields are assigned
+            their default value.
+        """
         meta = getmeta(self)
-        fields = meta.all_fields if include_virtual else meta.fields
-        result = {meta.type_field: meta.resource_name} if include_type_field else {}
-        result.update((f.name, v) for f, v in field_iter_items(self, fields))
-        return result
+        if meta.frozen and fields is None and not (deep and meta.has_mutable_fields):
+            return self
+        if self._lazy_values:
+            _load_lazy_values(self)
+
+        # Field values are copied along with any other state
+        new_resource = _copy_instance_state(self, meta)
+
+        if fields is not None:
+            for field in meta.fields:
+                if field.name not in fields:
+                    object.__setattr__(new_resource, field.attname, field.get_default())
+            if new_resource._dirty_fields is not None:
+                # Not a copy of the validated resource
+                object.__setattr__(new_resource, "_dirty_fields", None)
+
+        if deep:
+            for field in meta.mutable_fields:
+                if fields is None or field.name in fields:
+                    value = _clone_value(field.value_from_object(self))
+                    object.__setattr__(new_resource, field.attname, value)
+
+        return new_resource
 
     def convert_to(self, to_resource, context=None, ignore_fields=None, **field_values):
         """Convert this resource into a specified resource.
@@ -514,63 +981,224 @@ class ResourceBase:
     def clean(self):
         """Chance to do more in depth validation."""
 
-    def full_clean(self, exclude=None, ignore_not_provided=False):
+    def full_clean(
+        self,
+        exclude=None,
+        ignore_not_provided=False,
+        force=False,
+        *,
+        max_errors: int | None = None,
+    ):
         """Calls clean_fields, clean on the resource and raises ``ValidationError``
         for any errors that occurred.
+
+        Resources that track changes (see the ``track_changes`` meta option) only
+        revalidate fields that have been assigned since the last successful full
+        clean (along with any fields that can be modified in place).
+
+        :param exclude: Names of fields to exclude from validation.
+        :param ignore_not_provided: Ignore fields that have not been provided.
+        :param force: Revalidate every field, including the fields of any child
+            resources, ignoring tracked changes.
+        :param max_errors: Stop validating once this many errors have been found
+            (including errors of child resources); use 1 to fail fast on the first
+            error. The default of ``None`` collects all errors.
         """
-        errors = {}
+        if max_errors is None:
+            errors = self._full_clean_errors(exclude, ignore_not_provided, force)
+        else:
+            with exceptions.error_limit(max_errors):
+                errors = self._full_clean_errors(exclude, ignore_not_provided, force)
+        if errors:
+            raise ValidationError(errors)
 
-        try:
-            self.clean_fields(exclude, ignore_not_provided)
-        except ValidationError as e:
-            errors = e.update_error_dict(errors)
+    def validate(
+        self,
+        exclude=None,
+        ignore_not_provided=False,
+        force=False,
+        *,
+        max_errors: int | None = None,
+    ) -> exceptions.ValidationResult:
+        """Validate the resource without raising ``ValidationError``.
+
+        Performs the same validation as :py:meth:`full_clean`, errors (including
+        errors of child resources) are collected and returned rather than raised.
+
+        :returns: A result with either this resource or the errors found.
+        """
+        if max_errors is None:
+            errors = self._full_clean_errors(exclude, ignore_not_provided, force)
+        else:
+            with exceptions.error_limit(max_errors):
+                errors = self._full_clean_errors(exclude, ignore_not_provided, force)
+        if errors:
+            return exceptions.ValidationResult(None, errors)
+        return exceptions.ValidationResult(self)
+
+    def _full_clean_errors(
+        self, exclude=None, ignore_not_provided=False, force=False
+    ) -> dict[str, list]:
+        """Errors from a full clean of the resource (empty if valid)."""
+        if self._lazy_values:
+            _load_lazy_values(self)
+
+        if force:
+            token = _force_full_clean.set(True)
+            try:
+                return self._full_clean_errors(exclude, ignore_not_provided)
+            finally:
+                _force_full_clean.reset(token)
+
+        meta = getmeta(self)
+        if (
+            (meta.frozen or (meta.track_changes and not meta.has_mutable_fields))
+            and self._dirty_fields == set()
+            and not _force_full_clean.get()
+        ):
+            # Nothing has changed since the last successful clean.
+            return {}
+
+        if type(self).clean_fields is ResourceBase.clean_fields:
+            errors = self._clean_fields_errors(exclude, ignore_not_provided)
+        else:
+            errors = {}
+            try:
+                self.clean_fields(exclude, ignore_not_provided)
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+        if errors and exceptions.error_limit_reached(errors):
+            return errors
 
         try:
             self.clean()
         except ValidationError as e:
+            exceptions.error_limit_reached(e, exceptions.count_errors(e.error_messages))
             errors = e.update_error_dict(errors)
 
+        if errors:
+            return errors
+
+        if (meta.frozen or meta.track_changes) and not (exclude or ignore_not_provided):
+            object.__setattr__(self, "_dirty_fields", set())
+        return errors
+
+    def clean_fields(
+        self,
+        exclude=None,
+        ignore_not_provided=False,
+        *,
+        max_errors: int | None = None,
+    ):
+        """Clean each field of the resource and raise ``ValidationError`` for any
+        errors that occurred.
+
+        :param exclude: Names of fields to exclude from validation.
+        :param ignore_not_provided: Ignore fields that have not been provided.
+        :param max_errors: Stop validating once this many errors have been found;
+            use 1 to fail fast on the first error.
+        """
+        if max_errors is None:
+            errors = self._clean_fields_errors(exclude, ignore_not_provided)
+        else:
+            with exceptions.error_limit(max_errors):
+                errors = self._clean_fields_errors(exclude, ignore_not_provided)
         if errors:
             raise ValidationError(errors)
 
-    def clean_fields(self, exclude=None, ignore_not_provided=False):
+    def _clean_fields_errors(  # noqa: PLR0912
+        self, exclude=None, ignore_not_provided=False
+    ) -> dict[str, list]:
+        """Errors from cleaning each field of the resource (empty if valid)."""
         errors = {}
+
         meta = getmeta(self)
+        dirty_fields = (
+            self._dirty_fields
+            if meta.track_changes and not _force_full_clean.get()
+            else None
+        )
+        # Cleaned values are only assigned to a frozen resource while it is being
+        # created (and before it has been hashed), otherwise values must be clean.
+        set_value = object.__setattr__ if meta.frozen else setattr
+        frozen = meta.frozen and not (
+            _creating_resources.get() and self._cached_hash is None
+        )
+
+        for step in meta.validation_plan:
+            if exclude and step.name in exclude:
+                continue
 
-        for f in meta.fields:
-            if exclude and f.name in exclude:
+            if not (
+                dirty_fields is None
+                or step.mutable_value
+                or step.attname in dirty_fields
+            ):
                 continue
 
-            raw_value = f.value_from_object(self)
+            raw_value = value = step.get_value(self)
 
-            if (f.null and raw_value is None) or (
+            if (step.null and raw_value is None) or (
                 ignore_not_provided and raw_value is NotProvided
             ):
                 continue
 
-            try:
-                raw_value = f.clean(raw_value)
-            except ValidationError as e:
-                errors[f.name] = e.messages
+            if step.try_clean is not None:
+                # Errors of child resources are returned rather than raised
+                value, field_errors = step.try_clean(raw_value)
+                if field_errors is None:
+                    raw_value = value
+                else:
+                    errors[step.name] = (
+                        [field_errors]
+                        if isinstance(field_errors, dict)
+                        else field_errors
+                    )
+                    if exceptions.error_limit_reached(field_errors):
+                        break
+            else:
+                try:
+                    raw_value = step.clean(raw_value)
+                except ValidationError as e:
+                    errors[step.name] = e.messages
+                    if exceptions.error_limit_reached(e):
+                        break
 
             # Check for resource level clean methods.
-            clean_method = getattr(self, f"clean_{f.attname}", None)
-            if callable(clean_method):
+            if step.clean_method is not None:
                 try:
-                    raw_value = clean_method(raw_value)
+                    raw_value = step.clean_method(self, raw_value)
                 except ValidationError as e:
-                    errors.setdefault(f.name, []).extend(e.messages)
+                    # Only count the field once if cleaning the value also failed
+                    counted = 0 if step.name in errors else None
+                    errors.setdefault(step.name, []).extend(e.messages)
+                    if exceptions.error_limit_reached(e, counted):
+                        break
 
-            if f not in meta.readonly_fields:
-                setattr(self, f.attname, raw_value)
+            if step.readonly:
+                continue
+            if not frozen:
+                set_value(self, step.attname, raw_value)
+            elif (
+                raw_value is not value
+                and raw_value != value
+                and step.name not in errors
+            ):
+                e = ValidationError(
+                    f"Value of a frozen resource must be clean; expected {raw_value!r}."
+                )
+                errors[step.name] = e.messages
+                if exceptions.error_limit_reached(e):
+                    break
 
-        if errors:
-            raise ValidationError(errors)
+        return errors
 
 
 class Resource(ResourceBase, metaclass=ResourceType):
     """Resource object"""
 
+    __slots__ = ()
+
 
 def resolve_resource_type(
     resource: type[ResourceBase],
@@ -622,6 +1250,8 @@ def create_resource_from_iter(
                 value = f.to_python(raw_value)
             except ValidationError as ve:
                 errors[f.name] = ve.error_messages
+                if exceptions.error_limit_reached(ve):
+                    raise ValidationError(errors) from None
         attrs.append(value)
 
     if errors:
@@ -635,14 +1265,146 @@ def create_resource_from_iter(
     return new_resource
 
 
+def create_resources_from_iter(
+    rows, resource, full_clean=True, default_to_not_provided=False
+) -> list:
+    """Create resources from a batch of rows (eg CSV data).
+
+    The equivalent of calling :py:func:`create_resource_from_iter` for each row
+    (including the error raised for the first row that is invalid), the values
+    of each field (column) are converted together with ``Field.to_python_many``.
+
+    :param rows: Iterable of rows, each an iterable of values (in field order).
+    :param resource: A resource type to create.
+    :param full_clean: Perform a full clean as part of the creation.
+    :param default_to_not_provided: If an value is not supplied keep the value as NotProvided.
+    :return: List of new instances of the resource type.
+    """
+    rows = [list(row) for row in rows]
+    resource_type = resource
+    fields = getmeta(resource_type).fields
+    len_fields = len(fields)
+
+    # Pad (or trim) each row to the number of fields
+    extras = []
+    for row in rows:
+        len_row = len(row)
+        if len_row < len_fields:
+            row.extend([NotProvided] * (len_fields - len_row))
+            extras.append(None)
+        else:
+            extras.append(row[len_fields:] or None)
+
+    try:
+        columns = [
+            _column_to_python(f, [row[idx] for row in rows], default_to_not_provided)
+            for idx, f in enumerate(fields)
+        ]
+    except ValidationError:
+        # Create each row to report the error of the first invalid row
+        return [
+            create_resource_from_iter(
+                row, resource, full_clean, default_to_not_provided
+            )
+            for row in rows
+        ]
+
+    resources = []
+    values = zip(*columns, strict=True) if columns else [()] * len(rows)
+    for attrs, extra in zip(values, extras, strict=True):
+        new_resource = resource_type(*attrs)
+        if extra:
+            new_resource.extra_attrs(extra)
+        if full_clean:
+            new_resource.full_clean()
+        resources.append(new_resource)
+    return resources
+
+
+def _column_to_python(field: Field, column: list, default_to_not_provided: bool):
+    """Convert a column of values, values that are not provided are defaulted."""
+    provided = [value for value in column if value is not NotProvided]
+    if len(provided) == len(column):
+        return field.to_python_many(column)
+
+    converted = iter(field.to_python_many(provided))
+    if default_to_not_provided:
+        return [
+            NotProvided if value is NotProvided else next(converted) for value in column
+        ]
+    return [
+        (field.get_default() if field.use_default_if_not_provided else None)
+        if value is NotProvided
+        else next(converted)
+        for value in column
+    ]
+
+
 R = TypeVar("R")
 
 
+class TypeDispatch(NamedTuple):
+    """Resource types resolved from the type field for a base resource(s)."""
+
+    type_field: str | None
+    """Type field shared by all base resources (``None`` if they differ)."""
+    types: dict[str | None, type[ResourceBase]]
+    """Resource type keyed by type field value (``None`` if not supplied)."""
+
+
+def _build_type_dispatch(resource) -> TypeDispatch:
+    """Build a dispatch table for each name a registered resource can be identified by."""
+    candidates = resource if isinstance(resource, tuple) else (resource,)
+    resolved = [resolve_resource_type(r) for r in candidates]
+    type_fields = {type_field for _, type_field, _ in resolved}
+    if len(type_fields) != 1:
+        return TypeDispatch(None, {})
+    (type_field,) = type_fields
+
+    names = {None}
+    for candidate, (resource_name, _, name_space) in zip(
+        candidates, resolved, strict=True
+    ):
+        # Abstract resources are not registered but do index their children
+        base_type = (
+            candidate
+            if isinstance(candidate, type)
+            else registration.get_resource(resource_name)
+        )
+        if base_type is None:
+            continue
+        for child in registration.get_child_resources(base_type):
+            meta = getmeta(child)
+            names.update((meta.resource_name, meta.class_name))
+            if name_space and meta.resource_name.startswith(f"{name_space}."):
+                names.add(meta.resource_name[len(name_space) + 1 :])
+
+    types = {}
+    for name in names:
+        with contextlib.suppress(exceptions.ResourceException):
+            types[name] = _resolve_type_from_candidates({type_field: name}, resource)
+    return TypeDispatch(type_field, types)
+
+
 def _resolve_type_from_resource(data, resource):
     """Resolve resource type from resource(s)
 
-    If a data type is supplied check it is correct.
+    If a data type is supplied check it is correct. Names of registered resources
+    are resolved using a dispatch table (cached by the registry).
     """
+    if isinstance(resource, list):
+        resource = tuple(resource)
+    dispatch = registration.get_type_dispatch(resource, _build_type_dispatch)
+    if dispatch.type_field is not None:
+        try:
+            return dispatch.types[data.get(dispatch.type_field) or None]
+        except (KeyError, TypeError):
+            pass
+    return _resolve_type_from_candidates(data, resource)
+
+
+def _resolve_type_from_candidates(data, resource):
+    """Resolve resource type from resource(s) by checking each candidate."""
     resource_type = None
 
     # Convert to single resource then resolve document type
@@ -704,12 +1466,118 @@ def _resolve_type_from_data(data):
     return resource_type
 
 
-def create_resource_from_dict(
+# Instance state that is not copied by clone.
+_NON_CLONED_STATE = frozenset(("_lazy_values", "_cached_hash"))
+
+
+def _copy_instance_state(resource, meta: ResourceOptions):
+    """Create an uninitialised instance with a copy of the state of resource."""
+    resource_type = resource.__class__
+    new_resource = resource_type.__new__(resource_type)
+    getattribute = object.__getattribute__
+    setattr_ = object.__setattr__
+
+    instance_dict = getattr(resource, "__dict__", None)
+    if instance_dict is not None:
+        new_dict = new_resource.__dict__
+        new_dict.update(instance_dict)
+        for name in _NON_CLONED_STATE.intersection(new_dict):
+            del new_dict[name]
+
+    for name in meta.instance_slots:
+        with contextlib.suppress(AttributeError):  # Unassigned slot
+            setattr_(new_resource, name, getattribute(resource, name))
+
+    dirty_fields = new_resource._dirty_fields
+    if dirty_fields is not None:
+        setattr_(new_resource, "_dirty_fields", set(dirty_fields))
+
+    return new_resource
+
+
+def _clone_value(value):
+    """Clone any resources and copy lists and dicts; other values are returned."""
+    if isinstance(value, ResourceBase):
+        return value.clone()
+    if isinstance(value, list):
+        return [_clone_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _clone_value(v) for k, v in value.items()}
+    return value
+
+
+def _uses_field_init(resource_type) -> bool:
+    """Resource type is initialised from fields (does not customise __init__)."""
+    init = resource_type.__init__
+    return init is ResourceBase.__init__ or compiler.is_generated(init)
+
+
+def _load_lazy_value(resource, attname: str, lazy_values: dict[str, Any]):
+    """Convert and assign a pending value of a lazy resource."""
+    convert = getmeta(resource).field_converters[attname]
+    token = _lazy_build.set(True)
+    try:
+        value = convert(lazy_values.pop(attname))
+    finally:
+        _lazy_build.reset(token)
+    object.__setattr__(resource, attname, value)
+    return value
+
+
+def _load_lazy_values(resource):
+    """Convert all pending values of a lazy resource."""
+    lazy_values = resource._lazy_values
+    converters = getmeta(resource).field_converters
+    instance_dict = getattr(resource, "__dict__", None)
+    token = _lazy_build.set(True)
+    try:
+        for attname, value in lazy_values.items():
+            # Skip values that have been assigned since the resource was created
+            if instance_dict is None:
+                try:
+                    object.__getattribute__(resource, attname)
+                    continue
+                except AttributeError:
+                    pass
+            elif attname in instance_dict:
+                continue
+
+            object.__setattr__(resource, attname, converters[attname](value))
+    finally:
+        _lazy_build.reset(token)
+    lazy_values.clear()
+
+
+def _create_lazy_resource(resource_type, d, default_to_not_provided):
+    """Create a resource that converts field values on first access."""
+    new_resource = resource_type.__new__(resource_type)
+    lazy_values = {}
+    for field in getmeta(resource_type).init_fields:
+        value = d.pop(field.name, NotProvided)
+        if value is not NotProvided:
+            lazy_values[field.attname] = value
+        elif not default_to_not_provided:
+            value = field.get_default() if field.use_default_if_not_provided else None
+            object.__setattr__(new_resource, field.attname, value)
+        else:
+            object.__setattr__(new_resource, field.attname, value)
+    object.__setattr__(new_resource, "_lazy_values", lazy_values)
+
+    if d:
+        new_resource.extra_attrs(d)
+
+    return new_resource
+
+
+def create_resource_from_dict(  # noqa: PLR0913, PLR0917
     d: dict[str, Any],
     resource: type[R] = None,
     full_clean: bool = True,
     copy_dict: bool = True,
     default_to_not_provided: bool = False,
+    lazy: bool | None = None,
+    *,
+    max_errors: int | None = None,
 ):
     """Create a resource from a dict.
 
@@ -721,7 +1589,19 @@ def create_resource_from_dict(
     :param copy_dict: Use a copy of the input dictionary rather than destructively processing the input dict.
     :param default_to_not_provided: If a value is not supplied keep the value as NOT_PROVIDED. This is used
         to support merging an updated value.
+    :param lazy: Keep the raw values and only convert a field when it is first accessed, any child resources are
+        also created lazily; the ``full_clean`` is deferred until ``full_clean`` is called on the resource. Resources
+        with a custom ``__init__`` are always created eagerly. The default of ``None`` creates a lazy resource if
+        the value of a lazy resource is being converted.
+    :param max_errors: Stop validating once this many errors have been found (see
+        :py:meth:`ResourceBase.full_clean`); use 1 to fail fast on the first error.
     """
+    if max_errors is not None:
+        with exceptions.error_limit(max_errors):
+            return create_resource_from_dict(
+                d, resource, full_clean, copy_dict, default_to_not_provided, lazy
+            )
+
     if not isinstance(d, dict):
         raise TypeError("`d` must be a dict instance.")
 
@@ -734,46 +1614,29 @@ def create_resource_from_dict(
         else _resolve_type_from_data(d)
     )
 
-    attrs = []
-    errors = {}
-    meta = getmeta(resource_type)
-    # Extract field attributes
-    for f in meta.init_fields:
-        value = d.pop(f.name, NotProvided)
-        if value is NotProvided:
-            if not default_to_not_provided:
-                value = f.get_default() if f.use_default_if_not_provided else None
-        else:
-            try:
-                value = f.to_python(value)
-            except ValidationError as ve:
-                errors[f.name] = ve.error_messages
-        attrs.append(value)
-
-    # Stop if there are any errors
-    if errors and full_clean:
-        raise ValidationError(errors)
-
-    # Create the new instance
-    new_resource = resource_type(*attrs)
-
-    if d:
-        # If there are any extra attributes let the resource handle them
-        new_resource.extra_attrs(d)
+    if lazy is None:
+        lazy = _lazy_build.get()
+    if lazy and _uses_field_init(resource_type):
+        return _create_lazy_resource(resource_type, d, default_to_not_provided)
 
+    # Extract field attributes, create and validate the new instance.
+    meta = getmeta(resource_type)
     if full_clean:
-        # Validate the resource in full
-        new_resource.full_clean()
-
-    return new_resource
+        return meta.compiled_try_from_dict(
+            resource_type, d, default_to_not_provided
+        ).unwrap()
+    return meta.compiled_from_dict(resource_type, d, False, default_to_not_provided)
 
 
-def build_object_graph(
+def build_object_graph(  # noqa: PLR0913, PLR0917
     d: dict[str, Any],
     resource: type[R] | None = None,
     full_clean: bool = True,
     copy_dict: bool = True,
     default_to_not_supplied: bool = False,
+    lazy: bool = False,
+    *,
+    max_errors: int | None = None,
 ) -> R:
     """Generate an object graph from a dict
 
@@ -784,17 +1647,29 @@ def build_object_graph(
     :param copy_dict: Clone the dict before doing build; default is `True`
     :param default_to_not_supplied: If a value is not supplied, keep the value as NOT_PROVIDED. This is used
         to support merging an updated value.
+    :param lazy: Build lazy resources, fields (and child resources) are only converted when first accessed. Call
+        ``full_clean`` on the resource to validate (this converts all fields).
+    :param max_errors: Stop validating once this many errors have been found, the
+        errors raised keep the same structure as if all errors had been collected;
+        use 1 to fail fast on the first error. The default of ``None`` collects all
+        errors.
     :raises ValidationError: When building the object graph, any issues discovered are raised as a ValidationError.
     """
+    if max_errors is not None:
+        with exceptions.error_limit(max_errors):
+            return build_object_graph(
+                d, resource, full_clean, copy_dict, default_to_not_supplied, lazy
+            )
+
     if isinstance(d, dict):
         return create_resource_from_dict(
-            d, resource, full_clean, copy_dict, default_to_not_supplied
+            d, resource, full_clean, copy_dict, default_to_not_supplied, lazy
         )
 
     if isinstance(d, list):
         return [
             build_object_graph(
-                o, resource, full_clean, copy_dict, default_to_not_supplied
+                o, resource, full_clean, copy_dict, default_to_not_supplied, lazy
             )
             for o in d
         ]
@@ -802,6 +1677,94 @@ def build_object_graph(
     return d
 
 
+def try_build(
+    d: dict[str, Any] | list,
+    resource: type[R] | None = None,
+    copy_dict: bool = True,
+    default_to_not_supplied: bool = False,
+    *,
+    max_errors: int | None = None,
+) -> exceptions.ValidationResult:
+    """Build and validate an object graph from a dict without raising ``ValidationError``.
+
+    The non-raising equivalent of :py:func:`build_object_graph` (with a full clean);
+    errors are collected (and passed up from child resources) without being raised.
+
+    .. code-block:: python
+
+        result = try_build(data, Book)
+        if result.is_valid:
+            book = result.value
+        else:
+            log.warning("Invalid book: %s", result.errors)
+
+    :param d: Dictionary (or list of dictionaries) to build from.
+    :param resource: A resource type, resource name or list of resources and names to use as the base for creating a
+        resource. If a list is supplied, the first item will be used if a resource type is not supplied.
+    :param copy_dict: Clone the dict before doing build; default is `True`
+    :param default_to_not_supplied: If a value is not supplied, keep the value as NOT_PROVIDED.
+    :param max_errors: Stop validating once this many errors have been found; use 1 to fail fast on the first error.
+    :returns: A result with either the object graph or the errors found; for a list the errors of the first invalid
+        item are returned (matching the exception raised by ``build_object_graph``).
+    """
+    if max_errors is not None:
+        with exceptions.error_limit(max_errors):
+            return try_build(d, resource, copy_dict, default_to_not_supplied)
+
+    if isinstance(d, dict):
+        if copy_dict:
+            d = d.copy()
+        try:
+            resource_type = (
+                _resolve_type_from_resource(d, resource)
+                if resource
+                else _resolve_type_from_data(d)
+            )
+        except ValidationError as ve:
+            return exceptions.ValidationResult(None, ve.error_messages)
+        return getmeta(resource_type).compiled_try_from_dict(
+            resource_type, d, default_to_not_supplied
+        )
+
+    if isinstance(d, list):
+        values = []
+        for o in d:
+            result = try_build(o, resource, copy_dict, default_to_not_supplied)
+            if result.errors is not None:
+                return result
+            values.append(result.value)
+        return exceptions.ValidationResult(values)
+
+    return exceptions.ValidationResult(d)
+
+
+def _created_full_clean_errors(resource) -> dict[str, list] | None:
+    """Errors from the full clean of a resource created from a dict (see
+    :py:func:`full_clean_errors`); values of frozen resources are normalised."""
+    if _creating_resources.get():
+        return full_clean_errors(resource)
+    token = _creating_resources.set(True)
+    try:
+        return full_clean_errors(resource)
+    finally:
+        _creating_resources.reset(token)
+
+
+def full_clean_errors(resource) -> dict[str, list] | None:
+    """Errors from a full clean of a resource, ``None`` if the resource is valid.
+
+    Errors are collected without raising ``ValidationError`` unless the resource
+    customises ``full_clean``.
+    """
+    if type(resource).full_clean is ResourceBase.full_clean:
+        return resource._full_clean_errors() or None
+    try:
+        resource.full_clean()
+    except ValidationError as ve:
+        return ve.error_messages
+    return None
+
+
 class ResourceIterable(bases.ResourceIterable):
     """Iterable that yields resources."""
 
@@ -65,7 +65,9 @@ class cached_property:  # noqa - Made to match property builtin
 
     @staticmethod
     def clear_caches(instance):
-        instance._cache = {}
+        # Skip if nothing is cached (eg fields being added while a class is created)
+        if getattr(instance, "_cache", None):
+            instance._cache = {}
 
     def __init__(self, func):
         self.func = func
@@ -162,8 +164,15 @@ def field_iter_items(resource, fields: Sequence | None = None) -> Iterator[tuple
     meta = getmeta(resource)
     if fields is None:
         fields = meta.all_fields
-    for f in fields:
-        yield f, f.prepare(f.value_from_object(resource))
+
+    # Fields sequences of the resource have pre-built readers
+    entry = getattr(meta, "field_readers", {}).get(id(fields))
+    if entry is None or entry[0] is not fields:
+        for f in fields:
+            yield f, f.prepare(f.value_from_object(resource))
+    else:
+        for f, reader in entry[1]:
+            yield f, reader(resource)
 
 
 def virtual_field_iter_items(resource) -> Iterator[tuple]:
@@ -85,8 +85,8 @@ class BaseValidator:
 
     def __call__(self, value):
         cleaned = self.clean(value)
-        params = {"limit_value": self.limit_value, "show_value": cleaned}
         if self.compare(cleaned, self.limit_value):
+            params = {"limit_value": self.limit_value, "show_value": cleaned}
             raise exceptions.ValidationError(
                 self.message % params, code=self.code, params=params
             )
@@ -366,3 +366,48 @@ def test_process_attribute__where_type_is_not_supported(tp, value, expected_erro
 #     assert options.field_type is odin.TypedDictField
 #     assert isinstance(options.field_args["key_field"], expected_key_field)
 #     assert isinstance(options.field_args["value_field"], expected_value_field)
+
+
+class TestFieldFactory:
+    def test_factory_is_cached_by_annotation(self):
+        a = list[str] | None
+        b = list[str] | None
+
+        assert a is not b
+        assert type_resolution.field_factory(a) is type_resolution.field_factory(b)
+
+    def test_fields_are_not_shared(self):
+        a = type_resolution.process_attribute(dict[str, int], odin.NotProvided)
+        b = type_resolution.process_attribute(dict[str, int], odin.NotProvided)
+
+        assert a is not b
+        assert a.key_field is not b.key_field
+        assert a.value_field is not b.value_field
+
+    def test_default_is_applied(self):
+        a = type_resolution.process_attribute(int | None, 42)
+        b = type_resolution.process_attribute(int | None, odin.NotProvided)
+
+        assert a.default == 42
+        assert a.null
+        assert b.default is odin.NotProvided
+        assert b.null
+
+    def test_annotation_options_are_not_changed(self):
+        options = odin.Options(verbose_name="Foo")
+        tp = Annotated[list[str], options]
+
+        actual = type_resolution.process_attribute(tp, "foo")
+
+        assert isinstance(actual, odin.TypedListField)
+        assert actual.verbose_name == "Foo"
+        assert actual.default == "foo"
+        assert options.field_type is None
+        assert "default" not in options.field_args
+
+    def test_constant_uses_value(self):
+        a = type_resolution.process_attribute(Final[str], "a")
+        b = type_resolution.process_attribute(Final[str], "b")
+
+        assert a.value == "a"
+        assert b.value == "b"
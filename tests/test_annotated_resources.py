@@ -1,5 +1,8 @@
 import datetime
 import json
+from typing import Final
+
+import odin
 
 from odin.codecs import json_codec
 from odin.utils import getmeta, snake_to_camel
@@ -142,3 +145,21 @@ class TestAnnotatedKitchenSink:
 }
         """
         )
+
+
+class TestAnnotatedSlots:
+    def test_slots_are_generated_from_annotations(self):
+        class SlottedBook(odin.AnnotatedResource):
+            class Meta:
+                slots = True
+
+            title: str
+            tags: list[str]
+            page_count: Final[int] = 42
+
+        target = SlottedBook(title="Foo", tags=["a"])
+
+        assert SlottedBook.__slots__ == ("title", "tags", "_lazy_values")
+        assert not hasattr(target, "__dict__")
+        assert target.title == "Foo"
+        assert target.page_count == 42
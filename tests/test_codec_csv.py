@@ -178,6 +178,41 @@ class TestReader:
         assert len(errors) == 2
         assert errors == [3, 5]
 
+    @pytest.mark.parametrize("batch_size", (1, 2, 4, 256))
+    def test_error_handler_with_batches(self, batch_size):
+        errors = []
+
+        with self.open_fixture("library-invalid.csv") as f:
+            target = csv_codec.reader(
+                f,
+                Book,
+                includes_header=True,
+                error_callback=lambda _, idx: errors.append(idx),
+            )
+            target.batch_size = batch_size
+            library = list(target)
+
+        assert [book.title for book in library] == [
+            "Consider Phlebas",
+            "The Moonstone",
+            "A Clockwork Orange",
+            "Equal Rites",
+        ]
+        assert errors == [3, 5]
+        assert target.error_count == 2
+        assert target.row_count == 6
+
+    def test_rows_before_an_error_are_returned(self):
+        library = []
+
+        with self.open_fixture("library-invalid.csv") as f:
+            target = csv_codec.reader(f, Book, includes_header=True)
+
+            with pytest.raises(odin.exceptions.ValidationError):
+                library.extend(target)
+
+        assert len(library) == 2
+
     def test_error_handler_returns_false(self):
         with self.open_fixture("library-invalid.csv") as f:
             target = csv_codec.reader(
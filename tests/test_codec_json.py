@@ -1,9 +1,21 @@
 import datetime
+import enum
+import json
 import os
 import uuid
-from io import StringIO
+from io import BytesIO, StringIO
+from unittest import mock
 
+import pytest
+
+import odin
 from odin.codecs import json_codec
+from odin.exceptions import (
+    CodecDecodeError,
+    CodecEncodeError,
+    ValidationError,
+    count_errors,
+)
 
 from .resources import *
 
@@ -71,3 +83,596 @@ class TestJSONCodec:
         assert out_resource.authors[0].name == in_resource.authors[0].name
         assert out_resource.publisher.name == in_resource.publisher.name
         assert out_resource.published[0] == in_resource.published[0]
+
+    def test_lazy_loads(self):
+        data = json_codec.dumps(
+            Book(
+                title="Consider Phlebas",
+                isbn="0-333-45430-8",
+                num_pages=471,
+                rrp=19.50,
+                fiction=True,
+                genre="sci-fi",
+                authors=[Author(name="Iain M. Banks")],
+                publisher=Publisher(name="Macmillan"),
+                published=[datetime.datetime(1987, 1, 1, tzinfo=datetime.timezone.utc)],
+            )
+        )
+
+        actual = json_codec.loads(data, lazy=True)
+
+        assert "title" in actual._lazy_values
+        assert actual.title == "Consider Phlebas"
+        assert "title" not in actual._lazy_values
+        assert actual.authors[0].name == "Iain M. Banks"
+        assert json_codec.dumps(actual) == data
+
+    def test_lazy_load_reports_errors_with_the_same_paths(self):
+        with open(os.path.join(FIXTURE_PATH_ROOT, "library-invalid-nested.json")) as f:
+            data = f.read()
+
+        with pytest.raises(ValidationError) as eager:
+            json_codec.loads(data)
+
+        target = json_codec.loads(data, lazy=True)
+        with pytest.raises(ValidationError) as lazy:
+            target.full_clean()
+
+        assert lazy.value.error_messages == eager.value.error_messages
+
+    def test_loads_max_errors(self):
+        with open(os.path.join(FIXTURE_PATH_ROOT, "library-invalid-nested.json")) as f:
+            data = f.read()
+
+        with pytest.raises(ValidationError) as all_errors:
+            json_codec.loads(data)
+        with pytest.raises(ValidationError) as result:
+            json_codec.loads(data, max_errors=1)
+
+        actual = result.value.error_messages
+        assert count_errors(all_errors.value.error_messages) > 1
+        assert count_errors(actual) == 1
+        (path,) = actual
+        assert path in all_errors.value.error_messages
+
+    @pytest.mark.parametrize("single_pass", (False, True))
+    def test_loads_invalid_max_errors(self, single_pass):
+        with mock.patch.object(json_codec, "get_backend") as get_backend:
+            with pytest.raises(ValueError, match="max_errors must be at least 1"):
+                json_codec.loads(
+                    '{"$": "Author", "name": "Iain M. Banks"}',
+                    max_errors=0,
+                    single_pass=single_pass,
+                )
+            get_backend.assert_not_called()
+
+    def test_invalid_max_errors(self):
+        fp = StringIO('[{"$": "Author", "name": "Iain M. Banks"}]')
+
+        with pytest.raises(ValueError, match="max_errors must be at least 1"):
+            json_codec.load(fp, max_errors=0)
+        with pytest.raises(ValueError, match="max_errors must be at least 1"):
+            json_codec.iterload(fp, max_errors=0)
+        assert fp.tell() == 0
+
+
+class TestIterLoad:
+    @pytest.fixture
+    def library(self):
+        with open(os.path.join(FIXTURE_PATH_ROOT, "library.json")) as f:
+            return f.read()
+
+    @pytest.mark.parametrize("chunk_size", (1, 7, 64 * 1024))
+    @pytest.mark.parametrize("binary", (False, True))
+    def test_path_into_document(self, library, chunk_size, binary):
+        expected = json_codec.loads(library).books
+        fp = BytesIO(library.encode()) if binary else StringIO(library)
+
+        actual = list(json_codec.iterload(fp, path="books", chunk_size=chunk_size))
+
+        assert [json_codec.dumps(book) for book in actual] == [
+            json_codec.dumps(book) for book in expected
+        ]
+
+    @pytest.mark.parametrize("chunk_size", (1, 3, 64 * 1024))
+    def test_top_level_array(self, chunk_size):
+        fp = StringIO(' [{"name": "Iain M. Banks"}, {"name": "Neil Gaiman"} ] ')
+
+        actual = list(json_codec.iterload(fp, Author, chunk_size=chunk_size))
+
+        assert [a.name for a in actual] == ["Iain M. Banks", "Neil Gaiman"]
+
+    @pytest.mark.parametrize("chunk_size", (1, 2, 64 * 1024))
+    def test_scalar_values(self, chunk_size):
+        fp = StringIO('{"a": {"b": 1.5e3}, "c": {"d": [12.25, -1, "x", null, []]}}')
+
+        actual = list(json_codec.iterload(fp, path=("c", "d"), chunk_size=chunk_size))
+
+        assert actual == [1225e-2, -1, "x", None, []]
+
+    @pytest.mark.parametrize("chunk_size", (1, 64 * 1024))
+    def test_keys_after_path(self, chunk_size):
+        fp = StringIO('{"a": {"b": [1, 2], "c": {"d": [3]}}, "e": "]}"} ')
+
+        actual = list(json_codec.iterload(fp, path="a.b", chunk_size=chunk_size))
+
+        assert actual == [1, 2]
+
+    def test_empty_array(self):
+        assert list(json_codec.iterload(StringIO("[ ]"), Author)) == []
+
+    def test_items_are_loaded_lazily(self):
+        fp = StringIO('[{"name": "Iain M. Banks"}, {"name": "Neil Gaiman"}, ')
+
+        actual = json_codec.iterload(fp, Author, chunk_size=1)
+
+        assert next(actual).name == "Iain M. Banks"
+        assert next(actual).name == "Neil Gaiman"
+        with pytest.raises(CodecDecodeError):
+            next(actual)
+
+    def test_invalid_item(self):
+        fp = StringIO('[{"name": "Iain M. Banks"}, {"name": null}]')
+
+        actual = json_codec.iterload(fp, Author)
+
+        assert next(actual).name == "Iain M. Banks"
+        with pytest.raises(ValidationError) as result:
+            next(actual)
+        assert "name" in result.value.error_messages
+
+    @pytest.mark.parametrize(
+        "data, path",
+        (
+            ("", None),
+            ('{"books": []}', None),
+            ("[1 2]", None),
+            ("[1,]", None),
+            ('{"books": []}', "library.books"),
+            ('{"library": {"books": {}}}', "library.books"),
+            ('["a"] trailing garbage', None),
+            ("[1] []", None),
+            ('{"books": [1], "a"}', "books"),
+            ('{"books": [1]}}', "books"),
+            ('{"books": [1]', "books"),
+        ),
+    )
+    def test_invalid_document(self, data, path):
+        with pytest.raises(CodecDecodeError):
+            list(json_codec.iterload(StringIO(data), path=path, chunk_size=2))
+
+    def test_invalid_value_is_not_read_to_the_end(self):
+        fp = StringIO('[1, {"a" 1}, ' + "2, " * 10_000 + "3]")
+
+        actual = json_codec.iterload(fp, chunk_size=16)
+
+        assert next(actual) == 1
+        with pytest.raises(CodecDecodeError, match="Expecting ':' delimiter"):
+            next(actual)
+        assert fp.tell() < 100
+
+
+class Colour(enum.IntEnum):
+    Red = 1
+
+
+class Tag(str):
+    pass
+
+
+class TypeNamedField(odin.Resource):
+    class Meta:
+        name_space = None
+
+    name = odin.StringField(name="$")
+    size = odin.IntegerField()
+
+
+class CustomToDict(odin.Resource):
+    name = odin.StringField()
+
+    def to_dict(self, include_virtual=True, include_type_field=False):
+        return {"custom": self.name}
+
+
+class Containers(odin.Resource):
+    authors = odin.DictOf(Author)
+    publishers = odin.ListOf(Publisher)
+    publisher = odin.DictAs(Publisher, null=True)
+    counts = odin.TypedDictField(odin.IntegerField(), key_field=odin.IntegerField())
+    date = odin.DateField(null=True)
+    time = odin.TimeField(null=True)
+    uuid = odin.UUIDField(null=True)
+    ratio = odin.FloatField(null=True)
+    flag = odin.BooleanField(null=True)
+
+
+class AnyValues(odin.Resource):
+    class Meta:
+        name_space = None
+
+    items = odin.ListField(null=True)
+    mapping = odin.DictField(null=True)
+    names = odin.TypedListField(odin.StringField(), null=True)
+    named = odin.TypedDictField(odin.StringField(), null=True)
+    name = odin.StringField(null=True)
+    authors = odin.ListOf(Author, null=True)
+    publisher = odin.DictAs(Publisher, null=True)
+
+
+def _library():
+    with open(os.path.join(FIXTURE_PATH_ROOT, "library.json")) as f:
+        return json_codec.load(f)
+
+
+class TestDirectEncoder:
+    @pytest.mark.parametrize(
+        "value",
+        (
+            _library(),
+            _library().books,
+            {"library": _library()},
+            Containers(
+                authors={"banks": Author(name='Iain "M" Banks \u2603\n')},
+                publishers=[Publisher(name="Macmillan")],
+                counts={1: 2, 3: 4},
+                date=datetime.date(2020, 1, 2),
+                time=datetime.time(1, 2, 3),
+                uuid=uuid.UUID("6b7f7e3e-6d2f-4c1b-8f6e-3c1d2e4f5a6b"),
+                ratio=1.5,
+                flag=False,
+            ),
+            Containers(authors={}, publishers=[], counts={}, ratio=float("nan")),
+            Containers(ratio=float("inf"), flag=True),
+            Containers(ratio=-float("inf")),
+            # Values that have not been cleaned
+            Book(title=Tag("title"), num_pages="471", rrp=20, fiction=1, published=()),
+            IdentifiableBook(id=uuid.uuid4(), purchased_from=From.Shop, title="x"),
+            TypeNamedField(name="x", size=1),
+            [CustomToDict(name="custom")],
+            # Keys equal to 1 are separate dicts (otherwise one replaces the others)
+            {1: 2, 1.5: 3, None: 5, Tag("tag"): 6},
+            {True: 4},
+            {Colour.Red: 7},
+            [Colour.Red, Tag("tag"), (1, 2), (), {}.values(), {"a": 1}.keys()],
+            "\u00e9",
+            10**20,
+            None,
+            datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        ),
+    )
+    @pytest.mark.parametrize(
+        "options",
+        ({}, {"include_virtual_fields": False}, {"include_type_field": False}),
+    )
+    def test_identical_to_odin_encoder(self, value, options):
+        expected = json.dumps(value, cls=json_codec.OdinEncoder, **options)
+
+        assert json_codec.DirectEncoder(**options).encode(value) == expected
+        assert json_codec.dumps(value, **options) == expected
+
+    @pytest.mark.parametrize(
+        "value, message",
+        (
+            ({1}, "Object of type set is not JSON serializable"),
+            ({(1,): 2}, "keys must be str, int, float, bool or None, not tuple"),
+        ),
+    )
+    def test_unsupported_values(self, value, message):
+        with pytest.raises(TypeError, match=message):
+            json_codec.DirectEncoder().encode(value)
+
+    def test_circular_reference(self):
+        value = []
+        value.append(value)
+
+        with pytest.raises(CodecEncodeError, match="Circular reference detected"):
+            json_codec.dumps(value)
+
+    def test_get_encoder(self):
+        assert isinstance(json_codec.get_encoder().__self__, json_codec.DirectEncoder)
+        assert isinstance(
+            json_codec.get_encoder(indent=2).__self__, json_codec.OdinEncoder
+        )
+
+    def test_dump_with_encoder_options(self):
+        library = _library()
+
+        fp = StringIO()
+        json_codec.dump(library, fp, indent=2, sort_keys=True)
+
+        assert fp.getvalue() == json.dumps(
+            library, cls=json_codec.OdinEncoder, indent=2, sort_keys=True
+        )
+
+
+def _loads_outcome(data, **kwargs):
+    """Result of loads as JSON or the errors raised."""
+    try:
+        return json_codec.dumps(json_codec.loads(data, **kwargs))
+    except ValidationError as ve:
+        return type(ve), ve.error_messages
+    except CodecDecodeError as ex:
+        return type(ex), str(ex)
+
+
+class TestSinglePassLoads:
+    @pytest.mark.parametrize(
+        "fixture",
+        (
+            "library.json",
+            "library-invalid-nested.json",
+            "book-valid.json",
+            "book-invalid.json",
+        ),
+    )
+    @pytest.mark.parametrize("resource", (None, Library, "Library", [Book, Library]))
+    @pytest.mark.parametrize("options", ({}, {"full_clean": False}, {"max_errors": 1}))
+    def test_equivalent_to_two_pass(self, fixture, resource, options):
+        with open(os.path.join(FIXTURE_PATH_ROOT, fixture)) as f:
+            data = f.read()
+
+        expected = _loads_outcome(data, resource=resource, **options)
+        actual = _loads_outcome(data, resource=resource, single_pass=True, **options)
+
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "data, resource",
+        (
+            # Objects without a type field
+            ('{"name": "Iain M. Banks"}', Author),
+            ('[{"name": "Iain M. Banks"}, {"$": "Author", "name": "x"}]', Author),
+            ('{"$": "Library", "name": "x", "books": [{"title": "y"}]}', None),
+            ('{"$": "Library", "name": "x", "books": [], "subscribers": [{}]}', None),
+            # Type that is not compatible with the resource or field
+            ('{"$": "Author", "name": "Iain M. Banks"}', Publisher),
+            ('{"$": "Library", "name": "x", "books": [{"$": "Author"}]}', None),
+            # Unknown types
+            ('{"$": "Unknown", "name": "Iain M. Banks"}', None),
+            ('{"$": "Author", "name": "Iain M. Banks"}', "Unknown"),
+            ('{"$": "", "name": "Iain M. Banks"}', None),
+            ('{"name": "Iain M. Banks"}', None),
+            # Values that are not objects and invalid documents
+            ("[1, null, []]", Author),
+            ("[1, ", Author),
+        ),
+    )
+    def test_fallback(self, data, resource):
+        expected = _loads_outcome(data, resource=resource)
+        actual = _loads_outcome(data, resource=resource, single_pass=True)
+
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "field",
+        ("items", "mapping", "names", "named", "name"),
+    )
+    @pytest.mark.parametrize("full_clean", (True, False))
+    def test_typed_objects_in_other_fields(self, field, full_clean):
+        author = {"$": "Author", "name": "Iain M. Banks"}
+        value = {
+            "items": [author, [author]],
+            "mapping": {"a": author},
+            "names": [author],
+            "named": {"a": author},
+            "name": author,
+        }[field]
+        data = json.dumps({"$": "AnyValues", field: value})
+
+        expected = json_codec.loads(data, full_clean=full_clean)
+        actual = json_codec.loads(data, full_clean=full_clean, single_pass=True)
+
+        assert getattr(actual, field) == getattr(expected, field)
+        assert json_codec.dumps(actual) == json_codec.dumps(expected)
+
+    def test_typed_objects_are_dicts(self):
+        data = json.dumps(
+            {
+                "$": "AnyValues",
+                "items": [{"$": "Author", "name": "Iain M. Banks"}],
+                "names": [{"$": "Author", "name": "3"}],
+                "name": {"$": "Author", "name": "3"},
+                "authors": [{"$": "Author", "name": "Iain M. Banks"}],
+            }
+        )
+
+        actual = json_codec.loads(data, single_pass=True)
+
+        assert actual.items == [{"$": "Author", "name": "Iain M. Banks"}]
+        assert type(actual.items[0]) is dict
+        assert actual.names == ["{'$': 'Author', 'name': '3'}"]
+        assert actual.name == "{'$': 'Author', 'name': '3'}"
+        assert isinstance(actual.authors[0], Author)
+
+    @pytest.mark.parametrize(
+        "authors",
+        (
+            # Items with and without a type field
+            [{"$": "Author", "name": "Iain M. Banks"}, {"name": "Neil Gaiman"}],
+            # Typed object within an object without a type field
+            [{"name": "Iain M. Banks", "extra": {"$": "Author", "name": "x"}}],
+            # Item that is not valid
+            [{"$": "Author", "name": "Iain M. Banks"}, {"$": "Publisher"}],
+        ),
+    )
+    @pytest.mark.parametrize("full_clean", (True, False))
+    def test_mixed_composite_values(self, authors, full_clean):
+        data = json.dumps({"$": "AnyValues", "authors": authors})
+
+        expected = _loads_outcome(data, full_clean=full_clean)
+        actual = _loads_outcome(data, full_clean=full_clean, single_pass=True)
+
+        assert actual == expected
+
+    def test_document_is_not_traversed(self):
+        with open(os.path.join(FIXTURE_PATH_ROOT, "library.json")) as f:
+            data = f.read()
+
+        with mock.patch.object(
+            json_codec.resources, "build_object_graph"
+        ) as build_object_graph:
+            actual = json_codec.loads(data, single_pass=True)
+
+        build_object_graph.assert_not_called()
+        assert isinstance(actual, Library)
+        assert len(actual.books) == 5
+
+
+@pytest.fixture(params=tuple(json_codec.BACKENDS))
+def backend(request):
+    if request.param not in json_codec.available_backends():
+        pytest.skip(f"{request.param} is not installed")
+    return json_codec.get_backend(request.param)
+
+
+@pytest.fixture
+def restore_backend():
+    current = json_codec.get_backend()
+    yield
+    json_codec.set_backend(current)
+
+
+class TestBackends:
+    @pytest.mark.parametrize(
+        "fixture",
+        ("library.json", "library-invalid-nested.json", "book-invalid.json"),
+    )
+    def test_loads(self, backend, fixture):
+        with open(os.path.join(FIXTURE_PATH_ROOT, fixture)) as f:
+            data = f.read()
+
+        assert _loads_outcome(data, backend=backend) == _loads_outcome(data)
+
+    @pytest.mark.parametrize(
+        "data",
+        (
+            '[NaN, Infinity, 1.5, "\\ud800"]',
+            "[123456789012345678901234567890, -9223372036854775809]",
+            "[18446744073709551615, 18446744073709551616, -9223372036854775808]",
+            b"[1, 99999999999999999999]",
+            '["12345678901234567890", 1.12345678901234567890, 1e-1234567890123456789]',
+            b'{"name": "\\u2603"}',
+            "[1, ",
+            '{"a": 1',
+            "",
+        ),
+    )
+    def test_loads_values(self, backend, data):
+        assert _loads_outcome(data, backend=backend) == _loads_outcome(data)
+
+    @pytest.mark.parametrize(
+        "data",
+        (
+            "[9223372036854775807, -9223372036854775808, 18446744073709551615]",
+            '{"isbn": "1234567890123456789012", "ratio": 0.12345678901234567890}',
+        ),
+    )
+    def test_long_digit_runs_in_range_use_orjson(self, data, monkeypatch):
+        backend = json_codec.get_backend("orjson")
+        if backend.name != "orjson":
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(json_codec.JSONBackend, "loads", None)
+
+        assert backend.loads(data) == json.loads(data)
+
+    @pytest.mark.parametrize(
+        "value",
+        (
+            _library(),
+            [
+                Containers(
+                    authors={"banks": Author(name="Iain M. Banks \\u2603")},
+                    publishers=[Publisher(name="Macmillan")],
+                    counts={1: 2},
+                    date=datetime.date(2020, 1, 2),
+                    time=datetime.time(1, 2, 3),
+                    uuid=uuid.UUID("6b7f7e3e-6d2f-4c1b-8f6e-3c1d2e4f5a6b"),
+                    ratio=1e16,
+                    flag=True,
+                ),
+                # Keys equal to 1 are separate dicts (otherwise one replaces the others)
+                {1: 2, 1.5: 3, None: 5},
+                {True: 4},
+                {Colour.Red: 7},
+                {}.values(),
+                2**70,
+                datetime.datetime(
+                    2020, 1, 1, 1, 2, 3, 456, tzinfo=datetime.timezone.utc
+                ),
+            ],
+        ),
+    )
+    def test_dumps(self, backend, value):
+        actual = json_codec.dumps(value, backend=backend)
+
+        assert json.loads(actual) == json.loads(json_codec.dumps(value))
+
+    @pytest.mark.parametrize(
+        "value",
+        (
+            [1.5, None, float("nan")],
+            {"a": {"b": (None, float("inf"))}},
+            Containers(ratio=float("-inf"), flag=None),
+        ),
+    )
+    def test_dumps_non_finite_floats(self, backend, value):
+        actual = json_codec.dumps(value, backend=backend)
+
+        assert actual == json_codec.dumps(value)
+
+    def test_dumps_options(self, backend):
+        library = _library()
+
+        actual = json_codec.dumps(library, backend=backend, include_type_field=False)
+
+        assert "$" not in json.loads(actual)
+
+    def test_dumps_errors(self, backend):
+        circular = []
+        circular.append(circular)
+
+        with pytest.raises(
+            TypeError, match="Object of type set is not JSON serializable"
+        ):
+            json_codec.dumps([{1}], backend=backend)
+        with pytest.raises(CodecEncodeError, match="Circular reference detected"):
+            json_codec.dumps(circular, backend=backend)
+
+    def test_set_backend(self, backend, restore_backend):
+        assert json_codec.set_backend(backend.name) is backend
+        assert json_codec.get_backend() is backend
+
+        fp = StringIO()
+        json_codec.dump(Author(name="Iain M. Banks"), fp)
+        assert json_codec.loads(fp.getvalue()).name == "Iain M. Banks"
+
+    def test_set_backend_auto(self, restore_backend):
+        if "orjson" not in json_codec.available_backends():
+            pytest.skip("orjson is not installed")
+
+        actual = json_codec.set_backend("auto")
+
+        assert actual.name == "orjson"
+        assert json_codec.get_backend() is actual
+
+    def test_set_backend_default(self, restore_backend):
+        json_codec.set_backend("auto")
+
+        assert json_codec.set_backend().name == "json"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend 'unknown'"):
+            json_codec.get_backend("unknown")
+
+    def test_backend_not_installed(self, monkeypatch):
+        class MissingBackend(json_codec.JSONBackend):
+            name = "missing"
+
+            def __init__(self):
+                raise ImportError("missing")
+
+        monkeypatch.setitem(json_codec.BACKENDS, "missing", MissingBackend)
+
+        assert "missing" not in json_codec.available_backends()
+        assert json_codec.get_backend("missing").name == "json"
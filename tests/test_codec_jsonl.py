@@ -0,0 +1,216 @@
+import os
+from io import BytesIO, StringIO
+
+import pytest
+
+from odin.codecs import json_codec, jsonl_codec
+from odin.exceptions import CodecDecodeError, CodecEncodeError, ValidationError
+
+from .resources import Author, Book, OldBook, OldBookToBookMapping, Publisher
+
+FIXTURE_PATH_ROOT = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def books():
+    with open(os.path.join(FIXTURE_PATH_ROOT, "library.json")) as f:
+        return json_codec.load(f).books
+
+
+class TestReader:
+    @pytest.mark.parametrize("binary", (False, True))
+    def test_read(self, books, binary):
+        data = jsonl_codec.dumps(books)
+        f = BytesIO(data.encode()) if binary else StringIO(data)
+
+        target = jsonl_codec.reader(f, Book)
+        actual = list(target)
+
+        assert [json_codec.dumps(b) for b in actual] == [
+            json_codec.dumps(b) for b in books
+        ]
+        assert target.row_count == len(books)
+        assert target.error_count == 0
+
+    def test_read_is_lazy(self):
+        f = StringIO('{"name": "Iain M. Banks"}\n{"name": "Neil Gaiman"}\nnot json\n')
+
+        target = iter(jsonl_codec.reader(f, Author))
+
+        assert next(target).name == "Iain M. Banks"
+        assert next(target).name == "Neil Gaiman"
+        with pytest.raises(CodecDecodeError, match="Line 3"):
+            next(target)
+
+    def test_blank_lines_are_skipped(self):
+        f = StringIO('\n{"name": "Iain M. Banks"}\n  \n{"name": "Neil Gaiman"}\n\n')
+
+        target = jsonl_codec.reader(f, Author)
+
+        assert [a.name for a in target] == ["Iain M. Banks", "Neil Gaiman"]
+        assert target.row_count == 2
+
+    def test_error_callback(self):
+        errors = []
+        f = StringIO(
+            '{"name": "Iain M. Banks"}\n{"name": null}\n'
+            '{"name": "Neil Gaiman"}\n\n{"name": null}\n'
+        )
+
+        target = jsonl_codec.reader(
+            f, Author, error_callback=lambda ve, idx: errors.append((ve, idx))
+        )
+        actual = list(target)
+
+        assert [a.name for a in actual] == ["Iain M. Banks", "Neil Gaiman"]
+        assert [idx for _, idx in errors] == [1, 4]
+        assert all("name" in ve.error_messages for ve, _ in errors)
+        assert target.error_count == 2
+        assert target.row_count == 4
+
+    def test_lines_before_an_error_are_returned(self):
+        library = []
+        f = StringIO('{"name": "Iain M. Banks"}\n{"name": null}\n{"name": "x"}\n')
+
+        with pytest.raises(ValidationError):
+            library.extend(jsonl_codec.reader(f, Author))
+
+        assert [a.name for a in library] == ["Iain M. Banks"]
+
+    def test_error_callback_returns_false(self):
+        f = StringIO('{"name": null}\n')
+
+        target = jsonl_codec.reader(f, Author, error_callback=lambda ve, idx: False)
+
+        with pytest.raises(ValidationError):
+            list(target)
+
+    def test_without_full_clean(self):
+        f = StringIO('{"name": null}\n')
+
+        (actual,) = jsonl_codec.reader(f, Author, full_clean=False)
+
+        assert actual.name is None
+
+    def test_unknown_type_is_a_validation_error(self):
+        errors = []
+        f = StringIO('{"$": "Unknown", "name": "Iain M. Banks"}\n')
+
+        actual = list(
+            jsonl_codec.reader(f, Author, error_callback=lambda ve, i: errors.append(i))
+        )
+
+        assert actual == []
+        assert errors == [0]
+
+
+class TestWriter:
+    def test_dumps(self, books):
+        actual = jsonl_codec.dumps(books)
+
+        assert actual.splitlines() == [json_codec.dumps(book) for book in books]
+        assert actual.endswith("\n")
+
+    def test_dumps_empty(self):
+        assert jsonl_codec.dumps([]) == ""
+
+    def test_dump_encoder_options(self):
+        authors = [Author(name="Iain M. Banks")]
+
+        actual = jsonl_codec.dumps(authors, include_type_field=False, sort_keys=True)
+
+        assert actual == '{"name": "Iain M. Banks"}\n'
+
+    @pytest.mark.parametrize(
+        "options",
+        ({"indent": 2}, {"indent": ""}, {"separators": (",\n", ": ")}),
+    )
+    def test_dump_multi_line_options(self, options):
+        authors = [Author(name="Iain M. Banks"), Author(name="Neil Gaiman")]
+
+        with pytest.raises(ValueError, match="JSON Lines"):
+            jsonl_codec.dumps(authors, **options)
+
+    def test_dump_mapping_result(self):
+        old_books = [
+            OldBook(
+                name=f"Book {idx}",
+                num_pages=100,
+                price=10.0,
+                genre="sci-fi",
+                author=Author(name="Iain M. Banks"),
+                publisher=Publisher(name="Macmillan"),
+            )
+            for idx in range(5)
+        ]
+
+        actual = jsonl_codec.dumps(OldBookToBookMapping.apply(old_books))
+
+        assert [b.title for b in jsonl_codec.reader(StringIO(actual), Book, False)] == [
+            f"Book {idx}" for idx in range(5)
+        ]
+
+    def test_dump_is_batched_and_lazy(self):
+        consumed = []
+        writes = []
+
+        class File:
+            def write(self, data):
+                writes.append((len(consumed), data.count("\n")))
+
+        def authors():
+            for idx in range(5):
+                consumed.append(idx)
+                yield Author(name=f"Author {idx}")
+
+        jsonl_codec.dump(File(), authors(), batch_size=2)
+
+        assert writes == [(2, 2), (4, 2), (5, 1)]
+
+    def test_dump_invalid_value(self):
+        f = StringIO()
+
+        with pytest.raises(CodecEncodeError):
+            jsonl_codec.dump(
+                f, [Author(name="Iain M. Banks"), float("nan")], allow_nan=False
+            )
+
+        # Lines encoded before the error are written
+        assert f.getvalue().count("\n") == 1
+
+
+class TestBackends:
+    @pytest.fixture(params=tuple(json_codec.BACKENDS))
+    def backend(self, request):
+        if request.param not in json_codec.available_backends():
+            pytest.skip(f"{request.param} is not installed")
+        return request.param
+
+    @pytest.mark.parametrize("binary", (False, True))
+    def test_read(self, books, backend, binary):
+        data = jsonl_codec.dumps(books)
+        f = BytesIO(data.encode()) if binary else StringIO(data)
+
+        target = jsonl_codec.reader(f, Book)
+        target.backend = backend
+        actual = list(target)
+
+        assert [json_codec.dumps(b) for b in actual] == [
+            json_codec.dumps(b) for b in books
+        ]
+
+    def test_read_invalid_line(self, backend):
+        target = jsonl_codec.reader(
+            StringIO('{"name": "Iain M. Banks"}\n{"name"\n'), Author
+        )
+        target.backend = backend
+
+        with pytest.raises(CodecDecodeError, match="Line 2: Expecting ':' delimiter"):
+            list(target)
+
+    def test_dumps(self, books, backend):
+        actual = jsonl_codec.dumps(books, backend=backend)
+
+        assert [json_codec.loads(line).title for line in actual.splitlines()] == [
+            b.title for b in books
+        ]
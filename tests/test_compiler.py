@@ -0,0 +1,297 @@
+import datetime
+
+import pytest
+
+import odin
+from odin import compiler
+from odin.exceptions import ValidationError
+from odin.fields import NotProvided
+from odin.utils import field_iter_items, getmeta
+
+
+class UpperStringField(odin.StringField):
+    def to_python(self, value):
+        value = super().to_python(value)
+        return value.upper() if value else value
+
+
+class Sample(odin.Resource):
+    name = odin.StringField()
+    code = UpperStringField(null=True)
+    count = odin.IntegerField(default=42, use_default_if_not_provided=True)
+    created = odin.DateTimeField(null=True)
+
+    def extra_attrs(self, attrs):
+        self.extras = attrs
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    (
+        ("name", True),
+        ("_private", True),
+        ("class", False),
+        ("self", False),
+        ("kwargs", False),
+        ("__odin_value", False),
+        ("not-valid", False),
+        ("", False),
+        (None, False),
+    ),
+)
+def test_is_valid_name(name, expected):
+    assert compiler.is_valid_name(name) is expected
+
+
+@pytest.mark.parametrize(
+    "field, expected",
+    (
+        (odin.StringField(), (str,)),
+        (odin.EmailField(), (str,)),
+        (odin.IntegerField(), (int,)),
+        (odin.FloatField(), (float,)),
+        (odin.BooleanField(), (bool,)),
+        (odin.DateTimeField(), (datetime.datetime,)),
+        (odin.ListField(), (list, tuple)),
+        (odin.TypedListField(odin.StringField()), ()),
+        (odin.DictField(), ()),
+        (UpperStringField(), ()),
+    ),
+)
+def test_native_types(field, expected):
+    assert compiler.native_types(field) == expected
+
+
+class TestGenerateFromDict:
+    @pytest.fixture
+    def target(self):
+        return getmeta(Sample).compiled_from_dict
+
+    def test_values_are_converted(self, target):
+        actual = target(
+            Sample,
+            {
+                "name": "Foo",
+                "code": "abc",
+                "count": "12",
+                "created": "2024-01-02T03:04:05Z",
+            },
+            True,
+            False,
+        )
+
+        assert actual.name == "Foo"
+        assert actual.code == "ABC"
+        assert actual.count == 12
+        assert actual.created == datetime.datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+        )
+
+    def test_defaults_are_applied(self, target):
+        actual = target(Sample, {"name": "Foo"}, True, False)
+
+        assert actual.code is None
+        assert actual.count == 42
+
+    def test_default_to_not_provided(self, target):
+        actual = target(Sample, {"name": "Foo"}, False, True)
+
+        assert actual.code is NotProvided
+        assert actual.count is NotProvided
+
+    def test_extra_values_are_passed_to_extra_attrs(self, target):
+        actual = target(Sample, {"name": "Foo", "other": 1}, True, False)
+
+        assert actual.extras == {"other": 1}
+
+    def test_errors_are_aggregated(self, target):
+        with pytest.raises(ValidationError) as ex:
+            target(Sample, {"count": "abc", "created": "abc"}, True, False)
+
+        assert ex.value.error_messages == {
+            "count": ["'abc' value must be a integer."],
+            "created": ["Not a valid datetime string."],
+        }
+
+    def test_invalid_values_are_retained_without_full_clean(self, target):
+        actual = target(Sample, {"name": "Foo", "count": "abc"}, False, False)
+
+        assert actual.count == "abc"
+
+    def test_loader_is_rebuilt_when_fields_change(self):
+        class DynamicResource(odin.Resource):
+            name = odin.StringField()
+
+        assert "size" not in getmeta(DynamicResource).compiled_from_dict.__odin_source__
+
+        odin.IntegerField().contribute_to_class(DynamicResource, "size")
+
+        assert "size" in getmeta(DynamicResource).compiled_from_dict.__odin_source__
+
+
+class CleanedResource(odin.Resource):
+    name = odin.StringField()
+    code = odin.StringField(null=True)
+    rating = odin.IntegerField(min_value=1, max_value=5, null=True)
+    colour = odin.StringField(choices=(("red", "Red"), ("blue", "Blue")), null=True)
+    created = odin.DateTimeField(null=True)
+
+    def clean_name(self, value):
+        return value.strip() if value else value
+
+    @property
+    def clean_code(self):
+        return str.upper
+
+
+class TestValidationPlan:
+    @pytest.fixture
+    def plan(self):
+        return {step.name: step for step in getmeta(CleanedResource).validation_plan}
+
+    def test_plan_is_cached(self):
+        meta = getmeta(CleanedResource)
+
+        assert meta.validation_plan is meta.validation_plan
+
+    def test_clean_methods_are_resolved(self, plan):
+        assert plan["name"].clean_method is CleanedResource.clean_name
+        assert plan["code"].clean_method is not None
+        assert plan["rating"].clean_method is None
+
+    def test_resource_clean_methods_are_applied(self):
+        target = CleanedResource(name="  Foo ", code="abc")
+
+        target.full_clean()
+
+        assert target.name == "Foo"
+        assert target.code == "ABC"
+
+    def test_no_op_stages_are_dropped(self):
+        field = getmeta(CleanedResource).field_map["code"]
+        clean = compiler.field_clean(field)
+
+        assert clean("abc") == "abc"
+        assert clean(NotProvided) is None
+
+    @pytest.mark.parametrize(
+        "name, value",
+        (
+            ("rating", 6),
+            ("colour", "green"),
+            ("name", None),
+        ),
+    )
+    def test_required_stages_are_retained(self, plan, name, value):
+        with pytest.raises(ValidationError):
+            plan[name].clean(value)
+
+    def test_errors_are_aggregated(self):
+        target = CleanedResource(name=None, rating=6, colour="green", created="abc")
+
+        with pytest.raises(ValidationError) as ex:
+            target.full_clean()
+
+        assert set(ex.value.error_messages) == {"name", "rating", "colour", "created"}
+
+    def test_plan_is_rebuilt_when_fields_change(self):
+        class DynamicCleanResource(odin.Resource):
+            name = odin.StringField()
+
+        assert len(getmeta(DynamicCleanResource).validation_plan) == 1
+
+        odin.IntegerField().contribute_to_class(DynamicCleanResource, "size")
+
+        assert [
+            step.name for step in getmeta(DynamicCleanResource).validation_plan
+        ] == [
+            "name",
+            "size",
+        ]
+
+
+class PreparedResource(odin.Resource):
+    class Meta:
+        namespace = "tests.compiler"
+
+    name = odin.StringField()
+    created = odin.DateTimeField(null=True)
+    tags = odin.TypedListField(odin.StringField(), null=True)
+
+    @odin.calculated_field
+    def upper_name(self):
+        return self.name.upper()
+
+
+def reference_to_dict(resource, include_virtual, include_type_field):
+    meta = getmeta(resource)
+    fields = meta.all_fields if include_virtual else meta.fields
+    result = {meta.type_field: meta.resource_name} if include_type_field else {}
+    result.update((f.name, f.prepare(f.value_from_object(resource))) for f in fields)
+    return result
+
+
+class TestGenerateToDict:
+    @pytest.fixture
+    def resource(self):
+        return PreparedResource(
+            name="foo",
+            created=datetime.datetime(2024, 1, 2, 3, 4, 5),
+            tags=["a", "b"],
+        )
+
+    @pytest.mark.parametrize("include_virtual", (True, False))
+    @pytest.mark.parametrize("include_type_field", (True, False))
+    def test_matches_generic_implementation(
+        self, resource, include_virtual, include_type_field
+    ):
+        actual = resource.to_dict(include_virtual, include_type_field)
+
+        assert actual == reference_to_dict(
+            resource, include_virtual, include_type_field
+        )
+        assert list(actual) == list(
+            reference_to_dict(resource, include_virtual, include_type_field)
+        )
+
+    def test_functions_are_cached_per_options(self):
+        meta = getmeta(PreparedResource)
+
+        assert meta.compiled_to_dict(True, False) is meta.compiled_to_dict(True, False)
+        assert meta.compiled_to_dict(True, False) is not meta.compiled_to_dict(
+            False, False
+        )
+
+    def test_identity_prepare_is_read_directly(self):
+        source = getmeta(PreparedResource).compiled_to_dict(False, True).__odin_source__
+
+        assert "'name': resource.name," in source
+        assert "'created': resource.created," in source
+        assert "'tags': __odin_prepare_2(resource.tags)," in source
+        assert "'$': __odin_resource_name," in source
+
+    def test_field_iter_items_uses_readers(self, resource):
+        actual = dict(field_iter_items(resource))
+
+        assert actual == {
+            getmeta(PreparedResource).field_map["name"]: "foo",
+            getmeta(PreparedResource).field_map["created"]: datetime.datetime(
+                2024, 1, 2, 3, 4, 5
+            ),
+            getmeta(PreparedResource).field_map["tags"]: ["a", "b"],
+            getmeta(PreparedResource).virtual_fields[0]: "FOO",
+        }
+
+    def test_field_iter_items_with_other_fields(self, resource):
+        fields = getmeta(PreparedResource).fields[:1]
+
+        assert [v for _, v in field_iter_items(resource, fields)] == ["foo"]
+
+    def test_field_iter_items_checks_the_sequence(self, resource, monkeypatch):
+        meta = getmeta(PreparedResource)
+        fields = meta.fields[:1]
+        # Readers of another sequence that had the same id
+        readers = {id(fields): meta.field_readers[id(meta.fields)]}
+        monkeypatch.setattr(meta, "field_readers", readers)
+
+        assert [v for _, v in field_iter_items(resource, fields)] == ["foo"]
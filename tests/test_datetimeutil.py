@@ -32,7 +32,7 @@ class TestParseIsoDateString:
     def test_valid_values(self, value):
         assert datetime.date(2014, 1, 13) == datetimeutil.parse_iso_date_string(value)
 
-    @pytest.mark.parametrize("value", (123, "2014/01/13"))
+    @pytest.mark.parametrize("value", (123, "2014/01/13", "2014-W03-1"))
     def test_invalid_values(self, value):
         pytest.raises(ValueError, datetimeutil.parse_iso_date_string, value)
 
@@ -237,6 +237,47 @@ class TestParseIsoDateTimeString:
     def test_invalid_values(self, value):
         pytest.raises(ValueError, datetimeutil.parse_iso_datetime_string, value)
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        (
+            # Six digit fractions are microseconds (matched by fromisoformat)
+            ("2014-01-13 00:28:33.000432", 432),
+            # Other lengths are a count of microseconds
+            ("2014-01-13 00:28:33.4", 4),
+            ("2014-01-13 00:28:33.4321", 4321),
+        ),
+    )
+    def test_fractions(self, value, expected):
+        actual = datetimeutil.parse_iso_datetime_string(value)
+
+        assert actual.microsecond == expected
+
+    def test_timezones_are_interned(self):
+        a = datetimeutil.parse_iso_datetime_string("2014-01-13T00:28:33+10:30")
+        b = datetimeutil.parse_iso_datetime_string("2014-01-14T00:28:33 +1030")
+
+        assert a.tzinfo is b.tzinfo
+        assert a.tzinfo is datetimeutil.FixedTimezone.interned("+", 10, 30)
+
+    def test_cache(self):
+        datetimeutil.set_datetime_cache_size(8)
+        try:
+            a = datetimeutil.parse_iso_datetime_string("2014-01-13T00:28:33Z")
+            b = datetimeutil.parse_iso_datetime_string("2014-01-13T00:28:33Z")
+            c = datetimeutil.parse_iso_datetime_string(
+                "2014-01-13T00:28:33",
+                datetimeutil.FixedTimezone.from_hours_minutes(10, 0),
+            )
+        finally:
+            datetimeutil.set_datetime_cache_size(0)
+
+        assert a is b
+        assert c == datetime.datetime(
+            2014, 1, 13, 0, 28, 33, 0, datetimeutil.FixedTimezone.from_hours_minutes(10)
+        )
+        with pytest.raises(ValueError):
+            datetimeutil.parse_iso_datetime_string("2014/01/13T00:28:33Z")
+
 
 class TestToDateString:
     def test_naive_datetime(self):
@@ -339,6 +380,20 @@ class TestParseHttpDateString:
     def test_invalid_values(self, value):
         pytest.raises(ValueError, datetimeutil.parse_http_datetime_string, value)
 
+    def test_imf_fixdate(self):
+        actual = datetimeutil.parse_http_datetime_string(
+            "Sun, 06 Nov 1994 08:49:37 GMT"
+        )
+
+        assert actual == datetime.datetime(1994, 11, 6, 8, 49, 37, 0, datetimeutil.utc)
+        assert str(actual.tzinfo) == "00:00"
+
+    def test_email_utils_is_imported_on_demand(self):
+        from email.utils import formatdate, parsedate_tz
+
+        assert datetimeutil.format_http_datetime is formatdate
+        assert datetimeutil.parse_http_datetime is parsedate_tz
+
 
 class TestToHttpDateString:
     @pytest.mark.parametrize(
@@ -365,3 +420,10 @@ class TestToHttpDateString:
     )
     def test_valid_values(self, value, expected):
         assert datetimeutil.to_http_datetime_string(value) == expected
+
+    def test_microseconds_are_truncated(self):
+        value = datetime.datetime(2012, 8, 29, 17, 12, 58, 999999, datetimeutil.utc)
+
+        assert datetimeutil.to_http_datetime_string(value) == (
+            "Wed, 29 Aug 2012 17:12:58 GMT"
+        )
@@ -58,3 +58,65 @@ class TestValidationException:
             "ValidationError({'Test Key 1': ['Test Message 1'], 'Test Key 2': ['Test Message 2']})"
             == repr(target)
         )
+
+
+class TestErrorLimit:
+    @pytest.mark.parametrize(
+        "error_messages, expected",
+        (
+            (["Bad value"], 1),
+            (["Bad value", "Really bad value"], 1),
+            ({"a": ["Bad"], "b": ["Bad"]}, 2),
+            ({"a": [{"0": ["Bad"], "1": ["Bad"]}], "b": ["Bad"]}, 3),
+            ({"a": [{"0": ["Bad"]}, "Bad"]}, 2),
+        ),
+    )
+    def test_count_errors(self, error_messages, expected):
+        assert exceptions.count_errors(error_messages) == expected
+
+    def test_no_active_limit(self):
+        assert not exceptions.error_limit_reached(exceptions.ValidationError("Bad"))
+
+    def test_limit(self):
+        with exceptions.error_limit(2) as limit:
+            assert not exceptions.error_limit_reached(exceptions.ValidationError("Bad"))
+            # Nested errors have already been counted
+            assert not exceptions.error_limit_reached(
+                exceptions.ValidationError({"a": ["Bad"]})
+            )
+            assert exceptions.error_limit_reached(exceptions.ValidationError("Bad"))
+            assert limit.reached
+
+            exceptions.release_errors({"a": ["Bad"]})
+            assert not limit.reached
+
+        assert not exceptions.error_limit_reached(exceptions.ValidationError("Bad"))
+
+    def test_no_limit_keeps_enclosing_limit(self):
+        with exceptions.error_limit(1) as outer, exceptions.error_limit(None) as inner:
+            assert inner is outer
+
+    @pytest.mark.parametrize("max_errors", (0, -1))
+    def test_invalid_limit(self, max_errors):
+        with pytest.raises(ValueError):
+            exceptions.ErrorLimit(max_errors)
+
+    def test_invalid_limit_type(self):
+        with pytest.raises(TypeError, match="max_errors must be an int or None"):
+            exceptions.check_max_errors("1")
+
+
+class TestValidationResult:
+    def test_valid(self):
+        target = exceptions.ValidationResult(42)
+
+        assert target.is_valid
+        assert target.unwrap() == 42
+
+    def test_invalid(self):
+        target = exceptions.ValidationResult(None, {"name": ["Bad value"]})
+
+        assert not target.is_valid
+        with pytest.raises(exceptions.ValidationError) as result:
+            target.unwrap()
+        assert result.value.error_messages == {"name": ["Bad value"]}
@@ -1,6 +1,7 @@
 import datetime
 import enum
 import pathlib
+import pickle
 import re
 import uuid
 from copy import deepcopy
@@ -11,8 +12,8 @@ import odin
 from odin.datetimeutil import FixedTimezone
 from odin.exceptions import ValidationError
 from odin.fields import *
-from odin.fields import Field, NotProvided, TimeStampField
-from odin.fields.virtual import VirtualField
+from odin.fields import Field, NotProvided, TimeStampField, empty_check
+from odin.fields.virtual import MultiPartField, VirtualField
 from odin.validators import (
     MaxLengthValidator,
     MaxValueValidator,
@@ -79,6 +80,54 @@ class TestField:
             "other": "Other Value",
         } == target.error_messages
 
+    def test_error_messages_are_not_shared(self):
+        a = FieldTest()
+        b = FieldTest()
+
+        a.error_messages["null"] = "Changed"
+
+        assert b.error_messages["null"] == "This field cannot be null."
+        assert FieldTest().error_messages["null"] == "This field cannot be null."
+
+    def test_error_messages_are_copied_on_write(self):
+        target = StringField()
+
+        assert target.error_messages._shared
+
+        del target.error_messages["required"]
+
+        assert not target.error_messages._shared
+        assert "required" not in target.error_messages
+        assert "required" in StringField().error_messages
+
+    @pytest.mark.parametrize(
+        "field",
+        (
+            StringField(max_length=10),
+            IntegerField(min_value=1),
+            DateTimeField(),
+            TypedListField(StringField()),
+            UUIDField(),
+            odin.ListOf(lambda: None, null=True),
+            odin.CalculatedField(lambda _: None),
+        ),
+    )
+    def test_fields_are_slotted(self, field):
+        assert not hasattr(field, "__dict__")
+
+    def test_pickle(self):
+        target = StringField(max_length=5, error_messages={"null": "Override"})
+        target.clean("value")
+
+        # Data is pickled by the test itself
+        actual = pickle.loads(pickle.dumps(target))  # noqa: S301
+
+        assert actual.max_length == 5
+        assert actual.error_messages == target.error_messages
+        assert actual.creation_counter == target.creation_counter
+        with pytest.raises(ValidationError):
+            actual.clean("too long")
+
     def test_set_attributes_from_name(self):
         target = FieldTest()
         target.set_attributes_from_name("test_name")
@@ -185,6 +234,29 @@ class TestField:
         assert field is not target_copy
         assert field.name == target_copy.name
 
+    def test_clone(self):
+        field = StringField(name="test", max_length=10, null=True)
+        field.set_attributes_from_name("test")
+
+        target = field.clone()
+
+        assert target is not field
+        assert target.__class__ is StringField
+        assert target.attname == "test"
+        assert target.null is True
+        assert target.max_length == 10
+        assert target.validators == field.validators
+        assert target.creation_counter == field.creation_counter
+
+    def test_clone_virtual_field(self):
+        field = MultiPartField(("a", "b"), separator=":")
+
+        target = field.clone()
+
+        assert target is not field
+        assert target.field_names == ("a", "b")
+        assert target.separator == ":"
+
     def test_run_validators_and_override_validator_message(self):
         target = FieldTest(
             error_messages={"test_code": "Override message"},
@@ -1406,3 +1478,134 @@ class TestRegexField:
         actual = field.prepare(value)
 
         assert actual == expected
+
+
+class TestToPythonMany:
+    @pytest.mark.parametrize(
+        "field, values, expected",
+        (
+            (IntegerField(), [1, "2", 3.0, None], [1, 2, 3, None]),
+            (FloatField(), [1, "2.5", None], [1.0, 2.5, None]),
+            (StringField(), ["a", 1, None], ["a", "1", None]),
+            (BooleanField(), ["yes", False, None], [True, False, None]),
+            (
+                UUIDField(),
+                ["ba0b4ee0-ef3d-4d3c-b3d5-0e80a6d8c5f4", None],
+                [uuid.UUID("ba0b4ee0-ef3d-4d3c-b3d5-0e80a6d8c5f4"), None],
+            ),
+            (
+                EnumField(Colour),
+                ["red", Colour.Blue, None],
+                [Colour.Red, Colour.Blue, None],
+            ),
+            (EnumField(Colour), ["", "green"], [None, Colour.Green]),
+            (IntegerField(), [], []),
+        ),
+    )
+    def test_matches_to_python(self, field, values, expected):
+        actual = field.to_python_many(values)
+
+        assert actual == expected
+        assert actual == [field.to_python(value) for value in values]
+
+    @pytest.mark.parametrize(
+        "field, values",
+        (
+            (IntegerField(), [1, "a", 3, "b"]),
+            (FloatField(), [1.0, "x", 2.0, "y"]),
+            (UUIDField(), [uuid.uuid4(), "x", uuid.uuid4(), "y"]),
+            (EnumField(Colour), [Colour.Red, "x", "green", "y"]),
+        ),
+    )
+    def test_errors_are_keyed_by_index(self, field, values):
+        with pytest.raises(ValidationError) as result:
+            field.to_python_many(values)
+
+        assert set(result.value.error_messages) == {"1", "3"}
+
+    def test_clean_many(self):
+        field = IntegerField(default=5, use_default_if_not_provided=True, min_value=0)
+
+        actual = field.clean_many([1, "2", NotProvided])
+
+        assert actual == [1, 2, 5]
+
+    def test_clean_many__validation_errors(self):
+        field = IntegerField(min_value=0)
+
+        with pytest.raises(ValidationError) as result:
+            field.clean_many([1, -2, None])
+
+        assert set(result.value.error_messages) == {"1", "2"}
+
+
+class TestValidationChain:
+    @pytest.mark.parametrize(
+        "field_type, value, expected",
+        (
+            (IntegerField, None, True),
+            (IntegerField, "", True),
+            (IntegerField, [], True),
+            (IntegerField, {}, True),
+            (IntegerField, 0, False),
+            (IntegerField, False, False),
+            (IntegerField, "a", False),
+            # A list/dict is a valid value for the list/dict fields
+            (ListField, {}, True),
+            (ListField, [], False),
+            (DictField, [], True),
+            (DictField, {}, False),
+        ),
+    )
+    def test_empty_check(self, field_type, value, expected):
+        assert empty_check(field_type)(value) is expected
+
+    def test_no_op_validation_is_dropped(self):
+        assert IntegerField(null=True).validation_chain is None
+        assert IntegerField().validation_chain is not None
+
+    def test_choices(self):
+        field = IntegerField(choices=[(1, "One"), (2, "Two")])
+
+        assert field.clean(1) == 1
+        with pytest.raises(ValidationError, match="not a valid choice"):
+            field.clean(3)
+
+    def test_unhashable_choices(self):
+        field = ListField(choices=[([1], "One"), ([2], "Two")])
+
+        assert field.clean([1]) == [1]
+        with pytest.raises(ValidationError, match="not a valid choice"):
+            field.clean([3])
+
+    def test_chain_matches_stages(self):
+        field = IntegerField(min_value=10, choices=[(1, "One"), (20, "Twenty")])
+
+        for value in (1, 20, 5, None):
+            try:
+                field.validate(value)
+                field.run_validators(value)
+            except ValidationError as ve:
+                expected = ve.error_messages
+            else:
+                expected = None
+
+            try:
+                field.validation_chain(value)
+            except ValidationError as ve:
+                actual = ve.error_messages
+            else:
+                actual = None
+
+            assert actual == expected
+
+    def test_clone_recompiles(self):
+        field = IntegerField()
+        field.clean(1)
+
+        clone = field.clone()
+        clone.null = True
+
+        assert clone.validation_chain is None
+        with pytest.raises(ValidationError):
+            field.clean(None)
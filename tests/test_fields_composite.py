@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 import odin
@@ -279,3 +281,68 @@ class TestFields:
         self.assertResourceDictEqual(
             {"foo": ExampleResource(name="foo")}, f.clean({"foo": {"name": "foo"}})
         )
+
+
+class RatedResource(odin.Resource):
+    name = odin.StringField()
+    rating = odin.IntegerField(min_value=1, max_value=5)
+
+
+class TestTryClean:
+    @pytest.mark.parametrize(
+        "field",
+        (
+            DictAs(RatedResource),
+            DictAs(RatedResource, null=True),
+            ArrayOf(RatedResource),
+            ArrayOf(RatedResource, empty=False),
+            DictOf(RatedResource),
+            DictOf(RatedResource, empty=False, key_choices=(("a", "A"), ("b", "B"))),
+        ),
+    )
+    @pytest.mark.parametrize(
+        "value",
+        (
+            None,
+            123,
+            {},
+            [],
+            {"name": "foo", "rating": 3},
+            {"name": "foo", "rating": 9},
+            [{"name": "foo", "rating": 3}, {"rating": 0}, None],
+            {"a": {"name": "foo", "rating": 3}, "b": {"rating": "x"}},
+            {"c": {"name": "foo", "rating": 3}},
+            {"a": None},
+        ),
+    )
+    def test_matches_clean(self, field, value):
+        try:
+            expected = odin.exceptions.ValidationResult(field.clean(value))
+        except ValidationError as ve:
+            expected = odin.exceptions.ValidationResult(None, ve.error_messages)
+
+        actual = field.try_clean(value)
+
+        assert actual.errors == expected.errors
+        assert actual.is_valid == expected.is_valid
+
+    def test_child_errors_are_not_raised(self):
+        field = ArrayOf(RatedResource)
+        value = field.to_python([{"name": "foo", "rating": 9}])
+
+        def created_errors(method):
+            with mock.patch.object(
+                ValidationError,
+                "__init__",
+                autospec=True,
+                side_effect=ValidationError.__init__,
+            ) as init:
+                method(value)
+            return init.call_count
+
+        # Errors of the rating validator and field (and the list when raised)
+        assert created_errors(field.try_clean) == 2
+        assert (
+            created_errors(lambda v: pytest.raises(ValidationError, field.clean, v))
+            == 3
+        )
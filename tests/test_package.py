@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import odin
+from odin import fields, resources
+from odin.annotated_resource import type_aliases
+
+
+class TestLazyAttributes:
+    @pytest.mark.parametrize(
+        "name, expected",
+        (
+            ("Resource", resources.Resource),
+            ("StringField", fields.StringField),
+            ("NotProvided", fields.NotProvided),
+            ("types", type_aliases),
+            ("fields", fields),
+        ),
+    )
+    def test_public_names(self, name, expected):
+        assert getattr(odin, name) is expected
+
+    def test_all_names_resolve(self):
+        for name in odin.__all__:
+            assert getattr(odin, name) is not None
+
+    def test_dir(self):
+        actual = dir(odin)
+
+        assert "Resource" in actual
+        assert "ListOf" in actual
+        assert "TYPE_CHECKING" not in actual
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            odin.Unknown  # noqa: B018
+
+    def test_import_is_lazy(self):
+        src_path = Path(odin.__file__).parent.parent
+        env = {**os.environ, "PYTHONPATH": src_path.as_posix()}
+        result = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                "import sys, odin; print('odin.resources' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.strip() == "False"
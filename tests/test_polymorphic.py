@@ -1,10 +1,14 @@
 """
 Tests of polymorphic behaviours
 """
+from unittest import mock
+
 import pytest
 
 import odin
-from odin.resources import create_resource_from_dict
+from odin import registration
+from odin.exceptions import ResourceException
+from odin.resources import _build_type_dispatch, create_resource_from_dict
 from odin.utils import getmeta
 
 
@@ -58,3 +62,60 @@ def test_name_space_is_inherited(resource):
     actual = getmeta(resource).name_space
 
     assert actual == expected
+
+
+class TestTypeDispatch:
+    def test_names_resolve_without_checking_candidates(self):
+        with mock.patch("odin.resources._resolve_type_from_candidates") as resolve_type:
+            for type_name, expected in (
+                ("au.com.example.abstracts.ResourceA", ResourceA),
+                ("ResourceB", ResourceB),
+                ("tests.test_polymorphic.ResourceB", ResourceB),
+            ):
+                actual = create_resource_from_dict(
+                    {"type": type_name}, AbstractResource, full_clean=False
+                )
+                assert isinstance(actual, expected)
+
+        resolve_type.assert_not_called()
+
+    def test_dispatch_for_list_of_resources(self):
+        dispatch = registration.get_type_dispatch(
+            (ResourceA, ResourceB), _build_type_dispatch
+        )
+
+        assert dispatch.type_field == "type"
+        assert dispatch.types[None] is ResourceA
+        assert dispatch.types["ResourceB"] is ResourceB
+
+    def test_unknown_names_are_checked(self):
+        actual = create_resource_from_dict(
+            {"type": "AU.COM.EXAMPLE.ABSTRACTS.RESOURCEA"},
+            AbstractResource,
+            full_clean=False,
+        )
+
+        assert isinstance(actual, ResourceA)
+
+        with pytest.raises(ResourceException):
+            create_resource_from_dict(
+                {"type": "ResourceZ"}, AbstractResource, full_clean=False
+            )
+
+    def test_registration_invalidates_dispatch(self):
+        create_resource_from_dict(
+            {"type": "ResourceA"}, AbstractResource, full_clean=False
+        )
+
+        class ResourceC(AbstractResource):
+            pass
+
+        actual = create_resource_from_dict(
+            {"type": "ResourceC"}, AbstractResource, full_clean=False
+        )
+
+        assert isinstance(actual, ResourceC)
+        dispatch = registration.get_type_dispatch(
+            AbstractResource, _build_type_dispatch
+        )
+        assert dispatch.types["ResourceC"] is ResourceC
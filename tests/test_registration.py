@@ -0,0 +1,168 @@
+import pytest
+
+import odin
+from odin import registration
+from odin.mapping import ResourceFieldResolver
+
+
+class Animal(odin.Resource):
+    class Meta:
+        namespace = "tests.registration"
+        abstract = True
+
+    name = odin.StringField()
+
+
+class Dog(Animal):
+    class Meta:
+        namespace = "tests.registration"
+
+
+class Puppy(Dog):
+    class Meta:
+        namespace = "tests.registration"
+        name = "YoungDog"
+
+
+class DogToPuppy(odin.Mapping):
+    from_obj = Dog
+    to_obj = Puppy
+
+
+class TestGetResource:
+    def test_exact_name(self):
+        assert registration.get_resource("tests.registration.Dog") is Dog
+
+    def test_case_insensitive(self):
+        assert registration.get_resource("TESTS.REGISTRATION.DOG") is Dog
+        # Cached exact name lookup
+        assert registration.get_resource("TESTS.REGISTRATION.DOG") is Dog
+
+    def test_class_name(self):
+        assert registration.get_resource("tests.registration.YoungDog") is Puppy
+        assert registration.get_resource("tests.test_registration.Puppy") is Puppy
+
+    def test_unknown(self):
+        assert registration.get_resource("tests.registration.Cat") is None
+
+
+class TestGetChildResources:
+    def test_children_indexed_by_type(self):
+        assert registration.get_child_resources(Animal) == {Dog, Puppy}
+        assert registration.get_child_resources(Dog) == {Dog, Puppy}
+        assert registration.get_child_resources(Puppy) == {Puppy}
+
+    def test_unregistered_type(self):
+        assert registration.get_child_resources(int) == set()
+
+    def test_replaced_resource_is_removed(self):
+        class Cat(Animal):
+            class Meta:
+                namespace = "tests.registration.replaced"
+
+        class Lion(Animal):
+            class Meta:
+                namespace = "tests.registration.replaced"
+
+        cache = registration.ResourceCache()
+        assert cache.get_resource("Tests.Registration.Replaced.Cat") is Cat
+
+        # Rebind all names of Cat
+        cache._add_resource("tests.registration.replaced.Cat", Lion)
+        cache._add_resource("tests.test_registration.Cat", Lion)
+
+        assert cache.get_resource("Tests.Registration.Replaced.Cat") is Lion
+        assert Lion in registration.get_child_resources(Animal)
+        assert Cat not in registration.get_child_resources(Animal)
+
+
+class TestGetMapping:
+    def test_registered_mapping(self):
+        assert registration.get_mapping(Dog, Puppy) is DogToPuppy
+
+    def test_unknown_mapping(self):
+        with pytest.raises(KeyError):
+            registration.get_mapping(Puppy, Dog)
+
+    def test_reregistered_mapping(self):
+        class OtherDogToPuppy(odin.Mapping):
+            from_obj = Dog
+            to_obj = Puppy
+
+        try:
+            assert registration.get_mapping(Dog, Puppy) is OtherDogToPuppy
+        finally:
+            registration.register_mapping(DogToPuppy)
+
+        assert registration.get_mapping(Dog, Puppy) is DogToPuppy
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class BaseResolver(ResourceFieldResolver):
+    def get_field_dict(self):
+        return {}
+
+
+class TestGetFieldResolver:
+    def test_resolved_along_mro_and_cached(self):
+        registration.register_field_resolver(BaseResolver, Base)
+
+        resolver = registration.get_field_resolver(Derived)
+
+        assert isinstance(resolver, BaseResolver)
+        assert resolver.obj is Derived
+        assert registration.get_field_resolver(Derived) is resolver
+
+    def test_most_specific_resolver_is_used(self):
+        class DerivedResolver(BaseResolver):
+            pass
+
+        registration.register_field_resolver(BaseResolver, Base)
+        registration.get_field_resolver(Derived)
+        registration.register_field_resolver(DerivedResolver, Derived)
+
+        assert isinstance(registration.get_field_resolver(Derived), DerivedResolver)
+        assert type(registration.get_field_resolver(Base)) is BaseResolver
+
+    def test_resource_resolver(self):
+        resolver = registration.get_field_resolver(Dog)
+
+        assert isinstance(resolver, ResourceFieldResolver)
+
+    def test_unknown_type(self):
+        with pytest.raises(KeyError):
+            registration.get_field_resolver(int)
+
+
+class CustomValidationError(Exception):
+    pass
+
+
+def custom_validator(value):
+    if value == "custom":
+        raise CustomValidationError
+
+
+class TestValidationErrorHandlers:
+    def test_table_is_rebuilt_when_a_handler_is_registered(self):
+        field = odin.StringField(validators=[custom_validator])
+        table = registration.get_validation_error_table()
+
+        # Compile the field before the handler is registered
+        field.clean("valid")
+        registration.register_validation_error_handler(
+            CustomValidationError,
+            lambda e, f, errors: errors.append("Custom error"),
+        )
+
+        assert registration.get_validation_error_table() is table
+        assert CustomValidationError in registration.get_validation_error_list()
+        with pytest.raises(odin.exceptions.ValidationError, match="Custom error"):
+            field.clean("custom")
@@ -1,10 +1,16 @@
+import copy
+from unittest import mock
+
 import pytest
 
 import odin
-from odin.exceptions import ResourceDefError, ValidationError
+from odin import compiler, exceptions, resources
+from odin.codecs import dict_codec
+from odin.exceptions import FrozenResourceError, ResourceDefError, ValidationError
 from odin.fields import NotProvided
 from odin.resources import (
     Resource,
+    ResourceBase,
     ResourceOptions,
     build_object_graph,
     create_resource_from_dict,
@@ -18,7 +24,7 @@ from .resources import (
     Library,
     Subscriber,
     AltBook,
-    LibraryBook
+    LibraryBook,
 )
 
 
@@ -256,6 +262,7 @@ class TestMetaOptions:
 
         assert actual is False
 
+
 class TestConstructionMethods:
     def test_build_object_graph_empty_dict_no_clean(self):
         book = build_object_graph({}, Book, full_clean=False)
@@ -432,3 +439,1122 @@ class TestConstructionMethods:
 
         assert book.isbn == "123456"
         assert book.title == "Foo"
+
+
+class GeneratedInitResource(odin.Resource):
+    name = odin.StringField()
+    tags = odin.ListField()
+    count = odin.IntegerField(default=42)
+
+
+class GenericInitResource(GeneratedInitResource):
+    class Meta:
+        generate_init = False
+
+    extra = odin.StringField(null=True)
+
+
+class CustomInitResource(GeneratedInitResource):
+    extra = odin.StringField(null=True)
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("extra", "custom")
+        GeneratedInitResource.__init__(self, *args, **kwargs)
+
+
+class TestGeneratedInit:
+    def test_generated_init_is_installed(self):
+        assert compiler.is_generated(GeneratedInitResource.__init__)
+
+    def test_opt_out_uses_generic_init(self):
+        assert GenericInitResource.__init__ is ResourceBase.__init__
+
+        actual = GenericInitResource(name="Foo", extra="Bar")
+
+        assert actual.name == "Foo"
+        assert actual.count == 42
+        assert actual.extra == "Bar"
+
+    def test_custom_init_is_retained(self):
+        actual = CustomInitResource(name="Foo")
+
+        assert not compiler.is_generated(CustomInitResource.__init__)
+        assert actual.name == "Foo"
+        assert actual.tags == []
+        assert actual.extra == "custom"
+
+    def test_defaults(self):
+        a = GeneratedInitResource()
+        b = GeneratedInitResource()
+
+        assert a.name is None
+        assert a.count == 42
+        assert a.tags == []
+        assert a.tags is not b.tags
+
+    def test_positional_and_keyword_values(self):
+        actual = GeneratedInitResource("Foo", count=1)
+
+        assert actual.name == "Foo"
+        assert actual.count == 1
+
+    def test_excess_positional_arguments(self):
+        with pytest.raises(
+            TypeError,
+            match="This resource takes 3 positional arguments but 4 where given.",
+        ):
+            GeneratedInitResource("Foo", [], 1, 2)
+
+    def test_invalid_keyword_argument(self):
+        with pytest.raises(TypeError, match="'age' is an invalid keyword argument"):
+            GeneratedInitResource(age=42)
+
+    def test_fields_named_as_builtins(self):
+        class BuiltinNames(odin.Resource):
+            next = odin.IntegerField(null=True)
+            len = odin.IntegerField(null=True)
+            iter = odin.IntegerField(null=True)
+            TypeError = odin.IntegerField(null=True)
+
+        actual = BuiltinNames(1, 2, iter=3)
+
+        assert (actual.next, actual.len, actual.iter, actual.TypeError) == (
+            1,
+            2,
+            3,
+            None,
+        )
+        with pytest.raises(TypeError, match="'bad' is an invalid keyword argument"):
+            BuiltinNames(bad=1)
+        with pytest.raises(
+            TypeError,
+            match="This resource takes 4 positional arguments but 5 where given.",
+        ):
+            BuiltinNames(None, 1, 2, 3, 4)
+
+    def test_init_is_generated_on_first_use(self):
+        class DeferredResource(odin.Resource):
+            name = odin.StringField()
+
+        init = DeferredResource.__dict__["__init__"]
+        assert compiler.is_generated(init)
+        assert not hasattr(init, "__odin_source__")
+
+        actual = DeferredResource("Foo")
+
+        assert actual.name == "Foo"
+        assert hasattr(DeferredResource.__dict__["__init__"], "__odin_source__")
+
+    def test_deferred_init_of_parent_resource(self):
+        class ParentResource(odin.Resource):
+            name = odin.StringField()
+
+        class ChildResource(ParentResource):
+            def __init__(self, *args, **kwargs):
+                ParentResource.__init__(self, *args, **kwargs)
+
+            size = odin.IntegerField(default=1)
+
+        actual = ChildResource(name="Foo", size=2)
+
+        assert actual.name == "Foo"
+        assert actual.size == 2
+
+    def test_init_is_regenerated_when_a_field_is_added(self):
+        class DynamicResource(odin.Resource):
+            name = odin.StringField()
+
+        field = odin.IntegerField(default=1)
+        field.contribute_to_class(DynamicResource, "size")
+
+        actual = DynamicResource("Foo")
+
+        assert actual.size == 1
+
+
+class SlottedResource(odin.Resource):
+    class Meta:
+        slots = True
+
+    name = odin.StringField()
+    count = odin.IntegerField(default=1)
+    constant = odin.ConstantField("const")
+
+
+class InheritedSlottedResource(SlottedResource):
+    __slots__ = ("extras",)
+
+    title = odin.StringField(null=True)
+
+    def extra_attrs(self, attrs):
+        self.extras = attrs
+
+
+class TestSlots:
+    def test_slots_are_generated_from_fields(self):
+        assert SlottedResource.__slots__ == ("name", "count", "_lazy_values")
+        assert getmeta(SlottedResource).slots is True
+
+    def test_instances_do_not_have_a_dict(self):
+        target = SlottedResource(name="Foo")
+
+        assert not hasattr(target, "__dict__")
+        assert target.name == "Foo"
+        assert target.count == 1
+
+    def test_unknown_attributes_cannot_be_assigned(self):
+        target = SlottedResource(name="Foo")
+
+        with pytest.raises(AttributeError):
+            target.unknown = "Bar"
+
+    def test_virtual_fields(self):
+        target = SlottedResource(name="Foo")
+
+        assert target.constant == "const"
+        assert target.to_dict() == {"name": "Foo", "count": 1, "constant": "const"}
+
+    def test_slots_option_is_inherited(self):
+        target = InheritedSlottedResource(title="Foo", name="Bar")
+
+        assert getmeta(InheritedSlottedResource).slots is True
+        assert InheritedSlottedResource.__slots__ == ("title", "extras")
+        assert not hasattr(target, "__dict__")
+        assert (target.title, target.name, target.count) == ("Foo", "Bar", 1)
+
+    def test_extra_attrs_using_additional_slots(self):
+        target = create_resource_from_dict(
+            {"name": "Foo", "count": 2, "other": "value"}, InheritedSlottedResource
+        )
+
+        assert target.extras == {"other": "value"}
+
+    def test_resources_do_not_use_slots_by_default(self):
+        assert getmeta(Author).slots is False
+        assert hasattr(Author(), "__dict__")
+
+
+class TrackedChild(odin.Resource):
+    class Meta:
+        track_changes = True
+
+    name = odin.StringField()
+    rating = odin.IntegerField(min_value=1, max_value=5)
+
+    def clean_name(self, value):
+        self.clean_name_calls = getattr(self, "clean_name_calls", 0) + 1
+        return value
+
+
+class TrackedParent(odin.Resource):
+    class Meta:
+        track_changes = True
+
+    title = odin.StringField()
+    child = odin.DictAs(TrackedChild)
+    children = odin.ListOf(TrackedChild)
+
+
+class SlottedTrackedChild(TrackedChild):
+    class Meta:
+        slots = True
+
+
+class UntrackedChild(TrackedChild):
+    class Meta:
+        track_changes = False
+
+
+class TestTrackChanges:
+    def test_option_is_inherited(self):
+        assert getmeta(TrackedChild).track_changes is True
+        assert getmeta(SlottedTrackedChild).track_changes is True
+        assert getmeta(UntrackedChild).track_changes is False
+        assert getmeta(Author).track_changes is False
+
+    def test_slotted_resources_store_changes_in_a_slot(self):
+        assert "_dirty_fields" in SlottedTrackedChild.__slots__
+
+        target = SlottedTrackedChild(name="Foo", rating=1)
+        target.full_clean()
+        target.rating = 2
+
+        assert target._dirty_fields == {"rating"}
+
+    def test_only_changed_fields_are_revalidated(self):
+        target = TrackedChild(name="Foo", rating=1)
+        target.full_clean()
+        assert target.clean_name_calls == 1
+
+        target.rating = 6
+        with pytest.raises(ValidationError) as ex:
+            target.full_clean()
+
+        assert ex.value.error_messages == {
+            "rating": ["Ensure this value is less than or equal to 5."]
+        }
+        assert target.clean_name_calls == 1
+
+        target.name = "Bar"
+        target.rating = 5
+        target.full_clean()
+
+        assert target.clean_name_calls == 2
+
+    def test_unchanged_resource_is_not_revalidated(self):
+        target = TrackedChild(name="Foo", rating=1)
+        target.full_clean()
+
+        target.full_clean()
+        target.clean_fields()
+
+        assert target.clean_name_calls == 1
+
+    def test_force_revalidates_all_fields(self):
+        target = TrackedChild(name="Foo", rating=1)
+        target.full_clean()
+
+        target.full_clean(force=True)
+
+        assert target.clean_name_calls == 2
+
+    def test_changes_are_retained_if_clean_fails(self):
+        target = TrackedChild(name="Foo", rating=1)
+        target.full_clean()
+
+        target.rating = 6
+        with pytest.raises(ValidationError):
+            target.full_clean()
+
+        # Still invalid
+        with pytest.raises(ValidationError):
+            target.full_clean()
+
+    def test_changes_are_retained_if_fields_are_excluded(self):
+        target = TrackedChild(name="Foo", rating=6)
+
+        target.full_clean(exclude=["rating"])
+
+        with pytest.raises(ValidationError):
+            target.full_clean()
+
+    def test_unchanged_children_are_not_revalidated(self):
+        child = TrackedChild(name="Foo", rating=1)
+        item = TrackedChild(name="Bar", rating=1)
+        target = TrackedParent(title="Eek", child=child, children=[item])
+        target.full_clean()
+
+        target.title = "Ook"
+        target.full_clean()
+
+        assert (child.clean_name_calls, item.clean_name_calls) == (1, 1)
+
+    def test_children_modified_in_place_are_revalidated(self):
+        child = TrackedChild(name="Foo", rating=1)
+        target = TrackedParent(title="Eek", child=child, children=[])
+        target.full_clean()
+
+        child.rating = 6
+        target.children.append(TrackedChild(name="Bar", rating=0))
+        with pytest.raises(ValidationError) as ex:
+            target.full_clean()
+
+        assert set(ex.value.error_messages) == {"child", "children"}
+
+    def test_force_revalidates_children(self):
+        child = TrackedChild(name="Foo", rating=1)
+        target = TrackedParent(title="Eek", child=child, children=[])
+        target.full_clean()
+
+        target.full_clean(force=True)
+
+        assert child.clean_name_calls == 2
+
+    def test_opting_out_of_tracking(self):
+        target = UntrackedChild(name="Foo", rating=1)
+        target.full_clean()
+        target.full_clean()
+
+        assert target.clean_name_calls == 2
+        assert target._dirty_fields is None
+
+
+class LazyChild(odin.Resource):
+    name = odin.StringField()
+    rating = odin.IntegerField(min_value=1, max_value=5)
+
+
+class LazyParent(odin.Resource):
+    title = odin.StringField()
+    count = odin.IntegerField(default=1, use_default_if_not_provided=True)
+    child = odin.DictAs(LazyChild, null=True)
+    children = odin.ListOf(LazyChild)
+
+    def extra_attrs(self, attrs):
+        self.extras = attrs
+
+
+class SlottedLazyChild(odin.Resource):
+    class Meta:
+        slots = True
+
+    name = odin.StringField()
+    rating = odin.IntegerField()
+
+
+class TestLazyResources:
+    def test_values_are_converted_on_access(self):
+        target = build_object_graph(
+            {"title": "Foo", "children": [{"name": "Bar", "rating": "2"}]},
+            LazyParent,
+            lazy=True,
+        )
+
+        assert set(target._lazy_values) == {"title", "children"}
+        assert target.count == 1
+        assert target.child is None
+
+        child = target.children[0]
+
+        assert set(target._lazy_values) == {"title"}
+        assert set(child._lazy_values) == {"name", "rating"}
+        assert child.rating == 2
+
+    def test_extra_attrs(self):
+        target = build_object_graph({"title": "Foo", "other": 1}, LazyParent, lazy=True)
+
+        assert target.extras == {"other": 1}
+
+    def test_default_to_not_supplied(self):
+        target = build_object_graph(
+            {"title": "Foo"}, LazyParent, default_to_not_supplied=True, lazy=True
+        )
+
+        assert target.count is NotProvided
+
+    def test_full_clean_is_deferred(self):
+        target = build_object_graph(
+            {"title": "Foo", "count": "abc", "children": []}, LazyParent, lazy=True
+        )
+
+        assert target.count == "abc"
+        with pytest.raises(ValidationError) as ex:
+            target.full_clean()
+
+        assert ex.value.error_messages == {"count": ["'abc' value must be a integer."]}
+
+    def test_full_clean_converts_all_values(self):
+        target = build_object_graph(
+            {
+                "title": "Foo",
+                "count": "3",
+                "child": {"name": "Bar", "rating": "2"},
+                "children": [],
+            },
+            LazyParent,
+            lazy=True,
+        )
+
+        target.full_clean()
+
+        assert not target._lazy_values
+        assert target.count == 3
+        assert target.child.rating == 2
+
+    def test_assigned_values_are_not_replaced(self):
+        target = build_object_graph(
+            {"title": "Foo", "count": "3", "children": []}, LazyParent, lazy=True
+        )
+
+        target.count = 5
+        target.full_clean()
+
+        assert target.count == 5
+
+    def test_errors_match_eager_mode(self):
+        data = {
+            "title": "Foo",
+            "count": "abc",
+            "child": {"name": "Bar", "rating": 7},
+            "children": [{"name": "Eek", "rating": "x"}],
+        }
+
+        eager = build_object_graph(data, LazyParent, full_clean=False)
+        with pytest.raises(ValidationError) as eager_errors:
+            eager.full_clean()
+
+        target = build_object_graph(data, LazyParent, lazy=True)
+        with pytest.raises(ValidationError) as lazy_errors:
+            target.full_clean()
+
+        assert lazy_errors.value.error_messages == eager_errors.value.error_messages
+        assert lazy_errors.value.error_messages == {
+            "count": ["'abc' value must be a integer."],
+            "child": [{"rating": ["Ensure this value is less than or equal to 5."]}],
+            "children": [{"0": {"rating": ["'x' value must be a integer."]}}],
+        }
+
+    def test_to_dict_converts_values(self):
+        target = build_object_graph(
+            {"title": "Foo", "count": "3"}, LazyParent, lazy=True
+        )
+
+        assert target.to_dict() == {
+            "title": "Foo",
+            "count": 3,
+            "child": None,
+            "children": None,
+        }
+
+    def test_slotted_resources(self):
+        target = build_object_graph(
+            {"name": "Foo", "rating": "3"}, SlottedLazyChild, lazy=True
+        )
+
+        assert target.rating == 3
+        assert target.name == "Foo"
+        with pytest.raises(AttributeError):
+            target.unknown  # noqa: B018
+
+    def test_custom_init_is_created_eagerly(self):
+        target = build_object_graph(
+            {"name": "Foo"}, CustomInitResource, full_clean=False, lazy=True
+        )
+
+        assert target._lazy_values is None
+
+
+class FrozenAuthor(odin.Resource):
+    class Meta:
+        frozen = True
+
+    name = odin.StringField()
+    country = odin.StringField(null=True)
+
+
+class FrozenBook(odin.Resource):
+    class Meta:
+        frozen = True
+        key_field_name = "isbn"
+        slots = True
+
+    isbn = odin.StringField()
+    title = odin.StringField()
+    num_pages = odin.IntegerField()
+    author = odin.DictAs(FrozenAuthor, null=True)
+
+    def clean_title(self, value):
+        return value.strip()
+
+
+class FrozenTagged(odin.Resource):
+    class Meta:
+        frozen = True
+
+    name = odin.StringField()
+    tags = odin.TypedListField(odin.StringField())
+
+
+class TestFrozen:
+    def test_option_is_inherited(self):
+        class InheritedFrozenAuthor(FrozenAuthor):
+            pass
+
+        assert getmeta(InheritedFrozenAuthor).frozen is True
+        assert getmeta(Author).frozen is False
+
+    def test_frozen_cannot_be_disabled_by_a_sub_class(self):
+        with pytest.raises(ResourceDefError):
+
+            class UnfrozenAuthor(FrozenAuthor):
+                class Meta:
+                    frozen = False
+
+    def test_attributes_cannot_be_assigned(self):
+        target = FrozenAuthor(name="Iain M. Banks")
+
+        with pytest.raises(FrozenResourceError):
+            target.name = "Foo"
+        with pytest.raises(FrozenResourceError):
+            del target.name
+
+        assert target.name == "Iain M. Banks"
+
+    def test_generic_init(self):
+        class GenericFrozenAuthor(odin.Resource):
+            class Meta:
+                frozen = True
+                generate_init = False
+
+            name = odin.StringField()
+
+        target = GenericFrozenAuthor("Foo")
+
+        assert target.name == "Foo"
+        with pytest.raises(FrozenResourceError):
+            target.name = "Bar"
+
+    def test_create_from_dict_and_clean(self):
+        target = build_object_graph(
+            {"isbn": "123", "title": " Foo ", "num_pages": "42"}, FrozenBook
+        )
+
+        assert target.title == "Foo"
+        assert target.num_pages == 42
+
+    def test_equality_and_hash_use_key_fields(self):
+        a = FrozenBook("123", "Foo", 42)
+        b = FrozenBook("123", "Bar", 12)
+        c = FrozenBook("456", "Foo", 42)
+
+        assert a == b
+        assert a != c
+        assert hash(a) == hash(b)
+        assert len({a, b, c}) == 2
+
+    def test_equality_and_hash_use_all_fields_without_key_fields(self):
+        a = FrozenAuthor(name="Foo")
+
+        assert a == FrozenAuthor(name="Foo")
+        assert a != FrozenAuthor(name="Foo", country="NZ")
+        assert a != Author(name="Foo")
+        assert hash(a) == hash(FrozenAuthor(name="Foo"))
+
+    def test_hash_is_cached(self):
+        target = FrozenBook("123", "Foo", 42)
+
+        assert target._cached_hash is None
+        value = hash(target)
+        assert target._cached_hash == value
+
+    def test_copies_are_not_made(self):
+        target = FrozenAuthor(name="Foo")
+
+        assert copy.copy(target) is target
+        assert copy.deepcopy(target) is target
+        assert target.clone() is target
+
+    @pytest.mark.parametrize("make_copy", (copy.deepcopy, resources.ResourceBase.clone))
+    def test_copies_of_mutable_values_are_made(self, make_copy):
+        target = FrozenTagged(name="Foo", tags=["x"])
+
+        actual = make_copy(target)
+        actual.tags.append("y")
+
+        assert actual is not target
+        assert actual == FrozenTagged(name="Foo", tags=["x", "y"])
+        assert target.tags == ["x"]
+
+    def test_deepcopy_shares_immutable_children(self):
+        author = FrozenAuthor(name="Foo")
+        target = FrozenBook("123", "Foo", 42, author)
+
+        actual = copy.deepcopy(target)
+
+        assert actual is not target
+        assert actual == target
+        assert actual.author is author
+        with pytest.raises(FrozenResourceError):
+            actual.title = "Bar"
+
+    def test_hash_without_key_fields_and_mutable_values(self):
+        a = FrozenTagged(name="Foo", tags=["x"])
+        b = FrozenTagged(name="Foo", tags=["x"])
+
+        assert hash(a) == hash(b)
+        assert a != FrozenTagged(name="Foo", tags=["y"])
+        assert len({a, b, FrozenTagged(name="Foo", tags=["y"])}) == 2
+
+    def test_full_clean_does_not_change_the_hash(self):
+        class FrozenNumber(odin.Resource):
+            class Meta:
+                frozen = True
+                key_field_names = ("n",)
+
+            n = odin.IntegerField()
+
+        target = FrozenNumber(n="5")
+        value = hash(target)
+        lookup = {target}
+
+        with pytest.raises(ValidationError) as result:
+            target.full_clean()
+
+        assert list(result.value.error_messages) == ["n"]
+        assert target.n == "5"
+        assert hash(target) == value
+        assert target in lookup
+
+    def test_full_clean_does_not_normalise_values(self):
+        target = FrozenBook("123", " Foo ", 42)
+
+        with pytest.raises(ValidationError) as result:
+            target.full_clean()
+
+        assert list(result.value.error_messages) == ["title"]
+        assert target.title == " Foo "
+
+    def test_full_clean_of_clean_values(self):
+        target = FrozenBook("123", "Foo", 42, FrozenAuthor(name="Foo"))
+        hash(target)
+
+        target.full_clean()
+
+    def test_successful_full_clean_is_remembered(self):
+        author = FrozenAuthor(name="Foo")
+        target = FrozenBook("123", "Foo", 42, author)
+        target.full_clean()
+
+        assert target._dirty_fields == set()
+        assert author._dirty_fields == set()
+
+        with mock.patch.object(FrozenBook, "clean") as book_clean:
+            target.full_clean()
+        book_clean.assert_not_called()
+
+        # Validated children are not revalidated
+        with mock.patch.object(FrozenAuthor, "clean") as author_clean:
+            FrozenBook("456", "Bar", 12, author).full_clean()
+        author_clean.assert_not_called()
+
+    def test_failed_full_clean_is_not_remembered(self):
+        target = FrozenBook("123", "Foo", None)
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                target.full_clean()
+
+    def test_force_full_clean(self):
+        target = FrozenAuthor(name="Foo")
+        target.full_clean()
+
+        with mock.patch.object(FrozenAuthor, "clean") as clean:
+            target.full_clean(force=True)
+
+        clean.assert_called_once()
+
+
+class CloneChild(odin.Resource):
+    name = odin.StringField()
+
+
+class CloneResource(odin.Resource):
+    title = odin.StringField()
+    count = odin.IntegerField(default=1)
+    tags = odin.TypedListField(odin.StringField())
+    child = odin.DictAs(CloneChild, null=True)
+    children = odin.ListOf(CloneChild)
+    mapping = odin.DictOf(CloneChild, null=True)
+
+    def extra_attrs(self, attrs):
+        self.extras = attrs
+
+
+class SlottedCloneResource(odin.Resource):
+    class Meta:
+        slots = True
+
+    __slots__ = ("extras",)
+
+    title = odin.StringField()
+    children = odin.ListOf(CloneChild)
+
+
+class TestClone:
+    @pytest.fixture
+    def target(self):
+        return create_resource_from_dict(
+            {
+                "title": "Foo",
+                "count": 2,
+                "tags": ["a", "b"],
+                "child": {"name": "Eek"},
+                "children": [{"name": "Ook"}],
+                "mapping": {"a": {"name": "Bar"}},
+                "other": 1,
+            },
+            CloneResource,
+        )
+
+    def test_deep_clone(self, target):
+        actual = target.clone()
+
+        assert actual is not target
+        assert dict_codec.dump(actual) == dict_codec.dump(target)
+        assert actual.title is target.title
+        assert actual.tags is not target.tags
+        assert actual.child is not target.child
+        assert actual.children is not target.children
+        assert actual.children[0] is not target.children[0]
+        assert actual.mapping["a"] is not target.mapping["a"]
+
+    def test_shallow_clone(self, target):
+        actual = target.clone(deep=False)
+
+        assert actual is not target
+        assert actual.children is target.children
+        assert actual.child is target.child
+
+    def test_extra_attributes_are_retained(self, target):
+        actual = target.clone()
+
+        assert actual.extras == {"other": 1}
+
+    def test_fields(self, target):
+        actual = target.clone(fields=["title", "children"])
+
+        assert actual.title == "Foo"
+        assert actual.children[0].name == "Ook"
+        assert actual.count == 1
+        assert actual.child is None
+
+    def test_slotted_resources(self):
+        target = SlottedCloneResource("Foo", [CloneChild("Bar")])
+        target.extras = {"a": 1}
+
+        actual = target.clone()
+
+        assert actual.title == "Foo"
+        assert actual.children[0].name == "Bar"
+        assert actual.children[0] is not target.children[0]
+        assert actual.extras == {"a": 1}
+
+    def test_lazy_resources(self):
+        target = build_object_graph(
+            {"title": "Foo", "children": [{"name": "Bar"}]}, CloneResource, lazy=True
+        )
+
+        actual = target.clone()
+
+        assert actual._lazy_values is None
+        assert actual.children[0].name == "Bar"
+
+    def test_tracked_changes_are_copied(self):
+        target = TrackedChild(name="Foo", rating=1)
+        target.full_clean()
+
+        actual = target.clone()
+        actual.rating = 2
+
+        assert target._dirty_fields == set()
+        assert actual._dirty_fields == {"rating"}
+
+    def test_frozen_resources_are_not_copied(self):
+        target = FrozenAuthor(name="Foo")
+
+        assert target.clone() is target
+        assert target.clone(fields=["name"]) == target
+        assert target.clone(fields=["name"]) is not target
+
+    def test_proxy(self):
+        book = Book(title="Foo", num_pages=42)
+        target = BookProxy.proxy(book)
+
+        actual = target.clone()
+
+        assert isinstance(actual, BookProxy)
+        assert actual.get_shadow() is not book
+        assert actual.title == "Foo"
+
+
+class TestCreateResourcesFromIter:
+    def test_rows_are_created(self):
+        rows = [("Foo", "1", "2.5"), ("Bar", 2, 3), ["Eek"]]
+
+        actual = resources.create_resources_from_iter(rows, BatchResource)
+
+        assert [(r.name, r.count, r.rating) for r in actual] == [
+            ("Foo", 1, 2.5),
+            ("Bar", 2, 3.0),
+            ("Eek", 42, None),
+        ]
+
+    def test_extra_values(self):
+        (actual,) = resources.create_resources_from_iter(
+            [("Foo", 1, 2.5, "extra")], BatchResource
+        )
+
+        assert actual.extras == ["extra"]
+
+    def test_default_to_not_provided(self):
+        (actual,) = resources.create_resources_from_iter(
+            [("Foo",)], BatchResource, full_clean=False, default_to_not_provided=True
+        )
+
+        assert actual.count is NotProvided
+
+    def test_error_is_for_first_invalid_row(self):
+        rows = [("Foo", 1, 1.0), ("Bar", "x", 1.0), ("Eek", "y", 1.0)]
+
+        with pytest.raises(ValidationError) as result:
+            resources.create_resources_from_iter(rows, BatchResource)
+
+        with pytest.raises(ValidationError) as expected:
+            resources.create_resource_from_iter(rows[1], BatchResource)
+
+        assert result.value.error_messages == expected.value.error_messages
+
+    def test_full_clean_errors(self):
+        with pytest.raises(ValidationError, match="count"):
+            resources.create_resources_from_iter([("Foo", -1, 1.0)], BatchResource)
+
+
+class BatchResource(odin.Resource):
+    name = odin.StringField()
+    count = odin.IntegerField(default=42, use_default_if_not_provided=True, min_value=0)
+    rating = odin.FloatField(null=True)
+
+    def extra_attrs(self, attrs):
+        self.extras = attrs
+
+
+class LimitItem(odin.Resource):
+    name = odin.StringField(max_length=3)
+    count = odin.IntegerField(min_value=0)
+    tags = odin.TypedListField(odin.IntegerField())
+
+
+class LimitOrder(odin.Resource):
+    ref = odin.StringField(max_length=2)
+    items = odin.ListOf(LimitItem)
+    totals = odin.DictOf(LimitItem, null=True)
+
+
+LIMIT_DATA = {
+    "ref": "toolong",
+    "items": [
+        {"name": "abcdef", "count": -1, "tags": [1, "x", "y"]},
+        {"name": "ok", "count": 1, "tags": []},
+        {"name": "abcdef", "count": "z", "tags": ["q"]},
+    ],
+}
+
+
+def _is_partial(partial, full) -> bool:
+    """Every path of the partial errors exists in the full errors."""
+    if isinstance(partial, dict):
+        return all(k in full and _is_partial(v, full[k]) for k, v in partial.items())
+    if partial and isinstance(partial[0], dict):
+        return _is_partial(partial[0], full[0])
+    return partial == full
+
+
+class TestMaxErrors:
+    @pytest.fixture
+    def all_errors(self):
+        with pytest.raises(ValidationError) as result:
+            build_object_graph(LIMIT_DATA, LimitOrder)
+        return result.value.error_messages
+
+    def test_fail_fast(self):
+        with pytest.raises(ValidationError) as result:
+            build_object_graph(LIMIT_DATA, LimitOrder, max_errors=1)
+
+        assert result.value.error_messages == {
+            "ref": ["Ensure this values length is at most 2 (it has 7)."]
+        }
+
+    @pytest.mark.parametrize("max_errors", range(1, 9))
+    def test_partial_errors_keep_paths(self, all_errors, max_errors):
+        with pytest.raises(ValidationError) as result:
+            build_object_graph(LIMIT_DATA, LimitOrder, max_errors=max_errors)
+
+        actual = result.value.error_messages
+        assert exceptions.count_errors(actual) == max_errors
+        assert _is_partial(actual, all_errors)
+
+    def test_stops_within_typed_list(self):
+        with pytest.raises(ValidationError) as result:
+            build_object_graph(LIMIT_DATA, LimitOrder, max_errors=4)
+
+        assert result.value.error_messages["items"][0]["0"]["tags"] == [
+            {"1": ["'x' value must be a integer."]}
+        ]
+
+    def test_limit_above_error_count_collects_all(self, all_errors):
+        with pytest.raises(ValidationError) as result:
+            build_object_graph(LIMIT_DATA, LimitOrder, max_errors=100)
+
+        assert result.value.error_messages == all_errors
+
+    def test_full_clean(self, all_errors):
+        target = build_object_graph(LIMIT_DATA, LimitOrder, full_clean=False)
+
+        with pytest.raises(ValidationError) as result:
+            target.full_clean(max_errors=3)
+
+        actual = result.value.error_messages
+        assert exceptions.count_errors(actual) == 3
+        assert _is_partial(actual, all_errors)
+
+    def test_clean_fields_stops_validating(self):
+        class Recorded(odin.Resource):
+            first = odin.IntegerField()
+            second = odin.IntegerField()
+
+            def clean_second(self, value):
+                self.cleaned.append("second")
+                return value
+
+        target = Recorded(first="a", second=1)
+        target.cleaned = []
+
+        with pytest.raises(ValidationError):
+            target.clean_fields(max_errors=1)
+        assert target.cleaned == []
+
+        with pytest.raises(ValidationError):
+            target.clean_fields()
+        assert target.cleaned == ["second"]
+
+    def test_dict_of(self):
+        data = {
+            "ref": "ok",
+            "items": [],
+            "totals": {"a": {"name": "abcdef", "count": 1}, "b": {"count": -1}},
+        }
+
+        with pytest.raises(ValidationError) as result:
+            create_resource_from_dict(data, LimitOrder, max_errors=1)
+
+        assert result.value.error_messages == {
+            "totals": [
+                {"a": {"name": ["Ensure this values length is at most 3 (it has 6)."]}}
+            ]
+        }
+
+    def test_resource_clean_not_called_once_limit_reached(self):
+        class Checked(odin.Resource):
+            name = odin.StringField(max_length=1)
+
+            def clean(self):
+                raise ValidationError("Resource is invalid")
+
+        target = Checked(name="ab")
+
+        with pytest.raises(ValidationError) as limited:
+            target.full_clean(max_errors=1)
+        with pytest.raises(ValidationError) as unlimited:
+            target.full_clean(max_errors=2)
+
+        assert set(limited.value.error_messages) == {"name"}
+        assert set(unlimited.value.error_messages) == {
+            "name",
+            exceptions.NON_FIELD_ERRORS,
+        }
+
+    def test_invalid_max_errors(self):
+        with pytest.raises(ValueError, match="max_errors"):
+            build_object_graph(LIMIT_DATA, LimitOrder, max_errors=0)
+
+
+class CustomFullClean(odin.Resource):
+    name = odin.StringField()
+
+    def full_clean(self, *args, **kwargs):
+        odin.Resource.full_clean(self, *args, **kwargs)
+        if self.name == "bad":
+            raise ValidationError({"name": ["Custom check failed"]})
+
+
+class CustomFullCleanParent(odin.Resource):
+    children = odin.ListOf(CustomFullClean)
+
+
+class TestValidate:
+    def test_valid(self):
+        target = build_object_graph(LIMIT_DATA["items"][1], LimitItem)
+
+        actual = target.validate()
+
+        assert actual.is_valid
+        assert actual.value is target
+
+    def test_matches_full_clean(self):
+        target = build_object_graph(LIMIT_DATA, LimitOrder, full_clean=False)
+
+        with pytest.raises(ValidationError) as expected:
+            target.full_clean()
+        actual = target.validate()
+
+        assert not actual.is_valid
+        assert actual.value is None
+        assert actual.errors == expected.value.error_messages
+
+    def test_max_errors(self):
+        target = build_object_graph(LIMIT_DATA, LimitOrder, full_clean=False)
+
+        actual = target.validate(max_errors=1)
+
+        assert actual.errors == {
+            "ref": ["Ensure this values length is at most 2 (it has 7)."]
+        }
+
+    def test_resource_clean_errors(self):
+        target = Author(name="Bruce", country="Australia")
+
+        actual = target.validate()
+
+        assert actual.errors == {exceptions.NON_FIELD_ERRORS: ["No no no no"]}
+
+    def test_custom_full_clean_of_child_is_used(self):
+        target = CustomFullCleanParent(children=[CustomFullClean(name="bad")])
+
+        actual = target.validate()
+
+        assert actual.errors == {"children": [{"0": {"name": ["Custom check failed"]}}]}
+
+
+class TestTryBuild:
+    @pytest.mark.parametrize(
+        "data",
+        (
+            LIMIT_DATA,
+            LIMIT_DATA["items"],
+            {"ref": "ok", "items": [{"name": "a", "count": "x", "tags": []}]},
+            {"ref": "ok", "items": [None]},
+        ),
+    )
+    def test_matches_build_object_graph(self, data):
+        resource = LimitItem if isinstance(data, list) else LimitOrder
+        with pytest.raises(ValidationError) as expected:
+            build_object_graph(data, resource)
+
+        actual = resources.try_build(data, resource)
+
+        assert actual.errors == expected.value.error_messages
+
+    def test_valid(self):
+        actual = resources.try_build({"ref": "ok", "items": []}, LimitOrder)
+
+        assert actual.is_valid
+        assert actual.value.ref == "ok"
+        assert actual.unwrap() is actual.value
+
+    def test_list(self):
+        actual = resources.try_build(
+            [
+                {"name": "a", "count": 1, "tags": []},
+                {"name": "b", "count": 2, "tags": []},
+            ],
+            LimitItem,
+        )
+
+        assert [item.name for item in actual.value] == ["a", "b"]
+
+    def test_unknown_resource_type(self):
+        actual = resources.try_build({"$": "unknown.Resource"})
+
+        assert actual.errors == ["Resource 'unknown.Resource' is not registered."]
+
+    def test_max_errors(self):
+        actual = resources.try_build(LIMIT_DATA, LimitOrder, max_errors=2)
+
+        assert exceptions.count_errors(actual.errors) == 2
+
+    def test_dict_is_not_modified(self):
+        data = {"ref": "ok", "items": []}
+
+        resources.try_build(data, LimitOrder)
+
+        assert data == {"ref": "ok", "items": []}